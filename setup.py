@@ -22,6 +22,9 @@ extras_require = {
         "flask-cors>=4.0.0",
         "werkzeug>=2.3.0",
     ],
+    "fast": [
+        "orjson>=3.9.0",
+    ],
     "dev": [
         "pytest>=7.0.0",
         "pytest-cov>=4.0.0",
@@ -25,7 +25,6 @@ from .parameter_utils import (
     extract_parameter_from_response,
 )
 from .vibe_tests import VibeTestRunner, run_vibe_tests
-from .vibe_report import VibeTestReportGenerator
 from .skill_generator import (
     IncrementalSkillGenerator,
     SafeCodeExecutor,
@@ -34,6 +33,17 @@ from .skill_generator import (
     run_skill_generation,
 )
 
+
+def __getattr__(name):
+    # The report generator pulls in plotly, which is slow to import, so it is
+    # only loaded when first used
+    if name == "VibeTestReportGenerator":
+        from .vibe_report import VibeTestReportGenerator
+
+        return VibeTestReportGenerator
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
     "hello",
     "greet",
@@ -8,10 +8,15 @@ import logging
 import re
 import time
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple, Generator
+from typing import Any, Dict, List, Optional, Tuple, Generator
 
 from .ollama_client import OllamaClient
 
+try:
+    import orjson
+except ImportError:  # Optional speedup, see the "fast" extra
+    orjson = None
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -56,6 +61,16 @@ class OpenResult:
     compression_rounds: int = 0
 
 
+@dataclass
+class StructuredResult:
+    """Result from a JSON query constrained by Ollama's structured output"""
+
+    data: Any  # The parsed JSON value, or None if the response was not valid JSON
+    raw: str
+    context_compressed: bool = False
+    compression_rounds: int = 0
+
+
 @dataclass
 class FileWriteResult:
     """Result from a file write query"""
@@ -138,6 +153,17 @@ class ResponseParser:
 
         return "unknown", 0.3
 
+    @staticmethod
+    def parse_json(response: str) -> Any:
+        """Parse a JSON response, using orjson when it is installed.
+
+        Raises json.JSONDecodeError on malformed input either way, since
+        orjson's decode error subclasses it.
+        """
+        if orjson is not None:
+            return orjson.loads(response)
+        return json.loads(response)
+
     @staticmethod
     def clean_file_content(response: str) -> str:
         """Clean response for file content"""
@@ -311,6 +337,17 @@ Instructions:
 - Start immediately with the actual file content
 
 File content:""",
+        "structured": """Answer the following request with a single JSON value.
+
+Context: {context}
+
+Request: {prompt}
+
+Instructions:
+- Respond with ONLY valid JSON matching the requested structure
+- Do not include explanations, markdown, or code fences
+
+JSON:""",
     }
 
     def __init__(self, client: OllamaClient, model: str = "gemma3:4b"):
@@ -326,6 +363,8 @@ File content:""",
         context: str = "",
         auto_compress: bool = True,
         show_context: bool = True,
+        system: Optional[str] = None,
+        model_options: Optional[Dict[str, Any]] = None,
     ) -> MultipleChoiceResult:
         """Ask AI to choose from multiple options with lettered answers"""
 
@@ -355,7 +394,13 @@ File content:""",
         )
 
         # Get response with context monitoring
-        response = self.client.generate(self.model, prompt, show_context=show_context)
+        response = self.client.generate(
+            self.model,
+            prompt,
+            system=system,
+            options=model_options,
+            show_context=show_context,
+        )
 
         # Parse response
         letter, index, confidence = self.parser.parse_multiple_choice(response, options)
@@ -376,6 +421,8 @@ File content:""",
         context: str = "",
         auto_compress: bool = True,
         show_context: bool = True,
+        system: Optional[str] = None,
+        model_options: Optional[Dict[str, Any]] = None,
     ) -> SingleWordResult:
         """Ask AI for a single word response"""
 
@@ -399,7 +446,13 @@ File content:""",
         )
 
         # Get response with context monitoring
-        response = self.client.generate(self.model, prompt, show_context=show_context)
+        response = self.client.generate(
+            self.model,
+            prompt,
+            system=system,
+            options=model_options,
+            show_context=show_context,
+        )
 
         # Parse response
         word, confidence = self.parser.parse_single_word(response)
@@ -418,6 +471,8 @@ File content:""",
         context: str = "",
         auto_compress: bool = True,
         show_context: bool = True,
+        system: Optional[str] = None,
+        model_options: Optional[Dict[str, Any]] = None,
     ) -> OpenResult:
         """Ask AI for an open-ended detailed response"""
 
@@ -442,7 +497,11 @@ File content:""",
 
         # Get response with context monitoring
         response = self.client.generate(
-            self.model, full_prompt, show_context=show_context
+            self.model,
+            full_prompt,
+            system=system,
+            options=model_options,
+            show_context=show_context,
         )
 
         return OpenResult(
@@ -452,6 +511,94 @@ File content:""",
             compression_rounds=compression_rounds,
         )
 
+    def open_stream(
+        self,
+        prompt: str,
+        context: str = "",
+        auto_compress: bool = True,
+        show_context: bool = True,
+        system: Optional[str] = None,
+        model_options: Optional[Dict[str, Any]] = None,
+    ) -> Generator[str, None, None]:
+        """Stream an open-ended response; close the generator to stop early"""
+
+        # Handle context compression if needed
+        compressed_context = context
+
+        if auto_compress and context:
+            compressed_context, _ = self.compressor.compress(context, prompt)
+
+        # Build prompt from template
+        full_prompt = self.TEMPLATES["open"].format(
+            context=(
+                compressed_context
+                if compressed_context
+                else "No additional context provided"
+            ),
+            prompt=prompt,
+        )
+
+        if show_context:
+            self.client.print_context_usage(self.model, full_prompt, system)
+
+        yield from self.client.generate_stream(
+            self.model, full_prompt, system=system, options=model_options
+        )
+
+    def structured(
+        self,
+        prompt: str,
+        schema: Optional[Dict[str, Any]] = None,
+        context: str = "",
+        auto_compress: bool = True,
+        show_context: bool = True,
+        system: Optional[str] = None,
+        model_options: Optional[Dict[str, Any]] = None,
+    ) -> StructuredResult:
+        """Ask AI for a JSON response, constrained to a schema when given"""
+
+        # Handle context compression if needed
+        compressed_context = context
+        compression_rounds = 0
+
+        if auto_compress and context:
+            compressed_context, compression_rounds = self.compressor.compress(
+                context, prompt
+            )
+
+        # Build prompt from template
+        full_prompt = self.TEMPLATES["structured"].format(
+            context=(
+                compressed_context
+                if compressed_context
+                else "No additional context provided"
+            ),
+            prompt=prompt,
+        )
+
+        # Ollama accepts either "json" or a full JSON schema as the format
+        response = self.client.generate(
+            self.model,
+            full_prompt,
+            system=system,
+            options=model_options,
+            show_context=show_context,
+            format=schema or "json",
+        )
+
+        try:
+            data = self.parser.parse_json(response)
+        except json.JSONDecodeError:
+            logger.warning(f"Could not parse structured response: {response[:200]}")
+            data = None
+
+        return StructuredResult(
+            data=data,
+            raw=response,
+            context_compressed=compression_rounds > 0,
+            compression_rounds=compression_rounds,
+        )
+
     def file_write(
         self,
         requirements: str,
@@ -0,0 +1,70 @@
+"""Persistent cache of validated LLM responses for skill generation."""
+
+import hashlib
+import sqlite3
+import threading
+import time
+from typing import Optional
+
+_SCHEMA = """CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    model TEXT,
+    response TEXT,
+    validated INT,
+    ts REAL
+)"""
+
+
+class LLMCache:
+    """SQLite-backed cache of model responses keyed by model and prompt.
+
+    Only responses that went on to pass validation are stored, so a hit can
+    stand in for the model call it replaces.
+    """
+
+    def __init__(self, path: str):
+        """Open (or create) the cache database.
+
+        Args:
+            path: Path of the SQLite database file
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        # Skills are generated from several threads; access is serialized by _lock
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute(_SCHEMA)
+        self._connection.commit()
+
+    @staticmethod
+    def make_key(model: str, prompt: str) -> str:
+        """Build the cache key for a prompt sent to a model."""
+        return hashlib.sha256(f"{model}||{prompt}".encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the validated response stored under key, if any."""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT response FROM responses WHERE key = ? AND validated = 1",
+                (key,),
+            ).fetchone()
+        return row[0] if row else None
+
+    def put(self, key: str, model: str, response: str):
+        """Store a response that passed validation."""
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, 1, ?)",
+                (key, model, response, time.time()),
+            )
+            self._connection.commit()
+
+    def delete(self, key: str):
+        """Forget a response, e.g. one that failed validation after a hit."""
+        with self._lock:
+            self._connection.execute("DELETE FROM responses WHERE key = ?", (key,))
+            self._connection.commit()
+
+    def close(self):
+        """Close the database connection."""
+        with self._lock:
+            self._connection.close()
@@ -79,6 +79,7 @@ def run_skill_gen(
     analysis_model: Optional[str] = None,
     count: int = 1,
     ideas: Optional[list] = None,
+    verbose: bool = True,
 ):
     """Run automated skill generation.
 
@@ -87,11 +88,16 @@ def run_skill_gen(
         analysis_model: Optional model for vibe testing (defaults to main model)
         count: Number of skills to generate (default: 1)
         ideas: Optional list of specific skill ideas
+        verbose: Whether to print step-by-step progress (default: True)
     """
     from .skill_generator import run_skill_generation
 
     return run_skill_generation(
-        model=model, analysis_model=analysis_model, count=count, ideas=ideas
+        model=model,
+        analysis_model=analysis_model,
+        count=count,
+        ideas=ideas,
+        verbose=verbose,
     )
 
 
@@ -334,6 +340,7 @@ Examples:
   ollamapy --skillgen --count 5     # Generate 5 new skills
   ollamapy --skillgen --idea "analyze CSV data"  # Generate specific skill
   ollamapy --skillgen --count 3 --model llama3.2:7b  # Use specific model
+  ollamapy --skillgen --count 10 --quiet  # Only print the summary
   ollamapy --skill-editor           # Launch interactive skill editor web interface
   ollamapy --skill-editor --port 8080  # Use custom port for skill editor
   ollamapy --generate-docs          # Generate all documentation
@@ -399,6 +406,12 @@ Examples:
         help="Specific skill idea to generate (can be used multiple times)",
     )
 
+    parser.add_argument(
+        "--quiet",
+        action="store_true",
+        help="Only print the summary while generating skills (used with --skillgen)",
+    )
+
     parser.add_argument(
         "-n",
         "--iterations",
@@ -574,6 +587,7 @@ Examples:
             analysis_model=analysis_model,
             count=args.count,
             ideas=args.idea,
+            verbose=not args.quiet,
         )
         sys.exit(0 if success else 1)
     elif args.skill_editor:
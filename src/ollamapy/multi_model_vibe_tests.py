@@ -115,7 +115,7 @@ class MultiModelVibeTestRunner:
 
         # Create a vibe test runner for this model
         # Use the same model for both chat and analysis to get pure model performance
-        runner = VibeTestRunner(model=model_name, analysis_model=model_name)
+        runner = VibeTestRunner(model=model_name, analysis_model=model_name, client=self.client)
 
         # Run the tests
         success = runner.run_all_tests(iterations=iterations)
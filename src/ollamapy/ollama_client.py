@@ -4,22 +4,44 @@ import json
 import logging
 import re
 import requests
-from typing import Dict, List, Optional, Generator, Any
+from typing import Dict, List, Optional, Generator, Any, Union
+
+try:
+    import orjson
+except ImportError:  # Optional speedup, see the "fast" extra
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+# Parses one line of a streamed response; orjson takes the raw bytes directly
+_loads_line = orjson.loads if orjson is not None else json.loads
+
 
 class OllamaClient:
     """Enhanced Ollama API client with model context size support"""
 
-    def __init__(self, base_url: str = "http://localhost:11434"):
+    # Pooled keep-alive connections per client; skill generation and vibe tests
+    # issue many requests concurrently through one client
+    POOL_SIZE = 32
+
+    def __init__(
+        self,
+        base_url: str = "http://localhost:11434",
+        keep_alive: Optional[Union[str, int]] = None,
+    ):
         """Initialize the Ollama client.
 
         Args:
             base_url: The base URL for the Ollama API server
+            keep_alive: How long Ollama keeps a model loaded after each request
+                (e.g. "10m"); None uses the server default
         """
         self.base_url = base_url.rstrip("/")
         self.session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_maxsize=self.POOL_SIZE)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.keep_alive = keep_alive
         self._model_cache: Dict[str, int] = {}
 
     def is_available(self) -> bool:
@@ -204,8 +226,19 @@ class OllamaClient:
         prompt: str,
         system: Optional[str] = None,
         show_context: bool = True,
+        format: Optional[Union[str, Dict[str, Any]]] = None,
+        options: Optional[Dict[str, Any]] = None,
     ) -> str:
-        """Generate a response from the model with context monitoring."""
+        """Generate a response from the model with context monitoring.
+
+        Args:
+            model: The model to generate with
+            prompt: The prompt text
+            system: Optional system message
+            show_context: Whether to print context usage
+            format: Optional structured output format, either "json" or a JSON schema
+            options: Optional model options such as temperature or num_predict
+        """
         try:
             # Show context usage if requested
             if show_context:
@@ -214,6 +247,12 @@ class OllamaClient:
             payload = {"model": model, "prompt": prompt, "stream": False}
             if system:
                 payload["system"] = system
+            if format:
+                payload["format"] = format
+            if options:
+                payload["options"] = options
+            if self.keep_alive is not None:
+                payload["keep_alive"] = self.keep_alive
 
             response = self.session.post(
                 f"{self.base_url}/api/generate", json=payload, timeout=60
@@ -224,6 +263,109 @@ class OllamaClient:
             logger.error(f"Generation failed: {e}")
             return ""
 
+    def generate_stream(
+        self,
+        model: str,
+        prompt: str,
+        system: Optional[str] = None,
+        options: Optional[Dict[str, Any]] = None,
+    ) -> Generator[str, None, None]:
+        """Stream a generation from the model.
+
+        Closing the generator early closes the HTTP response, which makes
+        Ollama stop generating the rest of the answer.
+
+        Args:
+            model: The model to generate with
+            prompt: The prompt text
+            system: Optional system message
+            options: Optional model options such as temperature or num_predict
+
+        Yields:
+            Response chunks as strings
+        """
+        payload = {"model": model, "prompt": prompt, "stream": True}
+        if system:
+            payload["system"] = system
+        if options:
+            payload["options"] = options
+        if self.keep_alive is not None:
+            payload["keep_alive"] = self.keep_alive
+
+        try:
+            with self.session.post(
+                f"{self.base_url}/api/generate", json=payload, stream=True, timeout=60
+            ) as response:
+                response.raise_for_status()
+
+                for line in response.iter_lines():
+                    if line:
+                        data = _loads_line(line)
+                        if data.get("response"):
+                            yield data["response"]
+                        if data.get("done", False):
+                            break
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Generation failed: {e}")
+
+    def load_model(
+        self, model: str, keep_alive: Optional[Union[str, int]] = None
+    ) -> bool:
+        """Load a model into memory ahead of use.
+
+        Args:
+            model: The model to load
+            keep_alive: How long to keep it loaded; defaults to the client setting.
+                Passing 0 unloads the model instead.
+
+        Returns:
+            True if the request succeeded
+        """
+        # A generate request with an empty prompt only loads (or unloads) the model
+        payload: Dict[str, Any] = {"model": model, "prompt": "", "stream": False}
+        if keep_alive is None:
+            keep_alive = self.keep_alive
+        if keep_alive is not None:
+            payload["keep_alive"] = keep_alive
+
+        try:
+            response = self.session.post(
+                f"{self.base_url}/api/generate", json=payload, timeout=60
+            )
+            response.raise_for_status()
+            return True
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Loading model {model} failed: {e}")
+            return False
+
+    def embed(self, model: str, text: str) -> Optional[List[float]]:
+        """Get an embedding vector for text.
+
+        Args:
+            model: An embedding model, e.g. "nomic-embed-text"
+            text: The text to embed
+
+        Returns:
+            The embedding, or None if the request failed (e.g. model not pulled)
+        """
+        payload: Dict[str, Any] = {"model": model, "prompt": text}
+        if self.keep_alive is not None:
+            payload["keep_alive"] = self.keep_alive
+
+        try:
+            response = self.session.post(
+                f"{self.base_url}/api/embeddings", json=payload, timeout=60
+            )
+            response.raise_for_status()
+            return response.json().get("embedding") or None
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Embedding with {model} failed: {e}")
+            return None
+
+    def unload_model(self, model: str) -> bool:
+        """Ask Ollama to free a model's memory right away."""
+        return self.load_model(model, keep_alive=0)
+
     def pull_model(self, model: str) -> bool:
         """Pull a model if it's not available locally."""
         try:
@@ -234,7 +376,7 @@ class OllamaClient:
 
             for line in response.iter_lines():
                 if line:
-                    data = json.loads(line)
+                    data = _loads_line(line)
                     if "status" in data:
                         print(f"\r{data['status']}", end="", flush=True)
                     if data.get("status") == "success":
@@ -246,7 +388,11 @@ class OllamaClient:
             return False
 
     def chat_stream(
-        self, model: str, messages: List[Dict[str, str]], system: Optional[str] = None
+        self,
+        model: str,
+        messages: List[Dict[str, str]],
+        system: Optional[str] = None,
+        options: Optional[Dict[str, Any]] = None,
     ) -> Generator[str, None, None]:
         """Stream chat responses from Ollama.
 
@@ -254,6 +400,7 @@ class OllamaClient:
             model: The model to use for chat
             messages: List of message dicts with 'role' and 'content'
             system: Optional system message
+            options: Optional model options such as temperature
 
         Yields:
             Response chunks as strings
@@ -262,6 +409,10 @@ class OllamaClient:
 
         if system:
             payload["system"] = system
+        if options:
+            payload["options"] = options
+        if self.keep_alive is not None:
+            payload["keep_alive"] = self.keep_alive
 
         try:
             response = self.session.post(
@@ -271,7 +422,7 @@ class OllamaClient:
 
             for line in response.iter_lines():
                 if line:
-                    data = json.loads(line)
+                    data = _loads_line(line)
                     if "message" in data and "content" in data["message"]:
                         yield data["message"]["content"]
                     if data.get("done", False):
@@ -0,0 +1,94 @@
+"""Long-lived worker process that test-runs generated skill code.
+
+SafeCodeExecutor starts this script once and sends it one JSON request per
+line on stdin ({"code": ..., "params": {...}}). Each request is executed in a
+fresh namespace and answered with one JSON line on stdout
+({"success": bool, "output": str}), so the interpreter start-up cost is paid
+once per session instead of once per test.
+"""
+
+import io
+import json
+import os
+import sys
+import traceback
+from contextlib import nullcontext, redirect_stdout
+from types import CodeType
+from typing import Any, Dict, Optional, Tuple, Union
+
+
+def run_request(
+    code: Union[str, CodeType],
+    params: Dict[str, Any],
+    builtins: Optional[Dict[str, Any]] = None,
+    capture_stdout: bool = True,
+) -> Tuple[bool, str]:
+    """Execute skill code and call its execute function.
+
+    Args:
+        code: The generated function code, or a code object compiled from it
+        params: Keyword arguments to call execute with
+        builtins: Optional restricted builtins for the skill namespace
+        capture_stdout: Whether to swallow anything the skill prints. Callers
+            running in-process pass False because redirection is process-wide.
+
+    Returns:
+        Tuple of (success, output) using the same output format as the
+        one-shot test script: "SUCCESS" followed by "LOG: ..." lines.
+    """
+    logged_messages = []
+
+    def log(message):
+        logged_messages.append(str(message))
+
+    namespace: Dict[str, Any] = {"__name__": "__skill__", "log": log}
+    if builtins is not None:
+        namespace["__builtins__"] = builtins
+
+    # Anything the skill prints must not corrupt the response stream
+    with redirect_stdout(io.StringIO()) if capture_stdout else nullcontext():
+        try:
+            exec(code, namespace)
+
+            execute = namespace.get("execute")
+            if execute is None:
+                return False, "ERROR: No 'execute' function found"
+            if not callable(execute):
+                return False, "ERROR: 'execute' is not callable"
+
+            if params:
+                execute(**params)
+            else:
+                execute()
+        except BaseException as e:  # Includes SystemExit raised by skill code
+            return False, f"ERROR: {e}\n{traceback.format_exc()}"
+
+    return True, "\n".join(["SUCCESS"] + [f"LOG: {msg}" for msg in logged_messages])
+
+
+def main():
+    """Serve test requests until stdin is closed."""
+    # Answer on a copy of the original stdout and point fd 1 at stderr, so
+    # skill code writing to fd 1 directly cannot corrupt the response stream
+    sys.stdout.flush()
+    responses = os.fdopen(os.dup(sys.stdout.fileno()), "w")
+    os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+
+        try:
+            request = json.loads(line)
+            success, output = run_request(
+                request.get("code", ""), request.get("params") or {}
+            )
+        except Exception as e:
+            success, output = False, f"ERROR: Invalid request: {e}"
+
+        responses.write(json.dumps({"success": success, "output": output}) + "\n")
+        responses.flush()
+
+
+if __name__ == "__main__":
+    main()
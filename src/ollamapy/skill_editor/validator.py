@@ -1,10 +1,50 @@
 """Skill validation utilities."""
 
 import ast
+import hashlib
+import json
+import os
 import re
-from typing import List, Dict, Any
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import List, Dict, Any, FrozenSet, Optional
 from dataclasses import dataclass
 
+# Dotted call targets flagged as potentially dangerous, with their warnings
+_DANGEROUS_PATTERNS = [
+    ("os.system", "Using os.system() can be dangerous"),
+    ("subprocess.call", "Using subprocess.call() can be dangerous"),
+    ("eval", "Using eval() can be dangerous"),
+    ("exec", "Using exec() can be dangerous"),
+    ("__import__", "Dynamic imports can be dangerous"),
+]
+
+# Builtins flagged however they are reached, e.g. builtins.eval or e = eval
+_DANGEROUS_BUILTINS = frozenset({"eval", "exec", "__import__"})
+
+# ASCII-only Python identifier, used for skill and parameter names
+_IDENTIFIER_RE = re.compile(r"^[a-zA-Z_][a-zA-Z0-9_]*$")
+
+# Any code defining execute contains this, so code without it skips the visitor
+_EXECUTE_DEF_RE = re.compile(r"\bdef\s+execute\s*\(")
+
+# Words suggesting that a description says when the skill should be used
+_USAGE_HINT_RE = re.compile("when|use|for|to", re.IGNORECASE)
+
+
+def _is_plain_json(value: Any) -> bool:
+    """Whether value only holds types that JSON round-trips unchanged."""
+    if value is None or isinstance(value, (str, int, float)):
+        return True
+    if type(value) is list:
+        return all(_is_plain_json(item) for item in value)
+    if type(value) is dict:
+        return all(
+            isinstance(key, str) and _is_plain_json(item) for key, item in value.items()
+        )
+    return False
+
 
 @dataclass
 class ValidationResult:
@@ -15,11 +55,57 @@ class ValidationResult:
     warnings: List[str]
 
 
+class _SkillCodeVisitor(ast.NodeVisitor):
+    """Collects everything the code checks need in a single tree traversal."""
+
+    def __init__(self):
+        self.execute_func: Optional[ast.FunctionDef] = None
+        self.async_execute: Optional[ast.AsyncFunctionDef] = None
+        self.called_names = set()
+
+    def visit_FunctionDef(self, node: ast.FunctionDef):
+        if node.name == "execute" and self.execute_func is None:
+            self.execute_func = node
+        self.generic_visit(node)
+
+    def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef):
+        # The registry calls execute without awaiting it, so it cannot be async
+        if node.name == "execute" and self.async_execute is None:
+            self.async_execute = node
+        self.generic_visit(node)
+
+    def visit_Call(self, node: ast.Call):
+        func = node.func
+        if isinstance(func, ast.Name):
+            self.called_names.add(func.id)
+        self.generic_visit(node)
+
+    def visit_Attribute(self, node: ast.Attribute):
+        # Treat references such as `run = os.system` like a call
+        if isinstance(node.value, ast.Name):
+            self.called_names.add(f"{node.value.id}.{node.attr}")
+        if node.attr in _DANGEROUS_BUILTINS:
+            self.called_names.add(node.attr)
+        self.generic_visit(node)
+
+    def visit_Name(self, node: ast.Name):
+        # Treat references such as `loader = __import__` like a call
+        if node.id in _DANGEROUS_BUILTINS:
+            self.called_names.add(node.id)
+
+
 class SkillValidator:
     """Validates skill data and code."""
 
+    # Maximum number of validation results remembered per validator
+    CACHE_SIZE = 128
+
+    # Batches smaller than this are validated serially in validate_many
+    PARALLEL_THRESHOLD = 16
+
     def __init__(self):
         """Initialize the validator."""
+        self._cache: "OrderedDict[bytes, ValidationResult]" = OrderedDict()
         self.required_fields = ["name", "description", "function_code"]
         self.valid_parameter_types = ["string", "number", "boolean"]
         self.valid_roles = [
@@ -46,6 +132,98 @@ class SkillValidator:
         Returns:
             ValidationResult with validation status and messages
         """
+        key = self._cache_key(skill_data)
+        if key is not None and key in self._cache:
+            self._cache.move_to_end(key)
+            return self._copy_result(self._cache[key])
+
+        result = self._validate_skill_data(skill_data)
+
+        self._remember(key, result)
+        return result
+
+    def validate_many(
+        self, skills: List[Dict[str, Any]], max_workers: Optional[int] = None
+    ) -> List[ValidationResult]:
+        """Validate a batch of skills, spreading the work across processes.
+
+        Args:
+            skills: List of skill data dictionaries to validate
+            max_workers: Worker process count (defaults to the CPU count)
+
+        Returns:
+            List of ValidationResult objects in the same order as the input
+        """
+        results: List[Optional[ValidationResult]] = [None] * len(skills)
+        pending = []
+
+        for index, skill_data in enumerate(skills):
+            key = self._cache_key(skill_data)
+            if key is not None and key in self._cache:
+                self._cache.move_to_end(key)
+                results[index] = self._copy_result(self._cache[key])
+            else:
+                pending.append((index, key, skill_data))
+
+        if len(pending) < self.PARALLEL_THRESHOLD:
+            computed = [self._validate_skill_data(item[2]) for item in pending]
+        else:
+            try:
+                with ProcessPoolExecutor(
+                    max_workers=max_workers or os.cpu_count()
+                ) as executor:
+                    computed = list(
+                        executor.map(_validate_one, [item[2] for item in pending])
+                    )
+            except (OSError, BrokenProcessPool, NotImplementedError):
+                # Fall back to serial validation if worker processes are unavailable
+                computed = [self._validate_skill_data(item[2]) for item in pending]
+
+        for (index, key, _), result in zip(pending, computed):
+            results[index] = result
+            self._remember(key, result)
+
+        return results
+
+    def _remember(self, key: Optional[bytes], result: ValidationResult):
+        """Store a result in the bounded cache, evicting the oldest entry."""
+        if key is None:
+            return
+        self._cache[key] = self._copy_result(result)
+        if len(self._cache) > self.CACHE_SIZE:
+            self._cache.popitem(last=False)
+
+    def clear_cache(self):
+        """Forget all remembered validation results."""
+        self._cache.clear()
+
+    @staticmethod
+    def _cache_key(skill_data: Dict[str, Any]) -> Optional[bytes]:
+        """Hash a canonical JSON form of the skill data.
+
+        Returns None when the data is not plain JSON, in which case the
+        result is simply not cached; e.g. a tuple would serialize like a list
+        but validates differently.
+        """
+        if not _is_plain_json(skill_data):
+            return None
+        try:
+            canonical = json.dumps(
+                skill_data, sort_keys=True, separators=(",", ":")
+            ).encode("utf-8")
+        except (TypeError, ValueError):
+            return None
+        return hashlib.blake2b(canonical, digest_size=16).digest()
+
+    @staticmethod
+    def _copy_result(result: ValidationResult) -> ValidationResult:
+        """Copy a result so callers cannot mutate cached message lists."""
+        return ValidationResult(
+            result.is_valid, list(result.errors), list(result.warnings)
+        )
+
+    def _validate_skill_data(self, skill_data: Dict[str, Any]) -> ValidationResult:
+        """Run the full validation pipeline without consulting the cache."""
         errors = []
         warnings = []
 
@@ -86,8 +264,12 @@ class SkillValidator:
 
         # Validate function code
         if "function_code" in skill_data:
+            parameters = skill_data.get("parameters") or {}
+            param_names = (
+                frozenset(parameters) if isinstance(parameters, dict) else frozenset()
+            )
             code_validation = self._validate_function_code(
-                skill_data["function_code"], skill_data.get("parameters", {})
+                skill_data["function_code"], parameters, param_names
             )
             errors.extend(code_validation.errors)
             warnings.extend(code_validation.warnings)
@@ -105,12 +287,12 @@ class SkillValidator:
             errors.append("Skill name must be a string")
             return ValidationResult(False, errors, warnings)
 
-        if not name.strip():
+        if not name or name.isspace():
             errors.append("Skill name cannot be empty")
             return ValidationResult(False, errors, warnings)
 
         # Check for valid identifier
-        if not re.match(r"^[a-zA-Z_][a-zA-Z0-9_]*$", name):
+        if not _IDENTIFIER_RE.match(name):
             errors.append(
                 "Skill name must be a valid Python identifier (no spaces or special characters except underscore)"
             )
@@ -120,7 +302,7 @@ class SkillValidator:
             warnings.append("Skill name is quite long, consider shortening it")
 
         # Naming conventions
-        if name[0].isupper():
+        if "A" <= name[0] <= "Z":
             warnings.append(
                 "Skill names typically use camelCase or snake_case (starting with lowercase)"
             )
@@ -136,7 +318,7 @@ class SkillValidator:
             errors.append("Description must be a string")
             return ValidationResult(False, errors, warnings)
 
-        if not description.strip():
+        if not description or description.isspace():
             warnings.append(
                 "Description is empty - consider adding a clear description of when to use this skill"
             )
@@ -153,9 +335,7 @@ class SkillValidator:
             )
 
         # Check for common patterns
-        if not any(
-            word in description.lower() for word in ["when", "use", "for", "to"]
-        ):
+        if not _USAGE_HINT_RE.search(description):
             warnings.append(
                 "Description should clearly indicate when this skill should be used"
             )
@@ -189,7 +369,7 @@ class SkillValidator:
 
         for param_name, param_info in parameters.items():
             # Validate parameter name
-            if not re.match(r"^[a-zA-Z_][a-zA-Z0-9_]*$", param_name):
+            if not _IDENTIFIER_RE.match(param_name):
                 errors.append(
                     f"Parameter name '{param_name}' must be a valid Python identifier"
                 )
@@ -244,7 +424,7 @@ class SkillValidator:
         for i, phrase in enumerate(vibe_phrases):
             if not isinstance(phrase, str):
                 errors.append(f"Vibe test phrase {i+1} must be a string")
-            elif not phrase.strip():
+            elif not phrase or phrase.isspace():
                 warnings.append(f"Vibe test phrase {i+1} is empty")
             elif len(phrase) < 5:
                 warnings.append(f"Vibe test phrase {i+1} is very short")
@@ -252,7 +432,10 @@ class SkillValidator:
         return ValidationResult(len(errors) == 0, errors, warnings)
 
     def _validate_function_code(
-        self, code: str, parameters: Dict[str, Any] = None
+        self,
+        code: str,
+        parameters: Dict[str, Any] = None,
+        param_names: Optional[FrozenSet[str]] = None,
     ) -> ValidationResult:
         """Validate Python function code."""
         errors = []
@@ -262,7 +445,7 @@ class SkillValidator:
             errors.append("Function code must be a string")
             return ValidationResult(False, errors, warnings)
 
-        if not code.strip():
+        if not code or code.isspace():
             errors.append("Function code cannot be empty")
             return ValidationResult(False, errors, warnings)
 
@@ -273,51 +456,51 @@ class SkillValidator:
             errors.append(f"Syntax error in function code: {e}")
             return ValidationResult(False, errors, warnings)
 
-        # Check for execute function
-        has_execute = False
-        execute_func = None
+        # Code without this text cannot define execute, so skip the visitor
+        if not _EXECUTE_DEF_RE.search(code):
+            errors.append("Function code must define an 'execute' function")
+            return ValidationResult(False, errors, warnings)
 
-        for node in ast.walk(tree):
-            if isinstance(node, ast.FunctionDef) and node.name == "execute":
-                has_execute = True
-                execute_func = node
-                break
+        # Collect the execute function, log() usage and risky calls in one pass
+        visitor = _SkillCodeVisitor()
+        visitor.visit(tree)
 
-        if not has_execute:
-            errors.append("Function code must define an 'execute' function")
+        if visitor.execute_func is None:
+            if visitor.async_execute is not None:
+                errors.append(
+                    "The 'execute' function must not be async; skills are called "
+                    "without being awaited"
+                )
+            else:
+                errors.append("Function code must define an 'execute' function")
             return ValidationResult(False, errors, warnings)
 
         # Validate execute function signature
-        if execute_func and parameters:
+        if parameters:
             param_validation = self._validate_execute_signature(
-                execute_func, parameters
+                visitor.execute_func, parameters, param_names
             )
             errors.extend(param_validation.errors)
             warnings.extend(param_validation.warnings)
 
         # Check for log usage
-        if "log(" not in code:
+        if "log" not in visitor.called_names:
             warnings.append(
                 "Function should use log() to output results that the AI can see"
             )
 
-        # Check for potentially dangerous operations
-        dangerous_patterns = [
-            ("os.system", "Using os.system() can be dangerous"),
-            ("subprocess.call", "Using subprocess.call() can be dangerous"),
-            ("eval(", "Using eval() can be dangerous"),
-            ("exec(", "Using exec() can be dangerous"),
-            ("__import__", "Dynamic imports can be dangerous"),
-        ]
-
-        for pattern, warning in dangerous_patterns:
-            if pattern in code:
+        # Report potentially dangerous operations in a stable order
+        for pattern, warning in _DANGEROUS_PATTERNS:
+            if pattern in visitor.called_names:
                 warnings.append(warning)
 
         return ValidationResult(len(errors) == 0, errors, warnings)
 
     def _validate_execute_signature(
-        self, func_node: ast.FunctionDef, parameters: Dict[str, Any]
+        self,
+        func_node: ast.FunctionDef,
+        parameters: Dict[str, Any],
+        param_names: Optional[FrozenSet[str]] = None,
     ) -> ValidationResult:
         """Validate that execute function signature matches declared parameters."""
         errors = []
@@ -325,10 +508,11 @@ class SkillValidator:
 
         # Get function arguments
         func_args = [arg.arg for arg in func_node.args.args]
+        func_arg_set = set(func_args)
 
         # Check if all declared parameters are in function signature
-        for param_name in parameters.keys():
-            if param_name not in func_args:
+        for param_name in parameters:
+            if param_name not in func_arg_set:
                 if parameters[param_name].get("required", False):
                     errors.append(
                         f"Required parameter '{param_name}' not found in execute function signature"
@@ -339,7 +523,8 @@ class SkillValidator:
                     )
 
         # Check for extra function arguments
-        param_names = set(parameters.keys())
+        if param_names is None:
+            param_names = frozenset(parameters)
         for arg_name in func_args:
             if arg_name not in param_names:
                 warnings.append(
@@ -359,3 +544,8 @@ class SkillValidator:
             errors.append(f"Syntax error: {e}")
 
         return ValidationResult(len(errors) == 0, errors, warnings)
+
+
+def _validate_one(skill_data: Dict[str, Any]) -> ValidationResult:
+    """Validate a single skill in a worker process for validate_many."""
+    return SkillValidator()._validate_skill_data(skill_data)
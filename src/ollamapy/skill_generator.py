@@ -1,17 +1,134 @@
 """Automated skill generation system using AI with multi-step prompts and safe execution."""
 
+import ast
+import builtins
+import copy
+import hashlib
 import json
+import marshal
+import math
+import re
 import subprocess
-import tempfile
 import os
-from dataclasses import dataclass
-from typing import Dict, List, Any, Optional, Tuple, Union
+import queue
+import sys
+import textwrap
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from types import CodeType
+from typing import Dict, List, Any, Optional, Set, Tuple, Union
 from datetime import datetime
 
+from . import sandbox_worker
 from .ai_query import AIQuery
+from .llm_cache import LLMCache
 from .ollama_client import OllamaClient
 from .skills import Skill, SkillRegistry
-from .analysis_engine import AnalysisEngine
+
+# Role categories a generated skill may be assigned to
+SKILL_ROLES = [
+    "text_processing",
+    "mathematics",
+    "data_analysis",
+    "file_operations",
+    "web_utilities",
+    "time_date",
+    "formatting",
+    "validation",
+    "general",
+]
+
+# Parameter types supported by generated skills
+PARAMETER_TYPES = ["string", "number", "boolean"]
+
+# Plan fields produced by the single structured metadata request
+PLAN_METADATA_FIELDS = [
+    "name",
+    "description",
+    "role",
+    "vibe_test_phrases",
+    "parameters",
+]
+
+# Validation error categories, keyed by the start of the error message
+VALIDATION_ERROR_CATEGORIES = {
+    "Invalid skill name": "NAME_INVALID",
+    "Description too short": "DESC_TOO_SHORT",
+    "Need at least 3 vibe test phrases": "PHRASES_MISSING",
+    "Function code missing or invalid": "CODE_MISSING_DEF",
+    "Code execution failed": "CODE_RUNTIME_ERROR",
+}
+
+# Categories that tend to fail the same way again for the same idea
+DETERMINISTIC_ERROR_CATEGORIES = {"NAME_INVALID", "DESC_TOO_SHORT", "CODE_MISSING_DEF"}
+
+# System prompt for the batched yes/no vibe test questions
+VIBE_TEST_SYSTEM_PROMPT = (
+    "You are a decision assistant. Answer only with a JSON array of booleans."
+)
+
+# JSON schema for a skill's parameter specification
+PARAMETERS_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "additionalProperties": {
+        "type": "object",
+        "properties": {
+            "type": {"type": "string", "enum": PARAMETER_TYPES},
+            "description": {"type": "string"},
+            "required": {"type": "boolean"},
+        },
+        "required": ["type", "description", "required"],
+    },
+}
+
+_SKILL_NAME_RE = re.compile(r"^[a-z_][a-z0-9_]*$")
+
+# ASCII-only Python identifier; str.isalnum() also accepts other scripts' letters
+_IDENTIFIER_RE = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+# Present in any code that defines execute, so a cheap test before parsing
+_EXECUTE_DEF_RE = re.compile(r"\bdef\s+execute\s*\(")
+
+# JSON schema passed to Ollama's structured output for plan metadata. The
+# constraints mirror validate_and_test_plan, so the decoder cannot produce a
+# plan that fails those checks and costs a retry.
+PLAN_METADATA_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "name": {"type": "string", "pattern": _SKILL_NAME_RE.pattern, "maxLength": 50},
+        "description": {"type": "string", "minLength": 10},
+        "role": {"type": "string", "enum": SKILL_ROLES},
+        "vibe_test_phrases": {
+            "type": "array",
+            "items": {"type": "string", "minLength": 1},
+            "minItems": 3,
+            "maxItems": 5,
+        },
+        "parameters": PARAMETERS_SCHEMA,
+    },
+    "required": PLAN_METADATA_FIELDS,
+}
+
+# How each metadata field is described in the plan metadata prompt
+_PLAN_FIELD_PROMPTS = {
+    "name": '- "name": a UNIQUE function name, 2-3 lowercase words joined by underscores (e.g. "count_words")',
+    "description": '- "description": 10-30 words explaining WHEN to use this skill (e.g. "Use when the user wants to count words in a text")',
+    "role": f'- "role": one of {", ".join(SKILL_ROLES)}',
+    "vibe_test_phrases": '- "vibe_test_phrases": 5 short, natural, varied things a user might say that should trigger this skill',
+    "parameters": '- "parameters": an object mapping each input parameter name to {"type": "string" | "number" | "boolean", "description": "...", "required": true | false}, or {} if no input is needed',
+}
+
+# One numbered ("1." / "1)") or bulleted ("-") list item per line
+_LIST_ITEM_RE = re.compile(r"^[ \t]*(?:\d+[.)]|-)[ \t]*(.+?)[ \t]*$", re.MULTILINE)
+
+
+def _is_valid_parameters(parameters: Any) -> bool:
+    """Check that a value is a parameter specification dict with known types."""
+    return isinstance(parameters, dict) and all(
+        isinstance(spec, dict) and spec.get("type") in PARAMETER_TYPES
+        for spec in parameters.values()
+    )
 
 
 @dataclass
@@ -25,6 +142,10 @@ class SkillPlan:
     vibe_test_phrases: Optional[List[str]] = None
     parameters: Optional[Dict[str, Dict[str, Any]]] = None
     function_code: str = ""
+    # Cache key of the prompt that produced function_code
+    code_cache_key: str = ""
+    # function_code compiled during validation, reused when registering
+    compiled_code: Optional[CodeType] = field(default=None, repr=False)
 
     def __post_init__(self):
         if self.vibe_test_phrases is None:
@@ -51,28 +172,478 @@ class SkillGenerationResult:
 class SafeCodeExecutor:
     """Safely executes generated code in isolation."""
 
-    def __init__(self):
+    WORKER_SCRIPT = os.path.join(os.path.dirname(__file__), "sandbox_worker.py")
+
+    # Top-level modules generated code may import
+    ALLOWED_IMPORTS = frozenset({"math", "json", "datetime", "os", "re", "random"})
+
+    # Calls rejected before generated code is ever run
+    FORBIDDEN_CALLS = frozenset({"eval", "exec", "compile", "__import__", "open"})
+
+    # Calls on whitelisted modules that touch the file system or processes
+    FORBIDDEN_ATTRIBUTE_CALLS = frozenset(
+        {
+            "os.chmod",
+            "os.kill",
+            "os.popen",
+            "os.remove",
+            "os.removedirs",
+            "os.rename",
+            "os.replace",
+            "os.rmdir",
+            "os.system",
+            "os.unlink",
+        }
+    )
+
+    # Statements allowed at the top level of generated code (besides docstrings)
+    TOP_LEVEL_STATEMENTS = (
+        ast.Import,
+        ast.ImportFrom,
+        ast.FunctionDef,
+        ast.ClassDef,
+        ast.Assign,
+        ast.AnnAssign,
+    )
+
+    # Expressions that run code, rejected wherever they would be evaluated
+    # while the module is imported
+    IMPORT_TIME_EXPRESSIONS = (
+        ast.Call,
+        ast.ListComp,
+        ast.SetComp,
+        ast.DictComp,
+        ast.GeneratorExp,
+    )
+
+    # Bump when _check_tree changes, so code cached under older checks is
+    # compiled again
+    CHECKS_VERSION = 2
+
+    # Builtins removed from the namespace of code run in-process
+    RESTRICTED_BUILTINS = FORBIDDEN_CALLS | {
+        "breakpoint",
+        "delattr",
+        "exit",
+        "getattr",
+        "globals",
+        "input",
+        "locals",
+        "quit",
+        "setattr",
+        "vars",
+    }
+
+    # The only os names code run in-process may use; nothing that changes the
+    # working directory, environment or processes of this process
+    IN_PROCESS_OS_NAMES = frozenset(
+        {
+            "curdir",
+            "getcwd",
+            "getenv",
+            "linesep",
+            "listdir",
+            "name",
+            "pardir",
+            "path",
+            "sep",
+        }
+    )
+
+    def __init__(self, isolated: bool = True, cache_dir: Optional[str] = None):
+        """Initialize the executor.
+
+        Args:
+            isolated: Run tests in the sandbox worker process. False runs them
+                in this process instead, which is faster but shares its
+                working directory and environment, and code that never returns
+                keeps a background thread busy after the timeout; code using
+                more of os than IN_PROCESS_OS_NAMES is then rejected.
+            cache_dir: Directory where code that passed the safety checks is
+                kept compiled, keyed by a hash of its source. None disables it.
+        """
         self.timeout_seconds = 10
-        self.allowed_imports = ["math", "json", "datetime", "os", "re", "random"]
+        self.isolated = isolated
+        self.cache_dir = cache_dir
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+        self._worker: Optional[subprocess.Popen] = None
+        self._worker_responses: "queue.Queue[Optional[str]]" = queue.Queue()
+        self._lock = threading.Lock()
 
     def test_code_safely(
-        self, function_code: str, test_params: Optional[Dict[str, Any]] = None
+        self,
+        function_code: str,
+        test_params: Optional[Dict[str, Any]] = None,
+        code: Optional[CodeType] = None,
     ) -> Tuple[bool, str]:
         """Test generated code safely without crashing the main process.
 
+        The code is first checked against an AST whitelist. By default it then
+        runs in a long-lived sandbox worker process, falling back to a one-shot
+        interpreter if the worker cannot start. With isolated=False it runs
+        in-process in a fresh namespace with restricted builtins instead.
+
         Args:
             function_code: The Python function code to test
             test_params: Optional parameters to test with
+            code: function_code as already returned by compile_checked, so
+                it is not parsed and checked again
 
         Returns:
             Tuple of (success, output_or_error)
         """
-        # Create a test script
-        # Properly indent the function code
-        indented_code = "\n".join(
-            "    " + line if line.strip() else line
-            for line in function_code.split("\n")
+        if code is None:
+            code, safety_error = self.compile_checked(function_code)
+            if safety_error:
+                return False, f"Code execution failed: {safety_error}"
+
+        if not self.isolated:
+            in_process_error = self._check_in_process(function_code)
+            if in_process_error:
+                return False, f"Code execution failed: {in_process_error}"
+            return self._test_in_process(code, test_params)
+
+        with self._lock:
+            try:
+                worker = self._ensure_worker()
+            except OSError:
+                return self._test_in_new_interpreter(function_code, test_params)
+
+            return self._test_in_worker(worker, function_code, test_params)
+
+    def compile_checked(
+        self, function_code: str, tree: Optional[ast.Module] = None
+    ) -> Tuple[Optional[CodeType], Optional[str]]:
+        """Parse code once, check it against the whitelist and compile it.
+
+        Args:
+            function_code: The Python function code
+            tree: function_code already parsed by the caller, if available
+
+        Returns:
+            Tuple of (code object, None) or (None, error message)
+        """
+        if tree is None:
+            try:
+                tree = ast.parse(function_code)
+            except SyntaxError as e:
+                return None, f"Syntax error: {e}"
+
+        # Checked even on a cache hit, so the current rules always apply
+        safety_error = self._check_tree(tree)
+        if safety_error:
+            return None, safety_error
+
+        cache_path = self._cache_path(function_code)
+        if cache_path:
+            try:
+                with open(cache_path, "rb") as f:
+                    code = marshal.load(f)
+                if isinstance(code, CodeType):
+                    return code, None
+            except (OSError, EOFError, ValueError, TypeError):
+                pass
+
+        code = compile(tree, "<skill>", "exec")
+        if cache_path:
+            # Write then rename so concurrent readers never see a partial file
+            temp_path = f"{cache_path}.{threading.get_ident()}.tmp"
+            try:
+                with open(temp_path, "wb") as f:
+                    marshal.dump(code, f)
+                os.replace(temp_path, cache_path)
+            except OSError:
+                pass
+        return code, None
+
+    def _cache_path(self, function_code: str) -> Optional[str]:
+        """Path of the cached code object for function_code, if caching is on."""
+        if not self.cache_dir:
+            return None
+        # marshal data is only valid for the interpreter version that wrote it;
+        # the rules are part of the key so changing them drops old entries
+        rules = (
+            sorted(self.ALLOWED_IMPORTS),
+            sorted(self.FORBIDDEN_CALLS),
+            sorted(self.FORBIDDEN_ATTRIBUTE_CALLS),
+            [statement.__name__ for statement in self.TOP_LEVEL_STATEMENTS],
+            self.CHECKS_VERSION,
         )
+        digest = hashlib.sha256(
+            f"{sys.implementation.cache_tag}\0{rules}\0{function_code}".encode("utf-8")
+        ).hexdigest()
+        return os.path.join(self.cache_dir, f"{digest}.pyc")
+
+    def check_code_safety(self, function_code: str) -> Optional[str]:
+        """Reject code that imports or calls anything outside the whitelist.
+
+        Returns:
+            An error message, or None if the code passed the checks
+        """
+        try:
+            tree = ast.parse(function_code)
+        except SyntaxError as e:
+            return f"Syntax error: {e}"
+
+        return self._check_tree(tree)
+
+    def _check_tree(self, tree: ast.Module) -> Optional[str]:
+        """Check an already parsed module; see check_code_safety."""
+        # Only definitions may run at import time; the registry loads skills
+        # with full builtins, so top-level loops or calls must not get through
+        import_time_error = self._check_import_time(tree.body)
+        if import_time_error:
+            return import_time_error
+
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                modules = [alias.name for alias in node.names]
+            elif isinstance(node, ast.ImportFrom):
+                modules = [node.module or ""]
+            else:
+                modules = []
+
+            for module in modules:
+                if module.split(".")[0] not in self.ALLOWED_IMPORTS:
+                    return f"Import of '{module}' is not allowed"
+
+            if isinstance(node, ast.Call):
+                func = node.func
+                if isinstance(func, ast.Name) and func.id in self.FORBIDDEN_CALLS:
+                    return f"Call to '{func.id}()' is not allowed"
+                if isinstance(func, ast.Attribute) and isinstance(func.value, ast.Name):
+                    dotted = f"{func.value.id}.{func.attr}"
+                    if dotted in self.FORBIDDEN_ATTRIBUTE_CALLS:
+                        return f"Call to '{dotted}()' is not allowed"
+
+            if isinstance(node, ast.Attribute) and node.attr.startswith("_"):
+                return f"Access to private attribute '{node.attr}' is not allowed"
+
+        return None
+
+    def _check_in_process(self, function_code: str) -> Optional[str]:
+        """Apply the stricter checks for code run in this process.
+
+        Returns:
+            An error message, or None if the code may run in-process
+        """
+        for node in ast.walk(ast.parse(function_code)):
+            if isinstance(node, ast.Name) and node.id in self.RESTRICTED_BUILTINS:
+                return f"Use of '{node.id}' is not allowed"
+            if isinstance(node, ast.Import):
+                for alias in node.names:
+                    if alias.name == "os" and alias.asname not in (None, "os"):
+                        return "Importing os under another name is not allowed"
+            if isinstance(node, ast.ImportFrom) and node.module == "os":
+                for alias in node.names:
+                    if alias.name not in self.IN_PROCESS_OS_NAMES:
+                        return f"Import of 'os.{alias.name}' is not allowed"
+            if (
+                isinstance(node, ast.Attribute)
+                and isinstance(node.value, ast.Name)
+                and node.value.id == "os"
+                and node.attr not in self.IN_PROCESS_OS_NAMES
+            ):
+                return f"Use of 'os.{node.attr}' is not allowed"
+        return None
+
+    def _check_import_time(self, statements: List[ast.stmt]) -> Optional[str]:
+        """Reject statements, or parts of them, that run code at import time.
+
+        Module and class bodies may only hold TOP_LEVEL_STATEMENTS and
+        docstrings, and nothing evaluated while they run (assigned values,
+        defaults, annotations, decorators, base classes) may call anything.
+        """
+        for node in statements:
+            if not isinstance(node, self.TOP_LEVEL_STATEMENTS) and not (
+                isinstance(node, ast.Expr) and isinstance(node.value, ast.Constant)
+            ):
+                return (
+                    f"Top-level {type(node).__name__} statement on line "
+                    f"{node.lineno} is not allowed"
+                )
+
+            if isinstance(node, ast.FunctionDef):
+                args = node.args
+                evaluated = [
+                    *node.decorator_list,
+                    *args.defaults,
+                    *(default for default in args.kw_defaults if default),
+                    *(
+                        arg.annotation
+                        for arg in (
+                            *args.posonlyargs,
+                            *args.args,
+                            *args.kwonlyargs,
+                            args.vararg,
+                            args.kwarg,
+                        )
+                        if arg is not None and arg.annotation is not None
+                    ),
+                ]
+                if node.returns is not None:
+                    evaluated.append(node.returns)
+            elif isinstance(node, ast.ClassDef):
+                body_error = self._check_import_time(node.body)
+                if body_error:
+                    return body_error
+                evaluated = [
+                    *node.decorator_list,
+                    *node.bases,
+                    *(keyword.value for keyword in node.keywords),
+                ]
+            elif isinstance(node, (ast.Assign, ast.AnnAssign)):
+                evaluated = [node]
+            else:
+                evaluated = []
+
+            for expression in evaluated:
+                for child in ast.walk(expression):
+                    if isinstance(child, self.IMPORT_TIME_EXPRESSIONS):
+                        return (
+                            f"{type(child).__name__} on line {child.lineno} would "
+                            "run at import time and is not allowed"
+                        )
+        return None
+
+    def _safe_builtins(self) -> Dict[str, Any]:
+        """Builtins for in-process tests: no eval/exec/open, whitelisted imports."""
+        safe = {
+            name: value
+            for name, value in vars(builtins).items()
+            if name not in self.RESTRICTED_BUILTINS
+        }
+
+        def restricted_import(name, globals=None, locals=None, fromlist=(), level=0):
+            if level != 0 or name.split(".")[0] not in self.ALLOWED_IMPORTS:
+                raise ImportError(f"Import of '{name}' is not allowed")
+            return builtins.__import__(name, globals, locals, fromlist, level)
+
+        safe["__import__"] = restricted_import
+        safe["print"] = lambda *args, **kwargs: None
+        return safe
+
+    def _test_in_process(
+        self, code: CodeType, test_params: Optional[Dict[str, Any]]
+    ) -> Tuple[bool, str]:
+        """Run a test on a daemon thread in this process, bounded by the timeout."""
+        outcome: List[Tuple[bool, str]] = []
+
+        def run():
+            outcome.append(
+                sandbox_worker.run_request(
+                    code,
+                    test_params or {},
+                    builtins=self._safe_builtins(),
+                    capture_stdout=False,
+                )
+            )
+
+        thread = threading.Thread(target=run, daemon=True)
+        thread.start()
+        thread.join(self.timeout_seconds)
+
+        if not outcome:
+            return (
+                False,
+                f"Code execution timed out after {self.timeout_seconds} seconds",
+            )
+
+        success, output = outcome[0]
+        if success:
+            return True, output
+        return False, f"Code execution failed: {output}"
+
+    def close(self):
+        """Stop the sandbox worker process if it is running."""
+        with self._lock:
+            self._stop_worker()
+
+    def _ensure_worker(self) -> subprocess.Popen:
+        """Start the sandbox worker if it is not already running."""
+        if self._worker is not None and self._worker.poll() is None:
+            return self._worker
+
+        self._worker = subprocess.Popen(
+            [sys.executable, "-u", self.WORKER_SCRIPT],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            bufsize=1,
+        )
+        self._worker_responses = queue.Queue()
+
+        # Read responses on a helper thread so waiting for one can time out
+        def read_responses(stdout, responses):
+            for line in stdout:
+                responses.put(line)
+            responses.put(None)  # Worker exited
+
+        threading.Thread(
+            target=read_responses,
+            args=(self._worker.stdout, self._worker_responses),
+            daemon=True,
+        ).start()
+        return self._worker
+
+    def _stop_worker(self):
+        """Kill the sandbox worker so the next test starts a fresh one."""
+        if self._worker is None:
+            return
+        try:
+            self._worker.kill()
+            self._worker.wait(timeout=1)
+        except Exception:
+            pass
+        self._worker = None
+
+    def _test_in_worker(
+        self,
+        worker: subprocess.Popen,
+        function_code: str,
+        test_params: Optional[Dict[str, Any]],
+    ) -> Tuple[bool, str]:
+        """Send one test request to the sandbox worker and wait for its answer."""
+        request = json.dumps({"code": function_code, "params": test_params or {}})
+
+        try:
+            worker.stdin.write(request + "\n")
+            worker.stdin.flush()
+            line = self._worker_responses.get(timeout=self.timeout_seconds)
+        except queue.Empty:
+            self._stop_worker()
+            return (
+                False,
+                f"Code execution timed out after {self.timeout_seconds} seconds",
+            )
+        except (OSError, ValueError) as e:
+            self._stop_worker()
+            return False, f"Failed to test code: {str(e)}"
+
+        if line is None:
+            self._stop_worker()
+            return False, "Code execution failed: sandbox worker exited unexpectedly"
+
+        try:
+            response = json.loads(line)
+            success, output = response["success"], response["output"]
+        except (ValueError, KeyError, TypeError):
+            # The worker's output is out of step with the requests; start over
+            self._stop_worker()
+            return False, "Code execution failed: invalid response from sandbox worker"
+
+        if success:
+            return True, output
+        return False, f"Code execution failed: {output}"
+
+    def _test_in_new_interpreter(
+        self, function_code: str, test_params: Optional[Dict[str, Any]] = None
+    ) -> Tuple[bool, str]:
+        """Test code by running a one-shot script in a new Python interpreter."""
+        # Create a test script with the function code indented into its body
+        indented_code = textwrap.indent(function_code, "    ")
 
         test_script = f"""
 import json
@@ -85,7 +656,7 @@ def log(message):
     logged_messages.append(str(message))
 
 # Allow basic imports only
-allowed_imports = {self.allowed_imports}
+allowed_imports = {tuple(sorted(self.ALLOWED_IMPORTS))}
 
 try:
     # The generated function code
@@ -118,15 +689,11 @@ except Exception as e:
     sys.exit(1)
 """
 
-        # Write to a temporary file
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-            f.write(test_script)
-            temp_file = f.name
-
         try:
-            # Run the test script in isolation
+            # Run the test script in isolation, fed through stdin instead of a temp file
             result = subprocess.run(
-                ["python", temp_file],
+                [sys.executable, "-"],
+                input=test_script,
                 capture_output=True,
                 text=True,
                 timeout=self.timeout_seconds,
@@ -147,25 +714,133 @@ except Exception as e:
             )
         except Exception as e:
             return False, f"Failed to test code: {str(e)}"
-        finally:
-            # Clean up temp file
-            try:
-                os.unlink(temp_file)
-            except:
-                pass
 
 
 class IncrementalSkillGenerator:
     """Generates skills using multiple focused AI prompts."""
 
-    def __init__(self, model: str = "gemma3:4b", analysis_model: Optional[str] = None):
-        """Initialize the incremental skill generator."""
+    # How long Ollama keeps the models loaded after each generation request
+    KEEP_ALIVE = "10m"
+
+    # Cache of validated function code, stored next to the skills it produced
+    CACHE_FILENAME = ".llm_cache.sqlite"
+    # Compiled code of function code that passed the safety checks
+    COMPILE_CACHE_DIRNAME = ".skill_compile_cache"
+
+    # Embedding model used to spot near-duplicate generated ideas
+    EMBEDDING_MODEL = "nomic-embed-text"
+    # Cosine similarity above which two ideas count as the same idea
+    DUPLICATE_IDEA_SIMILARITY = 0.92
+    # Generated ideas to try before accepting a near-duplicate
+    MAX_IDEA_ATTEMPTS = 3
+    # Cosine similarity above which a past skill's plan serves as a template
+    TEMPLATE_IDEA_SIMILARITY = 0.85
+
+    # Share of vibe test answers that must pick the skill for it to pass
+    VIBE_PASS_THRESHOLD = 0.5
+
+    # Short-answer steps cap the output length and stop right after the answer
+    # instead of letting the model run on with examples or explanations
+    NAME_OPTIONS = {"temperature": 0.0, "num_predict": 8, "stop": ["\n"]}
+    ROLE_OPTIONS = {"temperature": 0.0, "num_predict": 4, "stop": ["\n", "."]}
+    DESCRIPTION_OPTIONS = {"num_predict": 80, "stop": ["\n\n"]}
+
+    # A 5-15 line function fits well within this; longer output is a runaway
+    CODE_OPTIONS = {"num_predict": 512}
+
+    # Streamed code is abandoned if none of these markers appear this early
+    CODE_START_CHARS = 400
+    CODE_START_MARKERS = ("def ", "import ", "```")
+
+    # Shared by every step for the same idea, so Ollama can reuse the already
+    # processed prompt prefix; the step prompts only carry the task itself.
+    # The static text comes first and the idea last, so consecutive skills in
+    # a batch share the longest possible prefix as well.
+    SYSTEM_PROMPT_PREFIX = """You are planning a SIMPLE skill (a small Python function) for an AI assistant.
+
+Guidelines:
+- Keep it simple, basic and focused on one common user need
+- Follow the DRY principle - do NOT duplicate existing skills
+
+"""
+
+    def __init__(
+        self,
+        model: str = "gemma3:4b",
+        analysis_model: Optional[str] = None,
+        verbose: bool = True,
+        deterministic: bool = False,
+    ):
+        """Initialize the incremental skill generator.
+
+        Args:
+            model: Generation model to use
+            analysis_model: Model for classification steps and vibe tests
+            verbose: Whether to print step-by-step progress
+            deterministic: Vibe test with temperature 0, asking each phrase once
+                since repeated iterations would get the same answer
+        """
         self.model = model
+        self.verbose = verbose
+        self.deterministic = deterministic
+        self._print_lock = threading.Lock()
         self.analysis_model = analysis_model or model
-        self.client = OllamaClient()
+        # Keep models loaded between the many short requests of a generation run
+        self.client = OllamaClient(keep_alive=self.KEEP_ALIVE)
         self.ai_query = AIQuery(self.client, model)
+        # Classification-style steps (name, role) go to the analysis model
+        self.analysis_query = AIQuery(self.client, self.analysis_model)
         self.skill_registry = SkillRegistry()
-        self.code_executor = SafeCodeExecutor()
+        self._registry_lock = threading.Lock()
+        self.llm_cache = LLMCache(
+            os.path.join(self.skill_registry.skills_dir, self.CACHE_FILENAME)
+        )
+        self.code_executor = SafeCodeExecutor(
+            cache_dir=os.path.join(
+                self.skill_registry.skills_dir, self.COMPILE_CACHE_DIRNAME
+            )
+        )
+        # Concurrent requests to send to Ollama, matching its OLLAMA_NUM_PARALLEL
+        self.max_parallel_requests = max(
+            1, int(os.environ.get("OLLAMA_NUM_PARALLEL", "4"))
+        )
+        # Shared by every vibe test instead of starting threads for each skill
+        self._vibe_pool = ThreadPoolExecutor(
+            max_workers=self.max_parallel_requests, thread_name_prefix="vibe-test"
+        )
+        # Generated ideas with their unit-length embeddings, for duplicate checks
+        self.seen_ideas: List[Tuple[str, List[float]]] = []
+        # Successful plans with their idea embeddings, reused for similar ideas
+        self.skill_templates: List[Tuple[List[float], SkillPlan]] = []
+        self._idea_embeddings: Dict[str, List[float]] = {}
+        self._ideas_lock = threading.Lock()
+        self._embeddings_available = True
+
+    def _print(self, *args, **kwargs):
+        """Print progress output unless the generator is quiet.
+
+        Skills are generated concurrently, so whole lines are written under a
+        lock to keep them from interleaving mid-line.
+        """
+        if self.verbose:
+            with self._print_lock:
+                print(*args, **kwargs)
+
+    def warm_up_models(self):
+        """Load the generation and analysis models before the first request."""
+        for model in dict.fromkeys([self.model, self.analysis_model]):
+            self.client.load_model(model)
+
+    def release_models(self):
+        """Unload the generation and analysis models once generation is done."""
+        for model in dict.fromkeys([self.model, self.analysis_model]):
+            self.client.unload_model(model)
+
+    def close(self):
+        """Stop the vibe test threads and sandbox worker and close the cache."""
+        self._vibe_pool.shutdown()
+        self.code_executor.close()
+        self.llm_cache.close()
 
     def get_existing_skills_summary(self) -> str:
         """Get a summary of existing skills to avoid duplication."""
@@ -183,11 +858,20 @@ class IncrementalSkillGenerator:
             skill_summaries[:15]
         )  # Show max 15 for context
 
-    def generate_skill_idea(self) -> str:
-        """Step 1: Generate a focused, simple, unique skill idea."""
-        existing_skills = self.get_existing_skills_summary()
+    def _skill_idea_prompt(self, count: int = 1) -> str:
+        """Build the prompt asking for one skill idea, or several distinct ones."""
+        if count == 1:
+            ask = (
+                "Generate ONE specific, simple, useful skill idea for an AI assistant."
+            )
+            answer = """Based on the existing skills above, generate ONE simple skill idea that doesn't already exist.
+Respond with just the skill idea in one clear sentence. Keep it simple and basic."""
+        else:
+            ask = f"Generate {count} DIFFERENT specific, simple, useful skill ideas for an AI assistant."
+            answer = f"""Based on the existing skills above, generate {count} simple skill ideas that don't already exist and are all different from each other.
+Respond with one clear sentence per idea, one idea per line and nothing else. Keep them simple and basic."""
 
-        prompt = f"""Generate ONE specific, simple, useful skill idea for an AI assistant.
+        return f"""{ask}
 
 IMPORTANT GUIDELINES:
 1. START SIMPLE - Choose basic, straightforward tasks first
@@ -195,7 +879,7 @@ IMPORTANT GUIDELINES:
 3. Be practical and focused on common user needs
 4. Avoid complex operations that require multiple steps
 
-{existing_skills}
+{self.get_existing_skills_summary()}
 
 Good SIMPLE skill ideas (start with these types):
 - "Count words in text"
@@ -212,50 +896,224 @@ Avoid complex ideas like:
 - Web scraping or API calls
 - Complex mathematical formulas
 
-Based on the existing skills above, generate ONE simple skill idea that doesn't already exist.
-Respond with just the skill idea in one clear sentence. Keep it simple and basic."""
+{answer}"""
 
-        result = self.ai_query.open(prompt, show_context=True)
+    def generate_skill_idea(self) -> str:
+        """Step 1: Generate a focused, simple, unique skill idea."""
+        result = self.ai_query.open(
+            self._skill_idea_prompt(), show_context=self.verbose
+        )
         return result.content.strip()
 
-    def generate_skill_name(self, idea: str) -> str:
-        """Step 2: Generate a skill name from the idea."""
+    def generate_skill_ideas(self, count: int) -> List[str]:
+        """Step 1 for a whole batch: ask for several distinct ideas at once.
+
+        Ideas that nearly duplicate each other or earlier ideas are dropped, so
+        fewer than count ideas may be returned; callers generate the rest one
+        at a time.
+        """
+        result = self.ai_query.open(
+            self._skill_idea_prompt(count), show_context=self.verbose
+        )
+        lines = _LIST_ITEM_RE.findall(result.content) or result.content.splitlines()
+
+        ideas: List[str] = []
+        for line in lines:
+            idea = line.strip().strip('"')
+            if not idea or idea in ideas:
+                continue
+            duplicate = self.find_similar_idea(idea)
+            if duplicate is not None:
+                self._print(f"♻️ '{idea}' duplicates '{duplicate}', skipping")
+                continue
+            ideas.append(idea)
+            if len(ideas) == count:
+                break
+        return ideas
+
+    def _embed_idea(self, idea: str) -> Optional[List[float]]:
+        """Return the unit-length embedding of an idea, if embeddings work.
+
+        If the embedding model is unavailable, embedding is switched off and
+        every idea is treated as unrelated to the others.
+        """
+        with self._ideas_lock:
+            if idea in self._idea_embeddings:
+                return self._idea_embeddings[idea]
+        if not self._embeddings_available:
+            return None
+
+        vector = self.client.embed(self.EMBEDDING_MODEL, idea)
+        if not vector:
+            self._print(f"⚠️ Embedding model {self.EMBEDDING_MODEL} unavailable")
+            self._print("   Skipping similar idea checks")
+            self._embeddings_available = False
+            return None
+
+        norm = math.sqrt(sum(x * x for x in vector))
+        if not norm:
+            return None
+        unit = [x / norm for x in vector]
+
+        with self._ideas_lock:
+            self._idea_embeddings[idea] = unit
+        return unit
+
+    def find_similar_idea(self, idea: str) -> Optional[str]:
+        """Return an earlier generated idea that this one nearly duplicates.
+
+        New ideas are remembered for later checks.
+        """
+        unit = self._embed_idea(idea)
+        if unit is None:
+            return None
+
+        with self._ideas_lock:
+            for seen_idea, seen_unit in self.seen_ideas:
+                similarity = sum(a * b for a, b in zip(unit, seen_unit))
+                if similarity > self.DUPLICATE_IDEA_SIMILARITY:
+                    return seen_idea
+            self.seen_ideas.append((idea, unit))
+        return None
+
+    def find_skill_template(self, idea: str) -> Optional[SkillPlan]:
+        """Return the most similar successfully generated plan, if close enough."""
+        if not self.skill_templates:
+            return None
+        unit = self._embed_idea(idea)
+        if unit is None:
+            return None
+
+        template, best = None, self.TEMPLATE_IDEA_SIMILARITY
+        with self._ideas_lock:
+            for template_unit, candidate in self.skill_templates:
+                similarity = sum(a * b for a, b in zip(unit, template_unit))
+                if similarity >= best:
+                    template, best = candidate, similarity
+        return template
+
+    def remember_skill_template(self, plan: SkillPlan):
+        """Keep a successful plan to build similar skills from."""
+        unit = self._embed_idea(plan.idea)
+        if unit is not None:
+            with self._ideas_lock:
+                self.skill_templates.append((unit, plan))
+
+    def skill_system_prompt(self, idea: str) -> str:
+        """Build the system prompt shared by all planning steps for an idea."""
+        # Plain concatenation: nothing in the idea is parsed as a placeholder
         existing_skills = self.get_existing_skills_summary()
+        return f'{self.SYSTEM_PROMPT_PREFIX}{existing_skills}\n\nSkill idea: "{idea}"'
+
+    def generate_plan_metadata(
+        self, idea: str, fields: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """Steps 2-6 in one request: name, description, role, phrases and parameters.
+
+        Uses Ollama's structured output so the fields arrive as one JSON object.
+        Fields that are missing or malformed are left out of the returned dict
+        so the caller can fall back to the dedicated step for just those fields.
+
+        Args:
+            idea: The skill idea
+            fields: Metadata fields to ask for (default: all of them)
+        """
+        fields = fields or PLAN_METADATA_FIELDS
+        field_lines = "\n".join(_PLAN_FIELD_PROMPTS[field] for field in fields)
+        prompt = f"""Plan the skill. Return a JSON object with these fields:
+{field_lines}
+
+The name, description and phrases must be DIFFERENT from existing skills."""
+
+        schema = {
+            "type": "object",
+            "properties": {
+                field: PLAN_METADATA_SCHEMA["properties"][field] for field in fields
+            },
+            "required": list(fields),
+        }
+        result = self.ai_query.structured(
+            prompt,
+            schema=schema,
+            show_context=self.verbose,
+            system=self.skill_system_prompt(idea),
+        )
+        metadata = self._normalize_plan_metadata(result.data)
+        return {field: metadata[field] for field in fields if field in metadata}
+
+    @staticmethod
+    def _normalize_plan_metadata(data: Any) -> Dict[str, Any]:
+        """Keep only well-formed metadata fields from a structured response."""
+        if not isinstance(data, dict):
+            return {}
+
+        metadata: Dict[str, Any] = {}
 
-        prompt = f"""Based on this skill idea: "{idea}"
+        name = data.get("name")
+        if isinstance(name, str) and _SKILL_NAME_RE.match(name.strip().lower()):
+            metadata["name"] = name.strip().lower()
 
-Generate a good, UNIQUE function name for this skill.
+        description = data.get("description")
+        if isinstance(description, str) and description.strip():
+            metadata["description"] = description.strip().strip('"').strip("'")
 
-Rules:
-- Use only lowercase letters, numbers, and underscores
-- Be descriptive but concise  
-- Follow Python naming conventions
-- Should be 2-3 words joined by underscores (keep it simple)
-- Must NOT conflict with existing skill names
+        role = data.get("role")
+        if role in SKILL_ROLES:
+            metadata["role"] = role
 
-Existing skill names to AVOID:
-{existing_skills}
+        phrases = data.get("vibe_test_phrases")
+        if isinstance(phrases, list):
+            phrases = [p.strip() for p in phrases if isinstance(p, str) and p.strip()]
+            if phrases:
+                metadata["vibe_test_phrases"] = phrases[:5]
 
-Examples of good simple names:
-- "count_words"
-- "reverse_text"
-- "check_even"
-- "convert_temp"
+        parameters = data.get("parameters")
+        if _is_valid_parameters(parameters):
+            metadata["parameters"] = parameters
+
+        return metadata
+
+    def _generate_missing_metadata(
+        self, idea: str, fields: List[str], name: str = ""
+    ) -> Dict[str, Any]:
+        """Generate individual plan fields with their dedicated step prompts.
+
+        Each step only depends on the idea (and the name, when already known),
+        so the requests are issued concurrently and total latency is roughly
+        that of the slowest step.
+        """
+        steps = {
+            "name": lambda: self.generate_skill_name(idea),
+            "description": lambda: self.generate_skill_description(idea),
+            "role": lambda: self.generate_skill_role(idea),
+            "vibe_test_phrases": lambda: self.generate_vibe_test_phrases(idea, name),
+            "parameters": lambda: self.generate_parameters(idea, name),
+        }
+        requested = [field for field in fields if field in steps]
+        if not requested:
+            return {}
 
-Respond with ONLY the function name, nothing else."""
+        with ThreadPoolExecutor(max_workers=len(requested)) as executor:
+            futures = {field: executor.submit(steps[field]) for field in requested}
+            return {field: future.result() for field, future in futures.items()}
 
-        result = self.ai_query.single_word(
-            question=f"Function name for: {idea}", show_context=True
+    def generate_skill_name(self, idea: str) -> str:
+        """Step 2: Generate a skill name from the idea."""
+        result = self.analysis_query.single_word(
+            question=(
+                "What is a good, UNIQUE function name for this skill? Use 2-3 "
+                "lowercase words joined by underscores (e.g. count_words) that "
+                "do not conflict with existing skill names."
+            ),
+            show_context=self.verbose,
+            system=self.skill_system_prompt(idea),
+            model_options=self.NAME_OPTIONS,
         )
         return result.word
 
     def generate_skill_description(self, idea: str) -> str:
         """Step 3: Generate a clear skill description."""
-        existing_skills = self.get_existing_skills_summary()
-
-        prompt = f"""Based on this skill idea: "{idea}"
-
-Write a clear, simple description of when this skill should be used.
+        prompt = """Write a clear, simple description of when this skill should be used.
 
 The description should:
 - Be 10-30 words (keep it simple)
@@ -264,8 +1122,6 @@ The description should:
 - Use simple, clear language
 - Be different from existing skills
 
-{existing_skills}
-
 Example good descriptions:
 - "Use when the user wants to count words in a text"
 - "Use when the user needs to reverse a string"
@@ -273,57 +1129,34 @@ Example good descriptions:
 
 Respond with ONLY the description, nothing else."""
 
-        result = self.ai_query.open(prompt, show_context=True)
+        result = self.ai_query.open(
+            prompt,
+            show_context=self.verbose,
+            system=self.skill_system_prompt(idea),
+            model_options=self.DESCRIPTION_OPTIONS,
+        )
         return result.content.strip().strip('"').strip("'")
 
     def generate_skill_role(self, idea: str) -> str:
         """Step 4: Determine the skill's role category."""
-        prompt = f"""Based on this skill idea: "{idea}"
-
-What category does this skill belong to?
-
-Choose from these options:
-A. text_processing
-B. mathematics
-C. data_analysis
-D. file_operations
-E. web_utilities
-F. time_date
-G. formatting
-H. validation
-I. general
-
-Respond with ONLY the letter (A, B, C, etc.)"""
-
-        result = self.ai_query.multiple_choice(
+        result = self.analysis_query.multiple_choice(
             question="What category does this skill belong to?",
-            options=[
-                "text_processing",
-                "mathematics",
-                "data_analysis",
-                "file_operations",
-                "web_utilities",
-                "time_date",
-                "formatting",
-                "validation",
-                "general",
-            ],
-            show_context=True,
+            options=SKILL_ROLES,
+            show_context=self.verbose,
+            system=self.skill_system_prompt(idea),
+            model_options=self.ROLE_OPTIONS,
         )
         return result.value
 
     def generate_vibe_test_phrases(self, idea: str, name: str) -> List[str]:
         """Step 5: Generate vibe test phrases."""
-        existing_skills = self.get_existing_skills_summary()
-
-        prompt = f"""Based on this SIMPLE skill: "{idea}" (function name: {name})
+        prompt = f"""The skill's function name is {name}.
 
 Generate 5 realistic, simple things a user might say that should trigger this skill.
 
 Make them natural, varied user requests. For simple skills, users ask simple questions.
 
-IMPORTANT: Make sure these phrases are DIFFERENT from existing skills:
-{existing_skills}
+IMPORTANT: Make sure these phrases are DIFFERENT from existing skills.
 
 For simple skills, users typically ask:
 - Direct questions: "How many words are in this?"
@@ -339,25 +1172,16 @@ Format as a simple numbered list:
 
 Include the full list, nothing else."""
 
-        result = self.ai_query.open(prompt)
+        result = self.ai_query.open(
+            prompt, show_context=self.verbose, system=self.skill_system_prompt(idea)
+        )
 
         # Parse the numbered list
-        phrases = []
-        lines = result.content.strip().split("\n")
-        for line in lines:
-            line = line.strip()
-            if line and (line[0].isdigit() or line.startswith("-")):
-                # Remove number and clean up
-                phrase = line.split(".", 1)[-1].strip()
-                phrase = phrase.strip("-").strip()
-                if phrase:
-                    phrases.append(phrase)
-
-        return phrases[:5]  # Ensure max 5 phrases
+        return _LIST_ITEM_RE.findall(result.content)[:5]  # Ensure max 5 phrases
 
     def generate_parameters(self, idea: str, name: str) -> Dict[str, Dict[str, Any]]:
         """Step 6: Generate function parameters."""
-        prompt = f"""Based on this skill: "{idea}" (function name: {name})
+        prompt = f"""The skill's function name is {name}.
 
 What input parameters does this function need?
 
@@ -376,22 +1200,24 @@ Examples:
 
 Respond with ONLY the JSON, nothing else."""
 
-        result = self.ai_query.open(prompt)
+        # Structured output guarantees a JSON object shaped like the schema
+        result = self.ai_query.structured(
+            prompt,
+            schema=PARAMETERS_SCHEMA,
+            show_context=self.verbose,
+            system=self.skill_system_prompt(idea),
+        )
+        return result.data if _is_valid_parameters(result.data) else {}
+
+    def generate_function_code(
+        self, plan: SkillPlan, template: Optional[SkillPlan] = None
+    ) -> str:
+        """Step 7: Generate the function code.
 
-        try:
-            # Clean the response and parse JSON
-            content = result.content.strip()
-            if content.startswith("```json"):
-                content = content.split("```json")[1].split("```")[0]
-            elif content.startswith("```"):
-                content = content.split("```")[1].split("```")[0]
-
-            return json.loads(content)
-        except:
-            return {}  # Default to no parameters if parsing fails
-
-    def generate_function_code(self, plan: SkillPlan) -> str:
-        """Step 7: Generate the function code."""
+        Args:
+            plan: The plan to implement
+            template: Optional similar skill whose code is offered as a starting point
+        """
         params_desc = ""
         if plan.parameters:
             param_list = []
@@ -411,11 +1237,8 @@ Respond with ONLY the JSON, nothing else."""
         else:
             params_desc = "No parameters required"
 
-        existing_skills = self.get_existing_skills_summary()
-
         prompt = f"""Write a SIMPLE Python function for this basic skill:
 
-Idea: {plan.idea}
 Function name: execute
 Description: {plan.description}
 {params_desc}
@@ -431,9 +1254,6 @@ IMPORTANT - Keep it SIMPLE:
 8. Only import basic modules if needed: math, json, re
 9. Make it different from existing skills
 
-Existing skills to avoid duplicating:
-{existing_skills}
-
 For simple skills, the code should be straightforward:
 - Input validation
 - Simple operation
@@ -442,10 +1262,26 @@ For simple skills, the code should be straightforward:
 
 Write ONLY the function code, no explanations:"""
 
-        result = self.ai_query.open(prompt)
+        if template is not None and template.function_code:
+            prompt = f"""A similar skill ("{template.idea}") was implemented like this:
+{template.function_code}
+
+Adapt it for this skill rather than starting from scratch.
+
+{prompt}"""
+
+        system = self.skill_system_prompt(plan.idea)
+
+        # Code that already passed validation for this exact prompt is reused
+        plan.code_cache_key = LLMCache.make_key(self.model, f"{system}\n\n{prompt}")
+        cached = self.llm_cache.get(plan.code_cache_key)
+        if cached is not None:
+            self._print("♻️ Reusing validated function code from the cache")
+            return cached
+
+        content = self._stream_function_code(prompt, system).strip()
 
         # Clean the response
-        content = result.content.strip()
         if content.startswith("```python"):
             content = content.split("```python")[1].split("```")[0]
         elif content.startswith("```"):
@@ -453,6 +1289,32 @@ Write ONLY the function code, no explanations:"""
 
         return content.strip()
 
+    def _stream_function_code(self, prompt: str, system: str) -> str:
+        """Stream the code response, stopping early if it is clearly not code.
+
+        An abandoned response is returned as-is; it fails validation as
+        missing code, so only the code step is retried.
+        """
+        chunks = self.ai_query.open_stream(
+            prompt,
+            show_context=self.verbose,
+            system=system,
+            model_options=self.CODE_OPTIONS,
+        )
+        content = ""
+        checked = False
+        try:
+            for chunk in chunks:
+                content += chunk
+                if not checked and len(content) >= self.CODE_START_CHARS:
+                    checked = True
+                    if not any(m in content for m in self.CODE_START_MARKERS):
+                        self._print("⚠️ Response does not look like code, stopping")
+                        break
+        finally:
+            chunks.close()
+        return content
+
     def build_skill_plan(self, idea: Optional[str] = None) -> SkillPlan:
         """Build a complete skill plan step by step."""
         plan = SkillPlan()
@@ -460,75 +1322,108 @@ Write ONLY the function code, no explanations:"""
         try:
             # Show existing skills context
             existing_count = len(self.skill_registry.get_all_skills())
-            print(f"📚 Context: {existing_count} existing skills in registry")
-            print("🎯 Following DRY principle - avoiding duplication")
-            print("🚀 Prioritizing SIMPLE skills first")
-            print()
+            self._print(f"📚 Context: {existing_count} existing skills in registry")
+            self._print("🎯 Following DRY principle - avoiding duplication")
+            self._print("🚀 Prioritizing SIMPLE skills first")
+            self._print()
 
             # Step 1: Generate or use provided idea
             if idea:
                 plan.idea = idea
-                print(f"📝 Using provided idea: {idea}")
-                print("🔍 Checking against existing skills for uniqueness...")
+                self._print(f"📝 Using provided idea: {idea}")
+                self._print("🔍 Checking against existing skills for uniqueness...")
             else:
-                print("🎯 Generating simple, unique skill idea...")
-                plan.idea = self.generate_skill_idea()
-                print(f"💡 Generated idea: {plan.idea}")
-                print("✅ Verified uniqueness against existing skills")
+                self._print("🎯 Generating simple, unique skill idea...")
+                for _ in range(self.MAX_IDEA_ATTEMPTS):
+                    plan.idea = self.generate_skill_idea()
+                    duplicate = self.find_similar_idea(plan.idea)
+                    if duplicate is None:
+                        break
+                    self._print(
+                        f"♻️ '{plan.idea}' duplicates '{duplicate}', trying again"
+                    )
+                self._print(f"💡 Generated idea: {plan.idea}")
+                self._print("✅ Verified uniqueness against existing skills")
+
+            # A similar earlier skill already settled the role and parameters
+            metadata: Dict[str, Any] = {}
+            template = self.find_skill_template(plan.idea)
+            if template is not None:
+                self._print(f"🧬 Building on similar skill '{template.name}'")
+                metadata = {
+                    "role": template.role,
+                    "parameters": copy.deepcopy(template.parameters),
+                }
 
-            # Step 2: Generate name
-            print("🔧 Generating skill name...")
-            plan.name = self.generate_skill_name(plan.idea)
-            print(f"📛 Name: {plan.name}")
+            # Steps 2-6: Generate name, description, role, phrases and parameters
+            self._print("🧩 Generating skill plan metadata...")
+            metadata.update(
+                self.generate_plan_metadata(
+                    plan.idea, [f for f in PLAN_METADATA_FIELDS if f not in metadata]
+                )
+            )
+            missing = [f for f in PLAN_METADATA_FIELDS if f not in metadata]
+            if missing:
+                self._print(
+                    f"↩️ Generating remaining fields step by step: {', '.join(missing)}"
+                )
+                metadata.update(
+                    self._generate_missing_metadata(
+                        plan.idea, missing, metadata.get("name", "")
+                    )
+                )
 
-            # Step 3: Generate description
-            print("📝 Generating description...")
-            plan.description = self.generate_skill_description(plan.idea)
-            print(f"📋 Description: {plan.description}")
+            plan.name = metadata["name"]
+            self._print(f"📛 Name: {plan.name}")
 
-            # Step 4: Generate role
-            print("🏷️ Determining role category...")
-            plan.role = self.generate_skill_role(plan.idea)
-            print(f"🎭 Role: {plan.role}")
+            plan.description = metadata["description"]
+            self._print(f"📋 Description: {plan.description}")
 
-            # Step 5: Generate vibe test phrases
-            print("🧪 Generating vibe test phrases...")
-            plan.vibe_test_phrases = self.generate_vibe_test_phrases(
-                plan.idea, plan.name
-            )
-            print(f"💬 Generated {len(plan.vibe_test_phrases)} test phrases")
+            plan.role = metadata["role"]
+            self._print(f"🎭 Role: {plan.role}")
+
+            plan.vibe_test_phrases = metadata["vibe_test_phrases"]
+            self._print(f"💬 Generated {len(plan.vibe_test_phrases)} test phrases")
 
-            # Step 6: Generate parameters
-            print("⚙️ Generating parameters...")
-            plan.parameters = self.generate_parameters(plan.idea, plan.name)
+            plan.parameters = metadata["parameters"]
             param_count = len(plan.parameters)
-            print(
+            self._print(
                 f"🔧 Parameters: {param_count} {'parameter' if param_count == 1 else 'parameters'}"
             )
 
+            # Don't spend the code generation on a plan that already failed;
+            # repair_plan generates the code once the metadata is fixed
+            if self.check_plan_metadata(plan):
+                self._print("⏭️ Skipping code generation until the plan is fixed")
+                return plan
+
             # Step 7: Generate function code
-            print("💻 Generating simple function code...")
-            plan.function_code = self.generate_function_code(plan)
+            self._print("💻 Generating simple function code...")
+            plan.function_code = self.generate_function_code(plan, template)
             lines_count = len(plan.function_code.splitlines())
-            print(f"✅ Generated {lines_count} lines of code")
+            self._print(f"✅ Generated {lines_count} lines of code")
 
             if lines_count > 20:
-                print("⚠️  Code is longer than expected for a simple skill")
+                self._print("⚠️  Code is longer than expected for a simple skill")
             else:
-                print("✅ Code length appropriate for simple skill")
+                self._print("✅ Code length appropriate for simple skill")
 
             return plan
 
         except Exception as e:
-            print(f"❌ Error building plan: {e}")
+            self._print(f"❌ Error building plan: {e}")
             raise
 
-    def validate_and_test_plan(self, plan: SkillPlan) -> Tuple[bool, List[str]]:
-        """Validate and safely test a skill plan."""
+    @staticmethod
+    def check_plan_metadata(plan: SkillPlan) -> List[str]:
+        """Cheap checks of the plan fields that are not code.
+
+        All failures are reported, not just the first, so one repair can
+        regenerate every failing field.
+        """
         errors = []
 
-        # Basic validation
-        if not plan.name or not plan.name.replace("_", "").isalnum():
+        if not plan.name or not _IDENTIFIER_RE.match(plan.name):
             errors.append("Invalid skill name")
 
         if not plan.description or len(plan.description) < 10:
@@ -537,72 +1432,188 @@ Write ONLY the function code, no explanations:"""
         if not plan.vibe_test_phrases or len(plan.vibe_test_phrases) < 3:
             errors.append("Need at least 3 vibe test phrases")
 
-        if not plan.function_code or "def execute" not in plan.function_code:
-            errors.append("Function code missing or invalid")
+        return errors
 
+    def validate_and_test_plan(self, plan: SkillPlan) -> Tuple[bool, List[str]]:
+        """Validate and safely test a skill plan.
+
+        Checks run cheapest first and stop at the first stage that fails:
+        plan metadata, then code presence, then the safety check and test run.
+        """
+        errors = self.check_plan_metadata(plan)
         if errors:
             return False, errors
 
+        # Responses that never define execute (prose, a bare expression,
+        # runaway output) fail here without being parsed
+        if not _EXECUTE_DEF_RE.search(plan.function_code):
+            return False, ["Function code missing or invalid"]
+
+        # Look for a real top-level definition; the word "execute" in a
+        # string or comment is not enough
+        try:
+            tree = ast.parse(plan.function_code)
+        except SyntaxError as e:
+            return False, [f"Function code missing or invalid: {e}"]
+        if not any(
+            isinstance(node, ast.FunctionDef) and node.name == "execute"
+            for node in tree.body
+        ):
+            return False, ["Function code missing or invalid"]
+
         # Test code safely
-        print("🔒 Testing code safely...")
-        success, output = self.code_executor.test_code_safely(plan.function_code, {})
+        self._print("🔒 Testing code safely...")
+        code, safety_error = self.code_executor.compile_checked(
+            plan.function_code, tree
+        )
+        if safety_error:
+            errors.append(f"Code execution failed: {safety_error}")
+            return False, errors
+
+        success, output = self.code_executor.test_code_safely(
+            plan.function_code, {}, code=code
+        )
 
         if not success:
             errors.append(f"Code execution failed: {output}")
             return False, errors
 
-        print("✅ Code tested successfully")
+        self._print("✅ Code tested successfully")
+        plan.compiled_code = code
         return True, []
 
-    def run_isolated_vibe_test(self, skill: Skill) -> Tuple[bool, Dict[str, Any]]:
-        """Run vibe test for a single skill."""
-        print("🧪 Running vibe tests...")
-
-        # Create analysis engine
-        analysis_engine = AnalysisEngine(self.analysis_model, self.client)
+    @staticmethod
+    def classify_validation_errors(errors: List[str]) -> Set[str]:
+        """Map validation error messages to categories ("OTHER" if unknown)."""
+        categories = set()
+        for error in errors:
+            for prefix, category in VALIDATION_ERROR_CATEGORIES.items():
+                if error.startswith(prefix):
+                    categories.add(category)
+                    break
+            else:
+                categories.add("OTHER")
+        return categories
 
-        total_correct = 0
-        total_tests = 0
-        phrase_results = {}
+    def repair_plan(self, plan: SkillPlan, categories: Set[str]):
+        """Regenerate only the parts of a plan that failed validation."""
+        if "NAME_INVALID" in categories:
+            plan.name = self.generate_skill_name(plan.idea)
+            self._print(f"📛 Name: {plan.name}")
+        if "DESC_TOO_SHORT" in categories:
+            plan.description = self.generate_skill_description(plan.idea)
+            self._print(f"📋 Description: {plan.description}")
+        if "PHRASES_MISSING" in categories:
+            plan.vibe_test_phrases = self.generate_vibe_test_phrases(
+                plan.idea, plan.name
+            )
+            self._print(f"💬 Generated {len(plan.vibe_test_phrases)} test phrases")
+        if not plan.function_code or categories & {
+            "CODE_MISSING_DEF",
+            "CODE_RUNTIME_ERROR",
+        }:
+            plan.function_code = self.generate_function_code(plan)
+            self._print(
+                f"✅ Generated {len(plan.function_code.splitlines())} lines of code"
+            )
 
-        for phrase in skill.vibe_test_phrases[:3]:  # Test first 3 phrases
-            correct = 0
-            iterations = 2  # Keep it simple - 2 iterations per phrase
+    @staticmethod
+    def _vibe_test_prompt(skill: Skill, phrases: List[str]) -> str:
+        """Build one question asking which phrases should trigger a skill."""
+        numbered = "\n".join(f"{i}. {phrase}" for i, phrase in enumerate(phrases, 1))
+        return f"""For each input below, answer whether the '{skill.name}' skill should be used.
 
-            for i in range(iterations):
-                try:
-                    prompt = f"""Should the '{skill.name}' skill be used for: "{phrase}"?
-                    
 Skill description: {skill.description}
 
-Answer only 'yes' or 'no'."""
+Reply with a JSON array of {len(phrases)} booleans in the same order (true = use it).
+{numbered}"""
 
-                    response = analysis_engine.ask_yes_no_question(
-                        prompt, show_context=False
-                    )
-                    if response:
-                        correct += 1
-                        total_correct += 1
-                    total_tests += 1
+    def run_isolated_vibe_test(self, skill: Skill) -> Tuple[bool, Dict[str, Any]]:
+        """Run vibe test for a single skill."""
+        self._print("🧪 Running vibe tests...")
+
+        phrases = skill.vibe_test_phrases[:3]  # Test first 3 phrases
+        iterations = 2  # Keep it simple - 2 iterations per phrase
+
+        # One request answers every phrase, constrained to a boolean per phrase
+        prompt = self._vibe_test_prompt(skill, phrases)
+        schema = {
+            "type": "array",
+            "items": {"type": "boolean"},
+            "minItems": len(phrases),
+            "maxItems": len(phrases),
+        }
 
-                except Exception as e:
-                    print(f"⚠️ Vibe test error: {e}")
-                    total_tests += 1
+        # Greedy decoding gives the same answers every time, so one request
+        # stands in for all of the iterations
+        asked = 1 if self.deterministic else iterations
+        options = {"temperature": 0.0} if self.deterministic else None
 
-            success_rate = (correct / iterations) * 100 if iterations > 0 else 0
+        def ask() -> List[bool]:
+            try:
+                result = self.analysis_query.structured(
+                    prompt,
+                    schema=schema,
+                    show_context=False,
+                    system=VIBE_TEST_SYSTEM_PROMPT,
+                    model_options=options,
+                )
+            except Exception as e:
+                self._print(f"⚠️ Vibe test error: {e}")
+                return [False] * len(phrases)
+            answers = result.data if isinstance(result.data, list) else []
+            # Missing or non-boolean answers count as "no"
+            return [
+                i < len(answers) and answers[i] is True for i in range(len(phrases))
+            ]
+
+        # Iterations are independent requests, so send them concurrently and
+        # stop as soon as the outcome is settled either way
+        weight = iterations // asked
+        planned = len(phrases) * iterations
+        needed = planned * self.VIBE_PASS_THRESHOLD
+        futures = [self._vibe_pool.submit(ask) for _ in range(asked)]
+
+        total_correct = 0
+        remaining = planned
+        correct_by_phrase = dict.fromkeys(phrases, 0)
+        tests_by_phrase = dict.fromkeys(phrases, 0)
+        for future in as_completed(futures):
+            for phrase, answer in zip(phrases, future.result()):
+                remaining -= weight
+                tests_by_phrase[phrase] += weight
+                if answer:
+                    total_correct += weight
+                    correct_by_phrase[phrase] += weight
+            if total_correct >= needed or total_correct + remaining < needed:
+                break
+        for future in futures:
+            future.cancel()
+
+        if remaining:
+            self._print(f"⏭️ Outcome settled, skipped {remaining} vibe tests")
+
+        total_tests = planned - remaining
+        phrase_results = {}
+
+        for phrase in phrases:
+            correct = correct_by_phrase[phrase]
+            tests = tests_by_phrase[phrase]
+
+            success_rate = (correct / tests) * 100 if tests > 0 else 0
             phrase_results[phrase] = {
                 "correct": correct,
-                "total": iterations,
+                "total": tests,
                 "success_rate": success_rate,
             }
 
             status = "✅" if success_rate >= 50 else "❌"
-            print(f"  {status} '{phrase[:40]}...': {correct}/{iterations}")
+            self._print(f"  {status} '{phrase[:40]}...': {correct}/{tests}")
 
         overall_success = (total_correct / total_tests) * 100 if total_tests > 0 else 0
-        passed = overall_success >= 50.0
+        passed = planned > 0 and total_correct >= needed
 
-        print(
+        self._print(
             f"🎯 Overall vibe test: {total_correct}/{total_tests} ({overall_success:.0f}%)"
         )
 
@@ -614,9 +1625,19 @@ Answer only 'yes' or 'no'."""
         }
 
     def generate_skill(
-        self, idea: Optional[str] = None, max_attempts: int = 3
+        self,
+        idea: Optional[str] = None,
+        max_attempts: int = 3,
+        run_vibe_test: bool = True,
     ) -> SkillGenerationResult:
-        """Generate a complete skill using the incremental approach."""
+        """Generate a complete skill using the incremental approach.
+
+        Args:
+            idea: Optional skill idea; one is generated when omitted
+            max_attempts: Maximum number of planning attempts
+            run_vibe_test: Whether to vibe test the skill before returning. Callers
+                that pipeline vibe tests pass False and run them separately.
+        """
         import time
 
         start_time = time.time()
@@ -628,20 +1649,52 @@ Answer only 'yes' or 'no'."""
             "vibe_test_passed": False,
         }
 
+        plan: Optional[SkillPlan] = None
+        repair: Set[str] = set()
+        previous_categories: Set[str] = set()
+
         for attempt in range(1, max_attempts + 1):
-            print(f"\n🚀 Generation attempt {attempt}/{max_attempts}")
-            print("=" * 50)
+            self._print(f"\n🚀 Generation attempt {attempt}/{max_attempts}")
+            self._print("=" * 50)
 
             try:
-                # Build the skill plan
-                plan = self.build_skill_plan(idea)
+                if repair and plan is not None:
+                    # Keep what passed last time and regenerate only what failed
+                    self._print(
+                        f"🔧 Regenerating failed steps: {', '.join(sorted(repair))}"
+                    )
+                    self.repair_plan(plan, repair)
+                    repair = set()
+                else:
+                    # Build the skill plan
+                    plan = self.build_skill_plan(idea)
                 step_results["plan_created"] = True
 
                 # Validate and test the plan
                 valid, errors = self.validate_and_test_plan(plan)
                 if not valid:
-                    print(f"❌ Validation failed: {errors}")
-                    if attempt == max_attempts:
+                    self._print(f"❌ Validation failed: {errors}")
+                    categories = self.classify_validation_errors(errors)
+                    if plan.code_cache_key and categories & {
+                        "CODE_MISSING_DEF",
+                        "CODE_RUNTIME_ERROR",
+                    }:
+                        # Don't hand the same failing code back on the retry
+                        self.llm_cache.delete(plan.code_cache_key)
+
+                    # A deterministic failure that survived a retry will not go away
+                    repeated = (
+                        categories
+                        & previous_categories
+                        & DETERMINISTIC_ERROR_CATEGORIES
+                    )
+                    previous_categories = categories
+                    if repeated:
+                        self._print(
+                            f"🛑 Same failure after retry: {', '.join(sorted(repeated))}"
+                        )
+
+                    if attempt == max_attempts or repeated:
                         return SkillGenerationResult(
                             success=False,
                             skill=None,
@@ -651,9 +1704,15 @@ Answer only 'yes' or 'no'."""
                             generation_time=time.time() - start_time,
                             attempts=attempt,
                         )
+                    if "OTHER" not in categories:
+                        repair = categories
                     continue
 
                 step_results["validation_passed"] = True
+                if plan.code_cache_key:
+                    self.llm_cache.put(
+                        plan.code_cache_key, self.model, plan.function_code
+                    )
 
                 # Create and register the skill
                 skill = Skill(
@@ -669,18 +1728,24 @@ Answer only 'yes' or 'no'."""
 
                 # Try to register safely
                 try:
-                    success = self.skill_registry.register_skill(skill)
+                    with self._registry_lock:
+                        success = self.skill_registry.register_skill(
+                            skill, precompiled=plan.compiled_code
+                        )
                     if not success:
                         raise Exception("Failed to register skill")
                     step_results["skill_registered"] = True
-                    print(f"✅ Skill '{skill.name}' registered successfully")
+                    self.remember_skill_template(plan)
+                    self._print(f"✅ Skill '{skill.name}' registered successfully")
                 except Exception as e:
-                    print(f"❌ Registration failed: {e}")
+                    self._print(f"❌ Registration failed: {e}")
                     continue
 
                 # Run vibe tests
-                vibe_passed, vibe_results = self.run_isolated_vibe_test(skill)
-                step_results["vibe_test_passed"] = vibe_passed
+                vibe_passed, vibe_results = False, None
+                if run_vibe_test:
+                    vibe_passed, vibe_results = self.run_isolated_vibe_test(skill)
+                    step_results["vibe_test_passed"] = vibe_passed
 
                 generation_time = time.time() - start_time
 
@@ -697,7 +1762,7 @@ Answer only 'yes' or 'no'."""
                 )
 
             except Exception as e:
-                print(f"❌ Attempt {attempt} failed: {e}")
+                self._print(f"❌ Attempt {attempt} failed: {e}")
                 if attempt == max_attempts:
                     return SkillGenerationResult(
                         success=False,
@@ -727,6 +1792,8 @@ def run_skill_generation(
     count: int = 1,
     ideas: Optional[List[str]] = None,
     generate_report: bool = True,
+    verbose: bool = True,
+    deterministic: bool = False,
 ) -> bool:
     """Main entry point for incremental skill generation with reporting.
 
@@ -736,72 +1803,120 @@ def run_skill_generation(
         count: Number of skills to generate
         ideas: Optional list of skill ideas
         generate_report: Whether to generate HTML documentation report
+        verbose: Whether to print per-step progress; the summary is always shown
+        deterministic: Vibe test at temperature 0 with one question per phrase
 
     Returns:
         True if at least one skill was successfully generated
     """
+    import time
     from .skillgen_report import SkillGenerationReporter
 
+    generator = IncrementalSkillGenerator(
+        model, analysis_model, verbose=verbose, deterministic=deterministic
+    )
+    say = generator._print
+
     print("🤖 OllamaPy Incremental Skill Generation")
     print("=" * 60)
     print(f"Generation model: {model}")
     print(f"Analysis model: {analysis_model or model}")
     print(f"Target count: {count}")
-    print()
-    print("🎯 Strategy: Generate SIMPLE skills first")
-    print("🔄 Following DRY principle - no duplication")
-    print("🚀 Multi-step prompts for better success rate")
-    print("🔒 Safe execution with crash protection")
-    print()
-
-    generator = IncrementalSkillGenerator(model, analysis_model)
-    reporter = (
-        SkillGenerationReporter(model, analysis_model) if generate_report else None
-    )
+    say()
+    say("🎯 Strategy: Generate SIMPLE skills first")
+    say("🔄 Following DRY principle - no duplication")
+    say("🚀 Multi-step prompts for better success rate")
+    say("🔒 Safe execution with crash protection")
+    say()
+
+    try:
+        generator.warm_up_models()
+
+        # One request for the batch's ideas instead of one per skill
+        ideas = list(ideas or [])
+        if count - len(ideas) > 1:
+            say(f"🎯 Generating {count - len(ideas)} skill ideas...")
+            ideas.extend(generator.generate_skill_ideas(count - len(ideas)))
+
+        reporter = (
+            SkillGenerationReporter(model, analysis_model) if generate_report else None
+        )
 
-    successful_skills = []
-    failed_attempts = []
-    all_results = []
-
-    for i in range(count):
-        print(f"\n🎯 Generating skill {i+1}/{count}")
-        print("=" * 40)
-
-        idea = ideas[i] if ideas and i < len(ideas) else None
-        result = generator.generate_skill(idea, max_attempts=3)
-
-        # Store result for reporting
-        all_results.append(result)
-        if reporter:
-            reporter.add_result(
-                {
-                    "success": result.success,
-                    "skill": result.skill,
-                    "plan": result.plan,
-                    "errors": result.errors,
-                    "attempts": result.attempts,
-                    "generation_time": result.generation_time,
-                    "step_results": result.step_results,
-                    "vibe_test_passed": result.vibe_test_passed,
-                    "vibe_test_results": result.vibe_test_results,
-                }
-            )
+        successful_skills = []
+        failed_attempts = []
+        all_results = []
+
+        def timed_vibe_test(skill: Skill) -> Tuple[bool, Dict[str, Any], float]:
+            started = time.time()
+            vibe_passed, vibe_results = generator.run_isolated_vibe_test(skill)
+            return vibe_passed, vibe_results, time.time() - started
+
+        def generate_one(i: int) -> Tuple[SkillGenerationResult, Optional[Future]]:
+            say(f"\n🎯 Generating skill {i+1}/{count}")
+            say("=" * 40)
+
+            idea = ideas[i] if i < len(ideas) else None
+            result = generator.generate_skill(idea, max_attempts=3, run_vibe_test=False)
+
+            # Vibe test in the background while other skills are being planned
+            vibe_future = None
+            if result.success and result.skill:
+                vibe_future = vibe_executor.submit(timed_vibe_test, result.skill)
+            return result, vibe_future
+
+        # Generate several skills at once, sized to what the Ollama server serves in
+        # parallel; registration is already serialized by the generator
+        generation_workers = max(1, min(count, generator.max_parallel_requests))
+        with ThreadPoolExecutor(max_workers=1) as vibe_executor, ThreadPoolExecutor(
+            max_workers=generation_workers
+        ) as generation_executor:
+            pending = list(generation_executor.map(generate_one, range(count)))
+
+        for result, vibe_future in pending:
+            if vibe_future is not None:
+                vibe_passed, vibe_results, vibe_time = vibe_future.result()
+                result.vibe_test_passed = vibe_passed
+                result.vibe_test_results = vibe_results
+                result.step_results["vibe_test_passed"] = vibe_passed
+                result.generation_time += vibe_time
+
+            # Store result for reporting
+            all_results.append(result)
+            if reporter:
+                reporter.add_result(
+                    {
+                        "success": result.success,
+                        "skill": result.skill,
+                        "plan": result.plan,
+                        "errors": result.errors,
+                        "attempts": result.attempts,
+                        "generation_time": result.generation_time,
+                        "step_results": result.step_results,
+                        "vibe_test_passed": result.vibe_test_passed,
+                        "vibe_test_results": result.vibe_test_results,
+                    }
+                )
 
-        if result.success and result.skill:
-            successful_skills.append(result.skill)
-            status = "✅" if result.vibe_test_passed else "⚠️"
-            print(f"\n{status} SUCCESS: {result.skill.name}")
-            print(f"   Description: {result.skill.description}")
-            print(f"   Role: {result.skill.role}")
-            print(f"   Vibe test: {'PASSED' if result.vibe_test_passed else 'FAILED'}")
-            print(
-                f"   Time: {result.generation_time:.1f}s, Attempts: {result.attempts}"
-            )
-        else:
-            failed_attempts.append(result)
-            print(f"\n❌ FAILED after {result.attempts} attempts")
-            if result.errors:
-                print(f"   Errors: {', '.join(result.errors)}")
+            if result.success and result.skill:
+                successful_skills.append(result.skill)
+                status = "✅" if result.vibe_test_passed else "⚠️"
+                say(f"\n{status} SUCCESS: {result.skill.name}")
+                say(f"   Description: {result.skill.description}")
+                say(f"   Role: {result.skill.role}")
+                say(
+                    f"   Vibe test: {'PASSED' if result.vibe_test_passed else 'FAILED'}"
+                )
+                say(
+                    f"   Time: {result.generation_time:.1f}s, Attempts: {result.attempts}"
+                )
+            else:
+                failed_attempts.append(result)
+                say(f"\n❌ FAILED after {result.attempts} attempts")
+                if result.errors:
+                    say(f"   Errors: {', '.join(result.errors)}")
+    finally:
+        generator.close()
+        generator.release_models()
 
     # Summary
     print(f"\n📊 Generation Complete!")
@@ -1,17 +1,200 @@
 """Navigatable documentation generation for skills with individual pages and comprehensive reporting."""
 
-from typing import Dict, List, Any, Optional, Tuple
-from datetime import datetime
+from typing import Dict, Iterable, Iterator, List, Any, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+import functools
+import hashlib
+import itertools
+from html import escape
 import json
 import os
+import re
+import time
 from pathlib import Path
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
+
+try:
+    import orjson
+except ImportError:  # Optional speedup, see the "fast" extra
+    orjson = None
+
+# Parses a skill file's raw bytes; orjson is several times faster than json
+_loads = orjson.loads if orjson is not None else json.loads
+
+
+def _dumps_for_script(data: Any) -> str:
+    """Serialize data as indented JSON that is safe inside a <script> element."""
+    text = None
+    if orjson is not None:
+        try:
+            text = orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+        except TypeError:  # orjson.JSONEncodeError, e.g. for non-string keys
+            pass
+    if text is None:
+        text = json.dumps(data, indent=2)
+    # A "</script>" inside a string value would otherwise end the element
+    return text.replace("</", "<\\/")
+
+
+def _group_by_role(
+    all_skills: Dict[str, Dict],
+) -> List[Tuple[str, List[Tuple[str, Dict]]]]:
+    """Group skills by role, with roles and the skills in each sorted by name.
+
+    One sort by (role, name) replaces bucketing followed by a sort per role.
+    """
+    ordered = sorted(
+        all_skills.items(), key=lambda item: (item[1].get("role", "general"), item[0])
+    )
+    return [
+        (role, list(skills))
+        for role, skills in itertools.groupby(
+            ordered, key=lambda item: item[1].get("role", "general")
+        )
+    ]
+
+
+# Roles offered by the skill page's edit form, with their labels
+_ROLE_OPTIONS = (
+    ("general", "General"),
+    ("text_processing", "Text Processing"),
+    ("mathematics", "Mathematics"),
+    ("data_analysis", "Data Analysis"),
+    ("file_operations", "File Operations"),
+    ("web_utilities", "Web Utilities"),
+    ("time_date", "Time &amp; Date"),
+    ("formatting", "Formatting"),
+    ("validation", "Validation"),
+    ("emotional_response", "Emotional Response"),
+    ("information", "Information"),
+    ("advanced", "Advanced"),
+)
+# The options rendered once; a page marks its role with a single replace
+_ROLE_OPTIONS_HTML = "\n".join(
+    f'<option value="{value}">{label}</option>' for value, label in _ROLE_OPTIONS
+)
+
+# Emoji shown next to each role's heading on the index page
+_ROLE_EMOJI = {
+    "text_processing": "📝",
+    "mathematics": "🔢",
+    "data_analysis": "📊",
+    "file_operations": "📁",
+    "web_utilities": "🌐",
+    "time_date": "⏰",
+    "formatting": "✨",
+    "validation": "✅",
+    "general": "🔧",
+}
+
+# Index page card of one skill, formatted with already escaped values
+_CARD_TEMPLATE = (
+    '<a href="{name}.html" class="skill-card{new_cls}" data-search="{search}">'
+    '<div class="skill-card-header"><h3>{name}</h3>'
+    '<div class="badges">{new_badge}{verified_badge}</div></div>'
+    "<p>{desc}</p></a>\n"
+)
+
+# Plotly.js build drawing the report charts; plotly-latest is frozen at 1.x
+PLOTLY_JS_URL = "https://cdn.plot.ly/plotly-2.35.2.min.js"
+
+# Page markup shipped with the package
+TEMPLATES_DIR = Path(__file__).parent / "templates"
+
+
+class PageTemplate:
+    """HTML page template with {{ name }} placeholders.
+
+    The markup is split into literal parts once, so rendering a page only
+    joins those parts with the field values. CSS and JavaScript braces need
+    no escaping, unlike in an f-string.
+    """
+
+    FIELD_PATTERN = re.compile(r"\{\{\s*(\w+)\s*\}\}")
+
+    def __init__(self, text: str):
+        """Split the template text into literals and field names.
+
+        Args:
+            text: Template markup
+        """
+        parts = self.FIELD_PATTERN.split(text)
+        self.literals = parts[0::2]
+        self.fields = parts[1::2]
+
+    def render(self, **values: Any) -> str:
+        """Fill in every placeholder; a missing value raises KeyError."""
+        return "".join(self.iter_render(**values))
+
+    def iter_render(self, **values: Any) -> Iterator[str]:
+        """Yield the rendered page piece by piece, e.g. for writelines()."""
+        yield self.literals[0]
+        for field, literal in zip(self.fields, self.literals[1:]):
+            yield str(values[field])
+            yield literal
+
+
+def _write_parts(path: os.PathLike, parts: Iterable[str], buffer_size: int) -> None:
+    """Write text pieces to a file as UTF-8 with raw os.write calls.
+
+    Encoded pieces are collected until buffer_size bytes are pending, so a
+    typical page is a single write without going through the io layer.
+    """
+    fd = os.open(
+        path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o644
+    )
+    try:
+        pending = bytearray()
+        for part in parts:
+            pending += part.encode("utf-8")
+            if len(pending) >= buffer_size:
+                _write_all(fd, pending)
+                pending.clear()
+        _write_all(fd, pending)
+    finally:
+        os.close(fd)
+
+
+def _write_all(fd: int, data: bytearray) -> None:
+    """os.write may write only part of the data, so write until all is out."""
+    view = memoryview(data)
+    try:
+        offset = 0
+        while offset < len(data):
+            offset += os.write(fd, view[offset:])
+    finally:
+        view.release()
+
+
+@functools.lru_cache(maxsize=None)
+def _load_static(name: str) -> str:
+    """Read a file from TEMPLATES_DIR once per process."""
+    return (TEMPLATES_DIR / name).read_text(encoding="utf-8")
+
+
+@functools.lru_cache(maxsize=None)
+def _load_template(name: str) -> PageTemplate:
+    """Read and split a template from TEMPLATES_DIR once per process."""
+    return PageTemplate(_load_static(name))
 
 
 class SkillDocumentationGenerator:
     """Generates navigatable HTML documentation for all skills with individual pages."""
-    
+
+    # Bytes collected before each write of a skill page, more than a typical page
+    PAGE_WRITE_BUFFER = 1 << 16
+    # Threads writing skill pages to disk
+    WRITE_WORKERS = 8
+    # Files from TEMPLATES_DIR that pages link, written once per output directory
+    STATIC_ASSETS = ("styles.css", "skill_page.js")
+    # Data of every editable skill, loaded by their pages' edit forms
+    SKILL_DATA_SCRIPT = "skills.js"
+    # Skill name to page digest of the pages in the output directory
+    MANIFEST_NAME = ".manifest.json"
+    # Templates skill pages are rendered from
+    PAGE_TEMPLATES = ("skill_page.html", "skill_edit_panel.html")
+    # Bump when iter_skill_page changes its output, so existing pages are rewritten
+    PAGE_VERSION = 5
+
     def __init__(self, model: str = None, analysis_model: str = None, output_dir: str = "skill_docs"):
         """Initialize the documentation generator.
         
@@ -23,12 +206,13 @@ class SkillDocumentationGenerator:
         self.model = model or "N/A"
         self.analysis_model = analysis_model or "N/A"
         self.output_dir = Path(output_dir)
-        self.timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        # Formatted straight from the local time, without building a datetime
+        self.timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
         self.skills_data_dir = Path("src/ollamapy/skills_data")
-        
+
         # Create output directory if it doesn't exist
         self.output_dir.mkdir(parents=True, exist_ok=True)
-        
+
     def load_all_skills(self) -> Dict[str, Dict]:
         """Load all skills from the skills_data directory.
         
@@ -37,15 +221,21 @@ class SkillDocumentationGenerator:
         """
         skills = {}
         if self.skills_data_dir.exists():
-            for skill_file in self.skills_data_dir.glob("*.json"):
-                try:
-                    with open(skill_file, 'r') as f:
-                        skill_data = json.load(f)
+            # scandir yields names and types without a Path and stat per entry
+            with os.scandir(self.skills_data_dir) as entries:
+                for entry in entries:
+                    if not entry.name.endswith(".json") or not entry.is_file(
+                        follow_symlinks=False
+                    ):
+                        continue
+                    try:
+                        with open(entry.path, "rb") as f:
+                            skill_data = _loads(f.read())
                         skills[skill_data['name']] = skill_data
-                except Exception as e:
-                    print(f"Error loading skill {skill_file}: {e}")
+                    except Exception as e:
+                        print(f"Error loading skill {entry.path}: {e}")
         return skills
-    
+
     def generate_skill_page(self, skill_data: Dict, is_new: bool = False) -> str:
         """Generate an individual HTML page for a skill.
         
@@ -56,553 +246,165 @@ class SkillDocumentationGenerator:
         Returns:
             HTML content for the skill page
         """
-        skill_name = skill_data.get('name', 'Unknown')
-        description = skill_data.get('description', 'No description')
+        return "".join(self.iter_skill_page(skill_data, is_new))
+
+    def iter_skill_page(self, skill_data: Dict, is_new: bool = False) -> Iterator[str]:
+        """Yield the HTML page of a skill in pieces, see generate_skill_page."""
+        # Skill files can be edited by hand, so every text field is escaped once
+        # here and the escaped value reused wherever it appears on the page
+        # Each field is looked up once; a missing or null field gets its default
         role = skill_data.get('role', 'general')
         created_at = skill_data.get('created_at', 'Unknown')
-        verified = skill_data.get('verified', False)
-        
+        verified = bool(skill_data.get("verified"))
+        vibe = skill_data.get("vibe_test_phrases") or []
+        params = skill_data.get("parameters") or {}
+        code = skill_data.get("function_code") or ""
+        exec_count = skill_data.get("execution_count", 0)
+        success = skill_data.get("success_rate", 0.0)
+        esc_name = escape(skill_data.get("name", "Unknown"))
+        esc_desc = escape(skill_data.get("description", "No description"))
+        esc_role = escape(role)
+
         # Format vibe test phrases
-        vibe_phrases_html = ""
-        if skill_data.get('vibe_test_phrases'):
-            vibe_phrases_html = "<ul>"
-            for phrase in skill_data['vibe_test_phrases']:
-                vibe_phrases_html += f"<li>{phrase}</li>"
-            vibe_phrases_html += "</ul>"
+        if vibe:
+            vibe_phrases_html = (
+                "<ul>"
+                + "".join(f"<li>{escape(phrase)}</li>" for phrase in vibe)
+                + "</ul>"
+            )
         else:
             vibe_phrases_html = "<p>No vibe test phrases defined</p>"
-        
+
         # Format parameters
-        params_html = ""
-        if skill_data.get('parameters'):
-            params_html = "<table class='params-table'>"
-            params_html += "<tr><th>Parameter</th><th>Type</th><th>Required</th><th>Description</th></tr>"
-            for param_name, param_info in skill_data['parameters'].items():
+        if params:
+            params_parts = [
+                "<table class='params-table'>",
+                "<tr><th>Parameter</th><th>Type</th><th>Required</th>"
+                "<th>Description</th></tr>",
+            ]
+            for param_name, param_info in params.items():
                 required = "✓" if param_info.get('required', False) else ""
-                params_html += f"""
+                params_parts.append(f"""
                 <tr>
-                    <td><code>{param_name}</code></td>
-                    <td>{param_info.get('type', 'unknown')}</td>
+                    <td><code>{escape(param_name)}</code></td>
+                    <td>{escape(str(param_info.get('type', 'unknown')))}</td>
                     <td>{required}</td>
-                    <td>{param_info.get('description', '')}</td>
+                    <td>{escape(str(param_info.get('description', '')))}</td>
                 </tr>
-                """
-            params_html += "</table>"
+                """)
+            params_parts.append("</table>")
+            params_html = "".join(params_parts)
         else:
             params_html = "<p>No parameters required</p>"
-        
-        # Format code with syntax highlighting
-        code = skill_data.get('function_code', 'No code available')
-        code_html = f"<pre><code class='language-python'>{self.escape_html(code)}</code></pre>"
-        
+
+        # Format code with syntax highlighting; quotes need no escaping in element
+        # text, and the same escaped code fills the edit form's textarea
+        esc_code = escape(code, quote=False)
+        code_html = (
+            "<pre><code class='language-python'>"
+            f"{esc_code or 'No code available'}</code></pre>"
+        )
+
         # Badge for new skills
         new_badge = '<span class="badge-new">NEW</span>' if is_new else ''
         verified_badge = '<span class="badge-verified">VERIFIED</span>' if verified else '<span class="badge-unverified">UNVERIFIED</span>'
-        
-        # Edit button (only for non-verified skills)
-        if not verified:
-            disabled_attr = "disabled" if verified else ""
-            button_text = "🔒 Protected" if verified else "✏️ Edit Skill"
-            edit_button = f'<button class="edit-btn" onclick="editSkill()" {disabled_attr}>{button_text}</button>'
-        else:
+
+        # Verified skills cannot be edited, so their pages get neither the edit
+        # form nor the editor script and embedded skill data
+        if verified:
             edit_button = '<span class="protected-note">🔒 Built-in skills cannot be edited</span>'
-        
-        common_styles = self.get_common_styles()
-        newline = '\n'
-        return f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="utf-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{skill_name} - Skill Documentation</title>
-    <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/prism/1.29.0/themes/prism-tomorrow.min.css">
-    <style>
-        {common_styles}
-        .skill-header {{
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            padding: 40px;
-            border-radius: 15px 15px 0 0;
-            margin: -40px -40px 30px -40px;
-        }}
-        .skill-title {{
-            font-size: 2.5em;
-            margin-bottom: 10px;
-            display: flex;
-            align-items: center;
-            gap: 15px;
-        }}
-        .badge-new {{
-            background: #ffc107;
-            color: #000;
-            padding: 5px 10px;
-            border-radius: 20px;
-            font-size: 0.4em;
-            font-weight: bold;
-        }}
-        .badge-verified {{
-            background: #28a745;
-            color: white;
-            padding: 5px 10px;
-            border-radius: 20px;
-            font-size: 0.4em;
-        }}
-        .badge-unverified {{
-            background: #dc3545;
-            color: white;
-            padding: 5px 10px;
-            border-radius: 20px;
-            font-size: 0.4em;
-        }}
-        .skill-meta {{
-            display: flex;
-            gap: 30px;
-            opacity: 0.9;
-            flex-wrap: wrap;
-        }}
-        .meta-item {{
-            display: flex;
-            flex-direction: column;
-        }}
-        .meta-label {{
-            font-size: 0.9em;
-            opacity: 0.8;
-        }}
-        .meta-value {{
-            font-size: 1.1em;
-            font-weight: bold;
-        }}
-        .section {{
-            margin: 30px 0;
-            padding: 25px;
-            background: #f8f9fa;
-            border-radius: 10px;
-            border-left: 4px solid #667eea;
-        }}
-        .section h2 {{
-            margin-top: 0;
-            color: #333;
-        }}
-        .params-table {{
-            width: 100%;
-            border-collapse: collapse;
-            margin-top: 15px;
-        }}
-        .params-table th {{
-            background: #667eea;
-            color: white;
-            padding: 10px;
-            text-align: left;
-        }}
-        .params-table td {{
-            padding: 10px;
-            border-bottom: 1px solid #ddd;
-        }}
-        .params-table code {{
-            background: #e9ecef;
-            padding: 2px 6px;
-            border-radius: 3px;
-            font-family: 'Courier New', monospace;
-        }}
-        pre {{
-            background: #2d2d2d;
-            padding: 20px;
-            border-radius: 8px;
-            overflow-x: auto;
-        }}
-        pre code {{
-            color: #f8f8f2;
-            font-family: 'Courier New', monospace;
-            font-size: 14px;
-        }}
-        .nav-buttons {{
-            display: flex;
-            justify-content: space-between;
-            margin-top: 40px;
-            padding-top: 20px;
-            border-top: 2px solid #e9ecef;
-        }}
-        .nav-button {{
-            background: #667eea;
-            color: white;
-            padding: 10px 20px;
-            border-radius: 5px;
-            text-decoration: none;
-            transition: background 0.3s;
-        }}
-        .nav-button:hover {{
-            background: #764ba2;
-        }}
-        .edit-btn {{
-            background: #28a745;
-            color: white;
-            border: none;
-            padding: 12px 24px;
-            border-radius: 6px;
-            cursor: pointer;
-            font-size: 16px;
-            margin-right: 10px;
-            transition: background 0.2s;
-        }}
-        .edit-btn:hover:not(:disabled) {{
-            background: #218838;
-        }}
-        .edit-btn:disabled {{
-            background: #6c757d;
-            cursor: not-allowed;
-        }}
-        .protected-note {{
-            color: #6c757d;
-            font-style: italic;
-            padding: 12px 0;
-        }}
-        .edit-panel {{
-            display: none;
-            background: #fff;
-            border: 2px solid #667eea;
-            border-radius: 10px;
-            padding: 30px;
-            margin: 30px 0;
-        }}
-        .form-group {{
-            margin-bottom: 20px;
-        }}
-        .form-group label {{
-            display: block;
-            margin-bottom: 8px;
-            font-weight: 600;
-            color: #333;
-        }}
-        .form-control {{
-            width: 100%;
-            padding: 12px;
-            border: 2px solid #e2e8f0;
-            border-radius: 6px;
-            font-size: 14px;
-            transition: border-color 0.2s;
-            box-sizing: border-box;
-        }}
-        .form-control:focus {{
-            outline: none;
-            border-color: #667eea;
-        }}
-        .form-control.code {{
-            font-family: 'Monaco', 'Menlo', 'Ubuntu Mono', monospace;
-            resize: vertical;
-        }}
-        .btn-save {{
-            background: #28a745;
-            color: white;
-            border: none;
-            padding: 12px 24px;
-            border-radius: 6px;
-            cursor: pointer;
-            margin-right: 10px;
-        }}
-        .btn-cancel {{
-            background: #6c757d;
-            color: white;
-            border: none;
-            padding: 12px 24px;
-            border-radius: 6px;
-            cursor: pointer;
-        }}
-        .btn-test {{
-            background: #17a2b8;
-            color: white;
-            border: none;
-            padding: 12px 24px;
-            border-radius: 6px;
-            cursor: pointer;
-            margin-right: 10px;
-        }}
-        .message {{
-            padding: 15px;
-            border-radius: 6px;
-            margin: 15px 0;
-        }}
-        .message.success {{
-            background: #d4edda;
-            color: #155724;
-            border: 1px solid #c3e6cb;
-        }}
-        .message.error {{
-            background: #f8d7da;
-            color: #721c24;
-            border: 1px solid #f5c6cb;
-        }}
-        .test-output {{
-            background: #2d3748;
-            color: #e2e8f0;
-            padding: 15px;
-            border-radius: 6px;
-            font-family: 'Monaco', 'Menlo', 'Ubuntu Mono', monospace;
-            white-space: pre-wrap;
-            margin-top: 10px;
-            max-height: 300px;
-            overflow-y: auto;
-            display: none;
-        }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="skill-header">
-            <h1 class="skill-title">
-                {skill_name}
-                {new_badge}
-                {verified_badge}
-            </h1>
-            <p style="font-size: 1.2em; margin: 10px 0;">{description}</p>
-            <div class="skill-meta">
-                <div class="meta-item">
-                    <span class="meta-label">Role</span>
-                    <span class="meta-value">{role}</span>
-                </div>
-                <div class="meta-item">
-                    <span class="meta-label">Created</span>
-                    <span class="meta-value">{created_at[:10] if len(created_at) > 10 else created_at}</span>
-                </div>
-                <div class="meta-item">
-                    <span class="meta-label">Execution Count</span>
-                    <span class="meta-value">{skill_data.get('execution_count', 0)}</span>
-                </div>
-                <div class="meta-item">
-                    <span class="meta-label">Success Rate</span>
-                    <span class="meta-value">{skill_data.get('success_rate', 0):.1f}%</span>
-                </div>
-            </div>
-        </div>
-        
-        <div style="text-align: center; margin: 30px 0;">
-            {edit_button}
-        </div>
-        
-        <div id="edit-panel" class="edit-panel">
-            <h2>✏️ Edit Skill</h2>
-            <div id="message-area"></div>
-            <form id="edit-form">
-                <div class="form-group">
-                    <label>Description</label>
-                    <textarea id="edit-description" class="form-control" rows="3">{description}</textarea>
-                </div>
-                
-                <div class="form-group">
-                    <label>Role</label>
-                    <select id="edit-role" class="form-control">
-                        <option value="general" {"selected" if role == "general" else ""}>General</option>
-                        <option value="text_processing" {"selected" if role == "text_processing" else ""}>Text Processing</option>
-                        <option value="mathematics" {"selected" if role == "mathematics" else ""}>Mathematics</option>
-                        <option value="data_analysis" {"selected" if role == "data_analysis" else ""}>Data Analysis</option>
-                        <option value="file_operations" {"selected" if role == "file_operations" else ""}>File Operations</option>
-                        <option value="web_utilities" {"selected" if role == "web_utilities" else ""}>Web Utilities</option>
-                        <option value="time_date" {"selected" if role == "time_date" else ""}>Time & Date</option>
-                        <option value="formatting" {"selected" if role == "formatting" else ""}>Formatting</option>
-                        <option value="validation" {"selected" if role == "validation" else ""}>Validation</option>
-                        <option value="emotional_response" {"selected" if role == "emotional_response" else ""}>Emotional Response</option>
-                        <option value="information" {"selected" if role == "information" else ""}>Information</option>
-                        <option value="advanced" {"selected" if role == "advanced" else ""}>Advanced</option>
-                    </select>
-                </div>
-                
-                <div class="form-group">
-                    <label>Vibe Test Phrases (one per line)</label>
-                    <textarea id="edit-vibe-phrases" class="form-control" rows="5">{newline.join(skill_data.get('vibe_test_phrases', []))}</textarea>
-                </div>
-                
-                <div class="form-group">
-                    <label>Function Code</label>
-                    <textarea id="edit-function-code" class="form-control code" rows="15">{self.escape_html(skill_data.get('function_code', ''))}</textarea>
-                </div>
-                
-                <div style="margin: 20px 0;">
-                    <button type="button" class="btn-test" onclick="testSkill()">🧪 Test Skill</button>
-                    <div id="test-output" class="test-output"></div>
-                </div>
-                
-                <div>
-                    <button type="submit" class="btn-save">💾 Save Changes</button>
-                    <button type="button" class="btn-cancel" onclick="cancelEdit()">❌ Cancel</button>
-                </div>
-            </form>
-        </div>
-        
-        <div id="view-panel">
-            <div class="section">
-                <h2>📝 Description</h2>
-                <p>{description}</p>
-            </div>
-        
-        <div class="section">
-            <h2>🧪 Vibe Test Phrases</h2>
-            <p>These phrases should trigger this skill:</p>
-            {vibe_phrases_html}
-        </div>
-        
-        <div class="section">
-            <h2>⚙️ Parameters</h2>
-            {params_html}
-        </div>
-        
-            <div class="section">
-                <h2>💻 Implementation</h2>
-                {code_html}
-            </div>
-        </div>
-        
-        <div class="nav-buttons">
-            <a href="index.html" class="nav-button">← Back to Index</a>
-        </div>
-    </div>
-    <script src="https://cdnjs.cloudflare.com/ajax/libs/prism/1.29.0/prism.min.js"></script>
-    <script src="https://cdnjs.cloudflare.com/ajax/libs/prism/1.29.0/components/prism-python.min.js"></script>
-    
-    <script>
-        const skillData = {json.dumps(skill_data, indent=2)};
-        const isBuiltIn = {str(verified).lower()};
-        
-        function editSkill() {{
-            if (isBuiltIn) {{
-                showMessage('Built-in skills cannot be edited', 'error');
-                return;
-            }}
-            document.getElementById('view-panel').style.display = 'none';
-            document.getElementById('edit-panel').style.display = 'block';
-        }}
-        
-        function cancelEdit() {{
-            document.getElementById('edit-panel').style.display = 'none';
-            document.getElementById('view-panel').style.display = 'block';
-            clearMessage();
-        }}
-        
-        async function testSkill() {{
-            const formData = collectFormData();
-            
-            try {{
-                const response = await fetch('http://localhost:5000/api/skills/test', {{
-                    method: 'POST',
-                    headers: {{'Content-Type': 'application/json'}},
-                    body: JSON.stringify({{
-                        skill_data: formData,
-                        test_input: {{}}
-                    }})
-                }});
-                
-                const data = await response.json();
-                const output = document.getElementById('test-output');
-                
-                if (data.success) {{
-                    if (data.execution_successful) {{
-                        output.textContent = 'Test passed!' + newline + newline + 'Output:' + newline + data.output.join(newline);
-                        output.style.background = '#2d5a27';
-                    }} else {{
-                        output.textContent = 'Test failed:' + newline + data.error;
-                        output.style.background = '#8b2635';
-                    }}
-                }} else {{
-                    output.textContent = 'Error: ' + data.error;
-                    output.style.background = '#8b2635';
-                }}
-                
-                output.style.display = 'block';
-            }} catch (error) {{
-                const output = document.getElementById('test-output');
-                output.textContent = 'Network error: ' + error.message;
-                output.style.background = '#8b2635';
-                output.style.display = 'block';
-            }}
-        }}
-        
-        function collectFormData() {{
-            const vibePhrasesText = document.getElementById('edit-vibe-phrases').value;
-            return {{
-                name: skillData.name,
-                description: document.getElementById('edit-description').value,
-                role: document.getElementById('edit-role').value,
-                vibe_test_phrases: vibePhrasesText.split(newline).filter(p => p.trim()),
-                parameters: skillData.parameters || {{}},
-                function_code: document.getElementById('edit-function-code').value,
-                verified: skillData.verified,
-                scope: skillData.scope || 'local',
-                tags: skillData.tags || [],
-                created_at: skillData.created_at,
-                execution_count: skillData.execution_count || 0,
-                success_rate: skillData.success_rate || 100.0,
-                average_execution_time: skillData.average_execution_time || 0.0
-            }};
-        }}
-        
-        async function saveSkill() {{
-            if (isBuiltIn) {{
-                showMessage('Built-in skills cannot be edited', 'error');
-                return;
-            }}
-            
-            const formData = collectFormData();
-            formData.last_modified = new Date().toISOString();
-            
-            try {{
-                const response = await fetch(`http://localhost:5000/api/skills/${{skillData.name}}`, {{
-                    method: 'PUT',
-                    headers: {{'Content-Type': 'application/json'}},
-                    body: JSON.stringify(formData)
-                }});
-                
-                const data = await response.json();
-                
-                if (data.success) {{
-                    showMessage('Skill updated successfully! Refresh the page to see changes.', 'success');
-                    // Update local skill data
-                    Object.assign(skillData, formData);
-                }} else {{
-                    showMessage('Failed to update skill: ' + data.error, 'error');
-                    if (data.validation_errors) {{
-                        showMessage('Validation errors: ' + data.validation_errors.join(', '), 'error');
-                    }}
-                }}
-            }} catch (error) {{
-                showMessage('Network error: ' + error.message, 'error');
-            }}
-        }}
-        
-        function showMessage(message, type) {{
-            const area = document.getElementById('message-area');
-            area.innerHTML = `<div class="message ${{type}}">${{message}}</div>`;
-            setTimeout(() => area.innerHTML = '', 5000);
-        }}
-        
-        function clearMessage() {{
-            document.getElementById('message-area').innerHTML = '';
-        }}
-        
-        // Form submission handler
-        document.getElementById('edit-form').addEventListener('submit', function(e) {{
-            e.preventDefault();
-            saveSkill();
-        }});
-        
-        // Check if skill editor API is available
-        async function checkAPIAvailability() {{
-            try {{
-                await fetch('http://localhost:5000/api/skills', {{method: 'HEAD'}});
-            }} catch (error) {{
-                console.warn('Skill editor API not available. Interactive editing disabled.');
-                const editBtn = document.querySelector('.edit-btn');
-                if (editBtn && !isBuiltIn) {{
-                    editBtn.disabled = true;
-                    editBtn.textContent = '🔌 API Offline';
-                    editBtn.title = 'Start the skill editor server to enable editing';
-                }}
-            }}
-        }}
-        
-        // Check API availability on page load
-        checkAPIAvailability();
-    </script>
-</body>
-</html>"""
-    
+            edit_panel = ""
+            editor_script = ""
+        else:
+            edit_button = (
+                '<button class="edit-btn" onclick="editSkill()">✏️ Edit Skill</button>'
+            )
+            vibe_textarea = escape("\n".join(vibe), quote=False)
+            edit_panel = _load_template("skill_edit_panel.html").render(
+                description=esc_desc,
+                # Role options for the edit form, with the current role preselected
+                role_options=_ROLE_OPTIONS_HTML.replace(
+                    f'value="{role}"', f'value="{role}" selected', 1
+                ),
+                vibe_phrases_text=vibe_textarea,
+                function_code_text=esc_code,
+            )
+            # The skill data comes from the shared skills.js, see generate_documentation
+            skill_name_json = _dumps_for_script(skill_data.get("name", ""))
+            editor_script = (
+                f"<script>window.__skillName = {skill_name_json};</script>\n"
+                '    <script src="skills.js" defer></script>\n'
+                '    <script src="skill_page.js" defer></script>'
+            )
+
+        yield from _load_template("skill_page.html").iter_render(
+            skill_name=esc_name,
+            new_badge=new_badge,
+            verified_badge=verified_badge,
+            description=esc_desc,
+            role=esc_role,
+            created_date=escape(created_at[:10]),
+            execution_count=exec_count,
+            success_rate=f"{success:.1f}",
+            edit_button=edit_button,
+            edit_panel=edit_panel,
+            vibe_phrases_html=vibe_phrases_html,
+            params_html=params_html,
+            code_html=code_html,
+            editor_script=editor_script,
+        )
+
+    def render_skill_pages(
+        self, all_skills: Dict[str, Dict], new_skills: List[str]
+    ) -> Iterator[Tuple[str, Iterable[str]]]:
+        """Render the page of every skill, one page at a time.
+
+        Args:
+            all_skills: Dictionary of all skills
+            new_skills: List of newly generated skill names
+
+        Yields:
+            Tuples of skill name and the pieces of its page HTML
+        """
+        new_names = set(new_skills)
+        # Rendered lazily, so only the page being written is held in memory
+        for name, skill_data in all_skills.items():
+            yield name, self.iter_skill_page(skill_data, name in new_names)
+
+    def page_digest(self, skill_data: Dict, is_new: bool = False) -> str:
+        """Digest of everything a skill page is rendered from.
+
+        Args:
+            skill_data: The skill's data dictionary
+            is_new: Whether this is a newly generated skill
+
+        Returns:
+            Hex digest that changes whenever the page would
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(f"{self.PAGE_VERSION}:{int(is_new)}:".encode())
+        for template in self.PAGE_TEMPLATES:
+            digest.update(_load_static(template).encode("utf-8"))
+        data = None
+        if orjson is not None:
+            try:
+                data = orjson.dumps(skill_data, option=orjson.OPT_SORT_KEYS)
+            except TypeError:  # orjson.JSONEncodeError, e.g. for non-string keys
+                pass
+        if data is None:
+            data = json.dumps(skill_data, sort_keys=True, default=str).encode("utf-8")
+        digest.update(data)
+        return digest.hexdigest()
+
+    def load_manifest(self) -> Dict[str, str]:
+        """Load the page digests saved by the previous documentation run."""
+        try:
+            with open(self.output_dir / self.MANIFEST_NAME, "rb") as f:
+                manifest = _loads(f.read())
+        except (OSError, ValueError):
+            return {}
+        return manifest if isinstance(manifest, dict) else {}
+
     def generate_index_page(self, all_skills: Dict[str, Dict], new_skills: List[str], 
                            generation_results: List[Dict] = None,
                            vibe_results: Dict[str, Any] = None) -> str:
@@ -617,260 +419,83 @@ class SkillDocumentationGenerator:
         Returns:
             HTML content for the index page
         """
-        # Group skills by role
-        skills_by_role = {}
-        for skill_name, skill_data in all_skills.items():
-            role = skill_data.get('role', 'general')
-            if role not in skills_by_role:
-                skills_by_role[role] = []
-            skills_by_role[role].append((skill_name, skill_data))
-        
-        # Sort skills within each role
-        for role in skills_by_role:
-            skills_by_role[role].sort(key=lambda x: x[0])
-        
         # Generate skills listing HTML
-        skills_html = ""
-        for role in sorted(skills_by_role.keys()):
+        # Parts are joined once at the end; += would copy the growing page each time
+        skills_parts = []
+        new_names = set(new_skills)
+        for role, role_skills in _group_by_role(all_skills):
             role_emoji = self.get_role_emoji(role)
             role_title = role.replace('_', ' ').title()
-            skills_html += f"""
+            skills_parts.append(f"""
             <div class="role-section">
                 <h2>{role_emoji} {role_title}</h2>
                 <div class="skills-grid">
-            """
-            
-            for skill_name, skill_data in skills_by_role[role]:
-                is_new = skill_name in new_skills
+            """)
+
+            for skill_name, skill_data in role_skills:
+                is_new = skill_name in new_names
                 verified = skill_data.get('verified', False)
-                description = skill_data.get('description', 'No description')[:100]
-                if len(skill_data.get('description', '')) > 100:
-                    description += '...'
-                
-                new_badge = '<span class="badge new">NEW</span>' if is_new else ''
-                verified_badge = '<span class="badge verified">✓</span>' if verified else ''
-                
-                skills_html += f"""
-                <a href="{skill_name}.html" class="skill-card {'new-skill' if is_new else ''}">
-                    <div class="skill-card-header">
-                        <h3>{skill_name}</h3>
-                        <div class="badges">
-                            {new_badge}
-                            {verified_badge}
-                        </div>
-                    </div>
-                    <p>{description}</p>
-                </a>
-                """
-            
-            skills_html += """
+                description = skill_data.get("description") or "No description"
+
+                skills_parts.append(
+                    _CARD_TEMPLATE.format(
+                        name=escape(skill_name),
+                        # The search box matches this rather than the whole card text,
+                        # lowercased here once instead of in every visitor's browser
+                        search=escape(
+                            f"{skill_name} {description} {role_title}".lower()
+                        ),
+                        new_cls=" new-skill" if is_new else "",
+                        new_badge=(
+                            '<span class="badge new">NEW</span>' if is_new else ""
+                        ),
+                        verified_badge=(
+                            '<span class="badge verified">✓</span>' if verified else ""
+                        ),
+                        # Truncated before escaping so an entity is never cut in half
+                        desc=escape(
+                            description[:100]
+                            + ("..." if len(description) > 100 else "")
+                        ),
+                    )
+                )
+
+            skills_parts.append("""
                 </div>
             </div>
-            """
-        
+            """)
+        skills_html = "".join(skills_parts)
+
         # Generate statistics
         total_skills = len(all_skills)
-        new_count = len(new_skills)
+        new_count = len(new_names)
         verified_count = sum(1 for s in all_skills.values() if s.get('verified', False))
-        
-        # Generate charts if we have generation results
+
+        # Generate charts if we have generation results; only then is Plotly loaded
         charts_html = ""
+        plotly_script = ""
         if generation_results:
             charts_html = self.generate_report_charts(generation_results)
-        
+            plotly_script = f'<script src="{PLOTLY_JS_URL}"></script>'
+
         # Add vibe test results section if available
         vibe_html = ""
         if vibe_results:
             vibe_html = self.generate_vibe_results_section(vibe_results)
-        
-        common_styles = self.get_common_styles()
-        return f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="utf-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>OllamaPy Skills Documentation</title>
-    <script src="https://cdn.plot.ly/plotly-latest.min.js"></script>
-    <style>
-        {common_styles}
-        .header {{
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            padding: 60px 40px;
-            border-radius: 15px;
-            margin-bottom: 40px;
-            text-align: center;
-        }}
-        .header h1 {{
-            font-size: 3em;
-            margin-bottom: 20px;
-        }}
-        .stats {{
-            display: flex;
-            justify-content: center;
-            gap: 40px;
-            margin-top: 30px;
-            flex-wrap: wrap;
-        }}
-        .stat {{
-            background: rgba(255, 255, 255, 0.2);
-            padding: 20px 30px;
-            border-radius: 10px;
-        }}
-        .stat-value {{
-            font-size: 2.5em;
-            font-weight: bold;
-        }}
-        .stat-label {{
-            font-size: 1.1em;
-            opacity: 0.9;
-        }}
-        .role-section {{
-            margin: 40px 0;
-        }}
-        .role-section h2 {{
-            color: #333;
-            border-bottom: 2px solid #667eea;
-            padding-bottom: 10px;
-            margin-bottom: 20px;
-        }}
-        .skills-grid {{
-            display: grid;
-            grid-template-columns: repeat(auto-fill, minmax(300px, 1fr));
-            gap: 20px;
-        }}
-        .skill-card {{
-            background: #f8f9fa;
-            padding: 20px;
-            border-radius: 10px;
-            text-decoration: none;
-            color: #333;
-            transition: all 0.3s;
-            border: 2px solid transparent;
-            display: block;
-        }}
-        .skill-card:hover {{
-            transform: translateY(-5px);
-            box-shadow: 0 10px 30px rgba(0,0,0,0.1);
-            border-color: #667eea;
-        }}
-        .skill-card.new-skill {{
-            background: linear-gradient(135deg, #fff9e6 0%, #fffbf0 100%);
-            border-color: #ffc107;
-        }}
-        .skill-card-header {{
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            margin-bottom: 10px;
-        }}
-        .skill-card h3 {{
-            margin: 0;
-            color: #667eea;
-        }}
-        .skill-card p {{
-            margin: 0;
-            color: #666;
-            font-size: 0.95em;
-        }}
-        .badges {{
-            display: flex;
-            gap: 5px;
-        }}
-        .badge {{
-            padding: 3px 8px;
-            border-radius: 12px;
-            font-size: 0.75em;
-            font-weight: bold;
-        }}
-        .badge.new {{
-            background: #ffc107;
-            color: #000;
-        }}
-        .badge.verified {{
-            background: #28a745;
-            color: white;
-        }}
-        .search-box {{
-            margin: 30px 0;
-            text-align: center;
-        }}
-        .search-box input {{
-            width: 100%;
-            max-width: 500px;
-            padding: 15px 20px;
-            font-size: 1.1em;
-            border: 2px solid #667eea;
-            border-radius: 50px;
-            outline: none;
-        }}
-        .search-box input:focus {{
-            box-shadow: 0 0 0 3px rgba(102, 126, 234, 0.1);
-        }}
-        .generation-report {{
-            margin: 40px 0;
-            padding: 30px;
-            background: #f8f9fa;
-            border-radius: 10px;
-        }}
-        .generation-report h2 {{
-            color: #333;
-            margin-bottom: 20px;
-        }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <h1>🤖 OllamaPy Skills Documentation</h1>
-            <p style="font-size: 1.2em;">Comprehensive documentation for all available AI skills</p>
-            <div class="stats">
-                <div class="stat">
-                    <div class="stat-value">{total_skills}</div>
-                    <div class="stat-label">Total Skills</div>
-                </div>
-                <div class="stat">
-                    <div class="stat-value">{new_count}</div>
-                    <div class="stat-label">New Skills</div>
-                </div>
-                <div class="stat">
-                    <div class="stat-value">{verified_count}</div>
-                    <div class="stat-label">Verified</div>
-                </div>
-            </div>
-        </div>
-        
-        <div class="search-box">
-            <input type="text" id="skillSearch" placeholder="Search skills..." onkeyup="filterSkills()">
-        </div>
-        
-        {vibe_html}
-        
-        {charts_html}
-        
-        {skills_html}
-        
-        <div class="footer">
-            <p>Generated: {self.timestamp}</p>
-            <p>Models: {self.model} (generation) | {self.analysis_model} (analysis)</p>
-        </div>
-    </div>
-    
-    <script>
-    function filterSkills() {{
-        const input = document.getElementById('skillSearch');
-        const filter = input.value.toLowerCase();
-        const cards = document.getElementsByClassName('skill-card');
-        
-        for (let card of cards) {{
-            const text = card.textContent.toLowerCase();
-            card.style.display = text.includes(filter) ? '' : 'none';
-        }}
-    }}
-    </script>
-</body>
-</html>"""
-    
+
+        return _load_template("index.html").render(
+            plotly_script=plotly_script,
+            total_skills=total_skills,
+            new_count=new_count,
+            verified_count=verified_count,
+            vibe_html=vibe_html,
+            charts_html=charts_html,
+            skills_html=skills_html,
+            timestamp=self.timestamp,
+            model=escape(self.model),
+            analysis_model=escape(self.analysis_model),
+        )
+
     def generate_error_report(self, failed_results: List[Dict]) -> str:
         """Generate a separate error report for failed generations.
         
@@ -882,12 +507,13 @@ class SkillDocumentationGenerator:
         """
         if not failed_results:
             return ""
-        
-        errors_html = ""
+
+        # Parts are joined once at the end instead of growing a string with +=
+        errors_parts = []
         for i, result in enumerate(failed_results, 1):
             errors = result.get('errors', ['Unknown error'])
             step_results = result.get('step_results', {})
-            
+
             # Determine where it failed
             failure_point = "Unknown"
             if not step_results.get('plan_created'):
@@ -898,8 +524,8 @@ class SkillDocumentationGenerator:
                 failure_point = "Registration"
             elif not step_results.get('vibe_test_passed'):
                 failure_point = "Vibe Test"
-            
-            errors_html += f"""
+
+            errors_parts.append(f"""
             <div class="error-card">
                 <h3>Failed Generation #{i}</h3>
                 <div class="error-details">
@@ -908,120 +534,39 @@ class SkillDocumentationGenerator:
                     <p><strong>Time:</strong> {result.get('generation_time', 0):.1f}s</p>
                     <p><strong>Errors:</strong></p>
                     <ul class="error-list">
-            """
-            
+            """)
+
             for error in errors:
-                errors_html += f"<li>{error}</li>"
-            
-            errors_html += """
+                errors_parts.append(f"<li>{escape(str(error))}</li>")
+
+            errors_parts.append("""
                     </ul>
                 </div>
-            """
-            
+            """)
+
             # Add plan details if available
             if result.get('plan'):
                 plan = result['plan']
-                errors_html += f"""
+                errors_parts.append(f"""
                 <div class="plan-details">
                     <h4>Attempted Skill Plan:</h4>
-                    <p><strong>Idea:</strong> {plan.get('idea', 'N/A')}</p>
-                    <p><strong>Name:</strong> {plan.get('name', 'N/A')}</p>
-                    <p><strong>Description:</strong> {plan.get('description', 'N/A')}</p>
-                    <p><strong>Role:</strong> {plan.get('role', 'N/A')}</p>
+                    <p><strong>Idea:</strong> {escape(str(plan.get('idea', 'N/A')))}</p>
+                    <p><strong>Name:</strong> {escape(str(plan.get('name', 'N/A')))}</p>
+                    <p><strong>Description:</strong> {escape(str(plan.get('description', 'N/A')))}</p>
+                    <p><strong>Role:</strong> {escape(str(plan.get('role', 'N/A')))}</p>
                 </div>
-                """
-            
-            errors_html += "</div>"
-        
-        common_styles = self.get_common_styles()
-        return f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="utf-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Skill Generation Error Report</title>
-    <style>
-        {common_styles}
-        .header {{
-            background: linear-gradient(135deg, #dc3545 0%, #c82333 100%);
-            color: white;
-            padding: 40px;
-            border-radius: 15px;
-            margin-bottom: 30px;
-            text-align: center;
-        }}
-        .error-card {{
-            background: #fff3cd;
-            border-left: 4px solid #ffc107;
-            padding: 20px;
-            margin: 20px 0;
-            border-radius: 5px;
-        }}
-        .error-card h3 {{
-            margin-top: 0;
-            color: #856404;
-        }}
-        .error-details {{
-            margin: 15px 0;
-        }}
-        .error-list {{
-            background: white;
-            padding: 10px 10px 10px 30px;
-            border-radius: 5px;
-            margin: 10px 0;
-        }}
-        .plan-details {{
-            background: white;
-            padding: 15px;
-            border-radius: 5px;
-            margin-top: 15px;
-        }}
-        .plan-details h4 {{
-            margin-top: 0;
-            color: #495057;
-        }}
-        .summary {{
-            background: #f8f9fa;
-            padding: 20px;
-            border-radius: 10px;
-            margin: 30px 0;
-        }}
-        .nav-button {{
-            background: #667eea;
-            color: white;
-            padding: 10px 20px;
-            border-radius: 5px;
-            text-decoration: none;
-            display: inline-block;
-            margin-top: 20px;
-        }}
-        .nav-button:hover {{
-            background: #764ba2;
-        }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <h1>❌ Skill Generation Error Report</h1>
-            <p>Analysis of failed skill generation attempts</p>
-        </div>
-        
-        <div class="summary">
-            <h2>Summary</h2>
-            <p><strong>Total Failed Attempts:</strong> {len(failed_results)}</p>
-            <p><strong>Generated:</strong> {self.timestamp}</p>
-            <p>This report contains details about skill generation attempts that failed, 
-            including the failure points and error messages to help improve future generations.</p>
-        </div>
-        
-        {errors_html}
-        
-        <a href="index.html" class="nav-button">← Back to Skills Documentation</a>
-    </div>
-</body>
-</html>"""
-    
+                """)
+
+            errors_parts.append("</div>")
+
+        errors_html = "".join(errors_parts)
+
+        return _load_template("error_report.html").render(
+            failed_count=len(failed_results),
+            timestamp=self.timestamp,
+            errors_html=errors_html,
+        )
+
     def generate_report_charts(self, generation_results: List[Dict]) -> str:
         """Generate charts for the generation report.
         
@@ -1033,26 +578,31 @@ class SkillDocumentationGenerator:
         """
         if not generation_results:
             return ""
-        
+
         # Prepare data
         successful = sum(1 for r in generation_results if r.get('success', False))
         failed = len(generation_results) - successful
-        
-        # Success rate pie chart
-        fig1 = go.Figure(data=[go.Pie(
-            labels=['Successful', 'Failed'],
-            values=[successful, failed],
-            hole=0.3,
-            marker=dict(colors=['#28a745', '#dc3545'])
-        )])
-        fig1.update_layout(
-            title="Generation Success Rate",
-            height=300,
-            showlegend=True
+
+        # Success rate pie chart, drawn by Plotly.js straight from its trace and
+        # layout; building a plotly figure in Python only to export it is far slower
+        trace = {
+            "type": "pie",
+            "labels": ["Successful", "Failed"],
+            "values": [successful, failed],
+            "hole": 0.3,
+            "marker": {"colors": ["#28a745", "#dc3545"]},
+        }
+        layout = {
+            "title": {"text": "Generation Success Rate"},
+            "height": 300,
+            "showlegend": True,
+        }
+        chart1_html = (
+            '<div id="success-pie"></div>\n'
+            f'<script>Plotly.newPlot("success-pie", [{json.dumps(trace)}], '
+            f'{json.dumps(layout)}, {{"responsive": true}});</script>'
         )
-        
-        chart1_html = fig1.to_html(full_html=False, include_plotlyjs=False, div_id="success-pie")
-        
+
         return f"""
         <div class="generation-report">
             <h2>📊 Latest Generation Report</h2>
@@ -1064,55 +614,19 @@ class SkillDocumentationGenerator:
             </p>
         </div>
         """
-    
+
     def get_role_emoji(self, role: str) -> str:
         """Get emoji for a skill role."""
-        emojis = {
-            'text_processing': '📝',
-            'mathematics': '🔢',
-            'data_analysis': '📊',
-            'file_operations': '📁',
-            'web_utilities': '🌐',
-            'time_date': '⏰',
-            'formatting': '✨',
-            'validation': '✅',
-            'general': '🔧'
-        }
-        return emojis.get(role, '🔧')
-    
+        return _ROLE_EMOJI.get(role, "🔧")
+
     def get_common_styles(self) -> str:
-        """Get common CSS styles used across all pages."""
-        return """
-        body {
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Helvetica, Arial, sans-serif;
-            margin: 0;
-            padding: 0;
-            background: #f5f5f5;
-            min-height: 100vh;
-        }
-        .container {
-            max-width: 1200px;
-            margin: 0 auto;
-            padding: 40px 20px;
-            background: white;
-            min-height: 100vh;
-        }
-        .footer {
-            text-align: center;
-            margin-top: 60px;
-            padding-top: 20px;
-            border-top: 2px solid #e9ecef;
-            color: #6c757d;
-        }
-        .chart-container {
-            margin: 20px 0;
-        }
-        """
-    
+        """Get the stylesheet shared by all pages (read once per process)."""
+        return _load_static("styles.css")
+
     def escape_html(self, text: str) -> str:
         """Escape HTML special characters."""
-        return text.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;').replace('"', '&quot;').replace("'", '&#39;')
-    
+        return escape(text)
+
     def generate_vibe_results_section(self, vibe_results: Dict[str, Any]) -> str:
         """Generate HTML section for vibe test results.
         
@@ -1124,21 +638,21 @@ class SkillDocumentationGenerator:
         """
         if not vibe_results:
             return ""
-            
+
         summary = vibe_results.get("summary", {})
         models = vibe_results.get("models", {})
-        
+
         if not models:
             return ""
-            
-        # Build HTML for vibe test results
-        html = """
+
+        # Build HTML for vibe test results, joined once at the end
+        html_parts = ["""
         <div class="vibe-results-section" style="margin: 40px 0; padding: 30px; background: #f0f8ff; border-radius: 15px;">
             <h2 style="color: #333; margin-bottom: 20px;">🧪 Vibe Test Results</h2>
-        """
-        
+        """]
+
         if summary:
-            html += f"""
+            html_parts.append(f"""
             <div style="display: flex; gap: 20px; margin-bottom: 30px; flex-wrap: wrap;">
                 <div style="background: white; padding: 15px 25px; border-radius: 8px; flex: 1;">
                     <div style="font-size: 2em; font-weight: bold; color: #667eea;">{summary.get('total_models_tested', 0)}</div>
@@ -1153,10 +667,10 @@ class SkillDocumentationGenerator:
                     <div style="color: #666;">Avg Success Rate</div>
                 </div>
             </div>
-            """
-            
+            """)
+
         # Add model results table
-        html += """
+        html_parts.append("""
         <table style="width: 100%; background: white; border-radius: 8px; overflow: hidden;">
             <thead style="background: #667eea; color: white;">
                 <tr>
@@ -1168,8 +682,8 @@ class SkillDocumentationGenerator:
                 </tr>
             </thead>
             <tbody>
-        """
-        
+        """)
+
         for model_name, model_result in models.items():
             if isinstance(model_result, dict):
                 success_rate = model_result.get("overall_success_rate", 0)
@@ -1178,13 +692,13 @@ class SkillDocumentationGenerator:
                 avg_time = timing.get("mean", 0) if timing else 0
                 success = model_result.get("success", False)
                 skipped = model_result.get("skipped", False)
-                
+
                 status_color = "#28a745" if success else "#dc3545" if not skipped else "#ffc107"
                 status_text = "✓ Passed" if success else "⚠️ Skipped" if skipped else "✗ Failed"
-                
-                html += f"""
+
+                html_parts.append(f"""
                 <tr style="border-bottom: 1px solid #eee;">
-                    <td style="padding: 12px; font-weight: 500;">{model_result.get('display_name', model_name)}</td>
+                    <td style="padding: 12px; font-weight: 500;">{escape(str(model_result.get('display_name', model_name)))}</td>
                     <td style="padding: 12px; text-align: center;">
                         <span style="font-weight: bold; color: {status_color};">{success_rate:.1f}%</span>
                     </td>
@@ -1194,9 +708,9 @@ class SkillDocumentationGenerator:
                         <span style="color: {status_color};">{status_text}</span>
                     </td>
                 </tr>
-                """
-                
-        html += """
+                """)
+
+        html_parts.append("""
             </tbody>
         </table>
         <div style="margin-top: 20px;">
@@ -1205,10 +719,10 @@ class SkillDocumentationGenerator:
             </a>
         </div>
         </div>
-        """
-        
-        return html
-    
+        """)
+
+        return "".join(html_parts)
+
     def generate_markdown_documentation(self, output_path: str = None) -> str:
         """Generate markdown documentation for all skills.
         
@@ -1219,41 +733,43 @@ class SkillDocumentationGenerator:
             Path to the generated markdown file
         """
         all_skills = self.load_all_skills()
-        
-        md_content = "# OllamaPy Skills Documentation\n\n"
-        md_content += f"Generated: {self.timestamp}\n\n"
-        md_content += f"Total Skills: {len(all_skills)}\n\n"
-        
-        # Group by role
-        skills_by_role = {}
-        for skill_name, skill_data in all_skills.items():
-            role = skill_data.get('role', 'general')
-            if role not in skills_by_role:
-                skills_by_role[role] = []
-            skills_by_role[role].append((skill_name, skill_data))
-        
+
+        # Lines are joined once at the end instead of growing a string with +=
+        md_parts = [
+            "# OllamaPy Skills Documentation\n\n",
+            f"Generated: {self.timestamp}\n\n",
+            f"Total Skills: {len(all_skills)}\n\n",
+        ]
+
         # Generate markdown for each role
-        for role in sorted(skills_by_role.keys()):
+        for role, role_skills in _group_by_role(all_skills):
             role_title = role.replace('_', ' ').title()
-            md_content += f"\n## {role_title}\n\n"
-            
-            for skill_name, skill_data in sorted(skills_by_role[role], key=lambda x: x[0]):
-                md_content += f"### {skill_name}\n\n"
-                md_content += f"**Description:** {skill_data.get('description', 'No description')}\n\n"
-                
+            md_parts.append(f"\n## {role_title}\n\n")
+
+            for skill_name, skill_data in role_skills:
+                md_parts.append(f"### {skill_name}\n\n")
+                description = skill_data.get("description", "No description")
+                md_parts.append(f"**Description:** {description}\n\n")
+
                 if skill_data.get('parameters'):
-                    md_content += "**Parameters:**\n\n"
+                    md_parts.append("**Parameters:**\n\n")
                     for param_name, param_info in skill_data['parameters'].items():
                         required = " (required)" if param_info.get('required', False) else ""
-                        md_content += f"- `{param_name}` ({param_info.get('type', 'unknown')}){required}: {param_info.get('description', '')}\n"
-                    md_content += "\n"
-                
+                        param_type = param_info.get("type", "unknown")
+                        param_desc = param_info.get("description", "")
+                        md_parts.append(
+                            f"- `{param_name}` ({param_type}){required}: {param_desc}\n"
+                        )
+                    md_parts.append("\n")
+
                 if skill_data.get('vibe_test_phrases'):
-                    md_content += "**Vibe Test Phrases:**\n\n"
+                    md_parts.append("**Vibe Test Phrases:**\n\n")
                     for phrase in skill_data['vibe_test_phrases']:
-                        md_content += f"- {phrase}\n"
-                    md_content += "\n"
-        
+                        md_parts.append(f"- {phrase}\n")
+                    md_parts.append("\n")
+
+        md_content = "".join(md_parts)
+
         # Save to file if path provided
         if output_path:
             output_file = Path(output_path)
@@ -1261,9 +777,9 @@ class SkillDocumentationGenerator:
             with open(output_file, 'w', encoding='utf-8') as f:
                 f.write(md_content)
             return str(output_file)
-        
+
         return md_content
-    
+
     def generate_html_documentation(self, output_path: str = None, vibe_results: Dict[str, Any] = None) -> str:
         """Generate HTML documentation for all skills with optional vibe test results.
         
@@ -1276,29 +792,35 @@ class SkillDocumentationGenerator:
         """
         # Generate using the main documentation method
         doc_path = self.generate_documentation(generation_results=None, vibe_results=vibe_results)
-        
+
         # If output_path is specified, copy to that location
         if output_path and doc_path:
             import shutil
             output_file = Path(output_path)
             output_file.parent.mkdir(parents=True, exist_ok=True)
-            
+
             # Copy the entire documentation directory
             doc_dir = Path(doc_path).parent
             if doc_dir.exists():
                 # Copy index file
                 shutil.copy2(doc_path, output_file)
-                
-                # Copy all skill pages
+
+                # Copy all skill pages and the assets they link
                 for skill_page in doc_dir.glob("*.html"):
                     if skill_page.name != "index.html":
                         dest = output_file.parent / skill_page.name
                         shutil.copy2(skill_page, dest)
-                        
+                for asset in self.STATIC_ASSETS + (self.SKILL_DATA_SCRIPT,):
+                    shutil.copy2(doc_dir / asset, output_file.parent / asset)
+
             return str(output_file)
-        
+
         return doc_path
-    
+
+    def _write_file(self, name: str, text: str) -> None:
+        """Write a file of the output directory as UTF-8 in a single os.write."""
+        _write_parts(self.output_dir / name, (text,), self.PAGE_WRITE_BUFFER)
+
     def generate_documentation(self, generation_results: List[Dict] = None, vibe_results: Dict[str, Any] = None) -> str:
         """Generate complete documentation for all skills.
         
@@ -1311,11 +833,11 @@ class SkillDocumentationGenerator:
         """
         # Load all skills
         all_skills = self.load_all_skills()
-        
+
         # Identify new skills from generation results
         new_skills = []
         failed_results = []
-        
+
         if generation_results:
             for result in generation_results:
                 if result.get('success') and result.get('skill'):
@@ -1324,28 +846,62 @@ class SkillDocumentationGenerator:
                     new_skills.append(skill_name)
                 elif not result.get('success'):
                     failed_results.append(result)
-        
-        # Generate individual skill pages
-        for skill_name, skill_data in all_skills.items():
-            is_new = skill_name in new_skills
-            skill_html = self.generate_skill_page(skill_data, is_new)
-            skill_file = self.output_dir / f"{skill_name}.html"
-            with open(skill_file, 'w', encoding='utf-8') as f:
-                f.write(skill_html)
-        
+
+        # Every page links this one stylesheet and script instead of inlining them
+        for asset in self.STATIC_ASSETS:
+            self._write_file(asset, _load_static(asset))
+
+        # One script holds the data of every editable skill, so pages need not
+        # embed their own copy; a script rather than JSON also loads from file://
+        editable = {
+            name: data for name, data in all_skills.items() if not data.get("verified")
+        }
+        self._write_file(
+            self.SKILL_DATA_SCRIPT,
+            f"window.__skills = {_dumps_for_script(editable)};\n",
+        )
+
+        # Generate individual skill pages, skipping those unchanged since the last run
+        previous = self.load_manifest()
+        new_names = set(new_skills)
+        manifest = {
+            name: self.page_digest(skill_data, name in new_names)
+            for name, skill_data in all_skills.items()
+        }
+        changed = {
+            name: skill_data
+            for name, skill_data in all_skills.items()
+            if previous.get(name) != manifest[name]
+            or not (self.output_dir / f"{name}.html").exists()
+        }
+        # Pages are independent files, so their writes overlap in threads
+        with ThreadPoolExecutor(max_workers=self.WRITE_WORKERS) as executor:
+            writes = [
+                executor.submit(
+                    _write_parts,
+                    self.output_dir / f"{skill_name}.html",
+                    page_parts,
+                    self.PAGE_WRITE_BUFFER,
+                )
+                for skill_name, page_parts in self.render_skill_pages(
+                    changed, new_skills
+                )
+            ]
+        for write in writes:
+            write.result()
+        self._write_file(
+            self.MANIFEST_NAME, json.dumps(manifest, indent=2, sort_keys=True)
+        )
+
         # Generate index page with vibe results if available
         index_html = self.generate_index_page(all_skills, new_skills, generation_results, vibe_results)
-        index_file = self.output_dir / "index.html"
-        with open(index_file, 'w', encoding='utf-8') as f:
-            f.write(index_html)
-        
+        self._write_file("index.html", index_html)
+
         # Generate error report if there were failures
         if failed_results:
             error_html = self.generate_error_report(failed_results)
-            error_file = self.output_dir / "error_report.html"
-            with open(error_file, 'w', encoding='utf-8') as f:
-                f.write(error_html)
-        
+            self._write_file("error_report.html", error_html)
+
         return str(self.output_dir / "index.html")
 
 
@@ -1431,4 +987,4 @@ class SkillGenerationReporter:
             
             formatted_results.append(formatted_result)
         
-        return doc_generator.generate_documentation(formatted_results)
\ No newline at end of file
+        return doc_generator.generate_documentation(formatted_results)
@@ -1,16 +1,29 @@
 """Skills management system for dynamic AI capabilities."""
 
+import hashlib
 import json
+import marshal
 import os
+import re
 import subprocess
 import sys
+import threading
 from dataclasses import dataclass, field, asdict
 from typing import Dict, Callable, List, Any, Optional
 from datetime import datetime
 from pathlib import Path
+from types import CodeType
 from .parameter_utils import prepare_function_parameters
 from .ai_query import AIQuery
 
+try:
+    import orjson
+except ImportError:  # Optional speedup, see the "fast" extra
+    orjson = None
+
+# Parses one line of the skill index; orjson takes the raw bytes directly
+_loads_line = orjson.loads if orjson is not None else json.loads
+
 
 @dataclass
 class Skill:
@@ -41,9 +54,62 @@ class Skill:
         return cls(**data)
 
 
+class _LazyFunctions(dict):
+    """Skill name to execute function, building each function on first lookup.
+
+    Loaded skills are only compiled up front; running their code to define
+    execute waits until the skill is first used, so errors raised by a skill's
+    top-level code are logged then rather than when it is loaded.
+    """
+
+    def __init__(self, registry: "SkillRegistry"):
+        super().__init__()
+        self._registry = registry
+
+    def __missing__(self, name: str) -> Callable:
+        skill = self._registry.skills.get(name)
+        if skill is None:
+            raise KeyError(name)
+        try:
+            func = self._registry._compile_skill_function(skill)
+        except Exception as e:
+            self._registry.log(f"[System] Error loading skill '{name}': {str(e)}")
+            raise KeyError(name) from e
+        self[name] = func
+        return func
+
+    def get(self, name: str, default: Any = None) -> Any:
+        # dict.get bypasses __missing__
+        try:
+            return self[name]
+        except KeyError:
+            return default
+
+    def deferred(self, name: str) -> Callable:
+        """A callable for a skill's execute function that builds it when called."""
+
+        def call(*args, **kwargs):
+            return self[name](*args, **kwargs)
+
+        call.__name__ = name
+        return call
+
+
 class SkillRegistry:
     """Registry for managing skills dynamically."""
 
+    # Compiled skill code shared by all registries, keyed by _code_key; code
+    # objects are immutable, so one compile serves every load of the same skill
+    _code_cache: Dict[str, CodeType] = {}
+    # Directory under skills_dir holding compiled skill code between runs
+    CODE_CACHE_DIRNAME = "__skillcache__"
+    # Every skill file's data with its size and modification time, one JSON
+    # object per line, so startup parses one file instead of each skill file;
+    # not *.json, so the glob skips it
+    INDEX_FILENAME = "_index.ndjson"
+    # Words suggesting the user needs a custom script rather than a skill
+    CUSTOM_SCRIPT_RE = re.compile("custom|script|complex|specific|analyze")
+
     def __init__(self, skills_directory: Optional[str] = None):
         """Initialize the skill registry.
 
@@ -51,7 +117,7 @@ class SkillRegistry:
             skills_directory: Directory to load/save skills from. If None, uses default.
         """
         self.skills: Dict[str, Skill] = {}
-        self.compiled_functions: Dict[str, Callable] = {}
+        self.compiled_functions: Dict[str, Callable] = _LazyFunctions(self)
         self.execution_logs: List[str] = []
 
         # Set up skills directory
@@ -82,18 +148,22 @@ class SkillRegistry:
         """Get all execution logs."""
         return self.execution_logs.copy()
 
-    def register_skill(self, skill: Skill) -> bool:
+    def register_skill(
+        self, skill: Skill, precompiled: Optional[CodeType] = None
+    ) -> bool:
         """Register a new skill in the registry.
 
         Args:
             skill: The skill to register
+            precompiled: The skill's function code already compiled, e.g. during
+                validation, so it is not parsed and compiled again
 
         Returns:
             True if successfully registered, False otherwise
         """
         try:
             # Compile the function code
-            compiled_func = self._compile_skill_function(skill)
+            compiled_func = self._compile_skill_function(skill, precompiled)
 
             # Store the skill and compiled function
             self.skills[skill.name] = skill
@@ -107,11 +177,14 @@ class SkillRegistry:
             self.log(f"[System] Error registering skill '{skill.name}': {str(e)}")
             return False
 
-    def _compile_skill_function(self, skill: Skill) -> Callable:
+    def _compile_skill_function(
+        self, skill: Skill, precompiled: Optional[CodeType] = None
+    ) -> Callable:
         """Compile skill function code into executable function.
 
         Args:
             skill: The skill containing function code
+            precompiled: Optional code object compiled from skill.function_code
 
         Returns:
             Compiled function
@@ -129,7 +202,10 @@ class SkillRegistry:
         }
 
         # Execute the function code in the namespace
-        exec(skill.function_code, namespace)
+        exec(
+            precompiled if precompiled is not None else self._compile_code(skill),
+            namespace,
+        )
 
         # The function should be named 'execute' in the code
         if "execute" not in namespace:
@@ -143,6 +219,58 @@ class SkillRegistry:
 
         return func
 
+    @staticmethod
+    def _code_key(skill: Skill) -> str:
+        """Cache key of a skill's compiled code.
+
+        The name is part of the key because it is compiled into the code
+        object as its filename, and the interpreter's cache tag because
+        marshal data is only valid for the version that wrote it.
+        """
+        source = f"{sys.implementation.cache_tag}\0{skill.name}\0{skill.function_code}"
+        return hashlib.sha1(source.encode("utf-8")).hexdigest()
+
+    def _compile_code(self, skill: Skill) -> CodeType:
+        """Compile a skill's function code, reusing an earlier compile.
+
+        Code objects are cached in memory and, marshalled, in
+        CODE_CACHE_DIRNAME, so a restart loads them instead of compiling.
+
+        Args:
+            skill: The skill containing function code
+
+        Returns:
+            Code object whose filename is "<skill:NAME>", so tracebacks name
+            the skill
+        """
+        key = self._code_key(skill)
+        code = self._code_cache.get(key)
+        if code is not None:
+            return code
+
+        cache_dir = self.skills_dir / self.CODE_CACHE_DIRNAME
+        cache_path = cache_dir / f"{key}.mcode"
+        try:
+            with open(cache_path, "rb") as f:
+                code = marshal.load(f)
+        except (OSError, EOFError, ValueError, TypeError):
+            code = None
+
+        if not isinstance(code, CodeType):
+            code = compile(skill.function_code, f"<skill:{skill.name}>", "exec")
+            # Write then rename so concurrent readers never see a partial file
+            temp_path = cache_dir / f"{key}.{threading.get_ident()}.tmp"
+            try:
+                cache_dir.mkdir(exist_ok=True)
+                with open(temp_path, "wb") as f:
+                    marshal.dump(code, f)
+                os.replace(temp_path, cache_path)
+            except OSError:
+                pass
+
+        self._code_cache[key] = code
+        return code
+
     def execute_skill(
         self, skill_name: str, parameters: Optional[Dict[str, Any]] = None
     ) -> None:
@@ -228,23 +356,77 @@ class SkillRegistry:
         with open(skill_file, "w") as f:
             json.dump(skill.to_dict(), f, indent=2)
 
+    def _read_index(self) -> Dict[str, Dict[str, Any]]:
+        """Read INDEX_FILENAME, keyed by skill file name; empty if unreadable."""
+        try:
+            with open(self.skills_dir / self.INDEX_FILENAME, "rb") as f:
+                entries = [_loads_line(line) for line in f if line.strip()]
+            return {entry["file"]: entry for entry in entries}
+        except (OSError, ValueError, TypeError, KeyError):
+            return {}
+
+    def _write_index(self, entries: List[Dict[str, Any]]):
+        """Rewrite INDEX_FILENAME with the given entries."""
+        index_path = self.skills_dir / self.INDEX_FILENAME
+        # Write then rename so concurrent readers never see a partial file
+        temp_path = index_path.with_name(
+            f"{self.INDEX_FILENAME}.{threading.get_ident()}.tmp"
+        )
+        try:
+            with open(temp_path, "w", encoding="utf-8") as f:
+                for entry in entries:
+                    f.write(json.dumps(entry))
+                    f.write("\n")
+            os.replace(temp_path, index_path)
+        except (OSError, TypeError, ValueError):
+            pass
+
     def load_skills(self):
-        """Load all skills from the skills directory."""
-        for skill_file in self.skills_dir.glob("*.json"):
-            try:
-                with open(skill_file, "r") as f:
-                    skill_data = json.load(f)
+        """Load all skills from the skills directory.
 
-                skill = Skill.from_dict(skill_data)
+        Skill data is taken from INDEX_FILENAME for every file whose size and
+        modification time match its index entry; other files are parsed, and
+        the index is rewritten once if any entries changed.
+        """
+        indexed = self._read_index()
+        entries: Dict[str, Dict[str, Any]] = {}
+        changed = False
 
-                # Compile and register the skill
-                compiled_func = self._compile_skill_function(skill)
-                self.skills[skill.name] = skill
-                self.compiled_functions[skill.name] = compiled_func
+        for skill_file in self.skills_dir.glob("*.json"):
+            try:
+                stat = skill_file.stat()
+                entry = indexed.get(skill_file.name)
+                if (
+                    entry is None
+                    or entry.get("size") != stat.st_size
+                    or entry.get("mtime_ns") != stat.st_mtime_ns
+                ):
+                    with open(skill_file, "r") as f:
+                        skill_data = json.load(f)
+                    entry = {
+                        "file": skill_file.name,
+                        "size": stat.st_size,
+                        "mtime_ns": stat.st_mtime_ns,
+                        "skill": skill_data,
+                    }
+                    changed = True
+
+                self._add_loaded_skill(Skill.from_dict(entry["skill"]))
+                entries[skill_file.name] = entry
 
             except Exception as e:
                 print(f"Error loading skill from {skill_file}: {e}")
 
+        if changed or entries.keys() != indexed.keys():
+            self._write_index(list(entries.values()))
+
+    def _add_loaded_skill(self, skill: Skill):
+        """Add a skill read from disk to the registry."""
+        # Compile now so broken code is reported here; its execute
+        # function is only built when the skill is first used
+        self._compile_code(skill)
+        self.skills[skill.name] = skill
+
     def _initialize_builtin_skills(self):
         """Initialize built-in skills (converted from original actions)."""
 
@@ -640,10 +822,7 @@ def execute():
         # Special handling for custom Python shell
         if "customPythonShell" in skill_names:
             # Check if the context suggests custom script need
-            custom_keywords = ["custom", "script", "complex", "specific", "analyze"]
-            if any(
-                keyword in conversation_context.lower() for keyword in custom_keywords
-            ):
+            if self.CUSTOM_SCRIPT_RE.search(conversation_context.lower()):
                 # Ask AI to generate a script
                 script_result = ai_query.file_write(
                     requirements="Generate a Python script to help with: "
@@ -721,7 +900,7 @@ def get_available_actions() -> Dict[str, Dict[str, Any]]:
     skills = SKILL_REGISTRY.get_all_skills()
     return {
         name: {
-            "function": SKILL_REGISTRY.compiled_functions.get(name),
+            "function": SKILL_REGISTRY.compiled_functions.deferred(name),
             "description": skill.description,
             "vibe_test_phrases": skill.vibe_test_phrases,
             "parameters": skill.parameters,
@@ -735,7 +914,7 @@ def get_actions_with_vibe_tests() -> Dict[str, Dict[str, Any]]:
     skills = SKILL_REGISTRY.get_skills_with_vibe_tests()
     return {
         name: {
-            "function": SKILL_REGISTRY.compiled_functions.get(name),
+            "function": SKILL_REGISTRY.compiled_functions.deferred(name),
             "description": skill.description,
             "vibe_test_phrases": skill.vibe_test_phrases,
             "parameters": skill.parameters,
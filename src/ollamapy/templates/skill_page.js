@@ -0,0 +1,147 @@
+// Shared by every skill page; skills.js sets window.__skills and each page
+// sets window.__skillName to the skill it shows
+const skillData = window.__skills[window.__skillName];
+const isBuiltIn = Boolean(skillData.verified);
+
+function editSkill() {
+    if (isBuiltIn) {
+        showMessage('Built-in skills cannot be edited', 'error');
+        return;
+    }
+    document.getElementById('view-panel').style.display = 'none';
+    document.getElementById('edit-panel').style.display = 'block';
+}
+
+function cancelEdit() {
+    document.getElementById('edit-panel').style.display = 'none';
+    document.getElementById('view-panel').style.display = 'block';
+    clearMessage();
+}
+
+async function testSkill() {
+    const formData = collectFormData();
+    
+    try {
+        const response = await fetch('http://localhost:5000/api/skills/test', {
+            method: 'POST',
+            headers: {'Content-Type': 'application/json'},
+            body: JSON.stringify({
+                skill_data: formData,
+                test_input: {}
+            })
+        });
+        
+        const data = await response.json();
+        const output = document.getElementById('test-output');
+        
+        if (data.success) {
+            if (data.execution_successful) {
+                output.textContent = 'Test passed!\n\nOutput:\n' + data.output.join('\n');
+                output.style.background = '#2d5a27';
+            } else {
+                output.textContent = 'Test failed:\n' + data.error;
+                output.style.background = '#8b2635';
+            }
+        } else {
+            output.textContent = 'Error: ' + data.error;
+            output.style.background = '#8b2635';
+        }
+        
+        output.style.display = 'block';
+    } catch (error) {
+        const output = document.getElementById('test-output');
+        output.textContent = 'Network error: ' + error.message;
+        output.style.background = '#8b2635';
+        output.style.display = 'block';
+    }
+}
+
+function collectFormData() {
+    const vibePhrasesText = document.getElementById('edit-vibe-phrases').value;
+    return {
+        name: skillData.name,
+        description: document.getElementById('edit-description').value,
+        role: document.getElementById('edit-role').value,
+        vibe_test_phrases: vibePhrasesText.split('\n').filter(p => p.trim()),
+        parameters: skillData.parameters || {},
+        function_code: document.getElementById('edit-function-code').value,
+        verified: skillData.verified,
+        scope: skillData.scope || 'local',
+        tags: skillData.tags || [],
+        created_at: skillData.created_at,
+        execution_count: skillData.execution_count || 0,
+        success_rate: skillData.success_rate || 100.0,
+        average_execution_time: skillData.average_execution_time || 0.0
+    };
+}
+
+async function saveSkill() {
+    if (isBuiltIn) {
+        showMessage('Built-in skills cannot be edited', 'error');
+        return;
+    }
+    
+    const formData = collectFormData();
+    formData.last_modified = new Date().toISOString();
+    
+    try {
+        const response = await fetch(`http://localhost:5000/api/skills/${skillData.name}`, {
+            method: 'PUT',
+            headers: {'Content-Type': 'application/json'},
+            body: JSON.stringify(formData)
+        });
+        
+        const data = await response.json();
+        
+        if (data.success) {
+            showMessage('Skill updated successfully! Refresh the page to see changes.', 'success');
+            // Update local skill data
+            Object.assign(skillData, formData);
+        } else {
+            showMessage('Failed to update skill: ' + data.error, 'error');
+            if (data.validation_errors) {
+                showMessage('Validation errors: ' + data.validation_errors.join(', '), 'error');
+            }
+        }
+    } catch (error) {
+        showMessage('Network error: ' + error.message, 'error');
+    }
+}
+
+function showMessage(message, type) {
+    // Built as a node rather than parsed from an HTML string, so server error
+    // text is shown as text
+    const box = document.createElement('div');
+    box.className = `message ${type}`;
+    box.textContent = message;
+    document.getElementById('message-area').replaceChildren(box);
+    setTimeout(() => box.remove(), 5000);
+}
+
+function clearMessage() {
+    document.getElementById('message-area').replaceChildren();
+}
+
+// Form submission handler
+document.getElementById('edit-form').addEventListener('submit', function(e) {
+    e.preventDefault();
+    saveSkill();
+});
+
+// Check if skill editor API is available
+async function checkAPIAvailability() {
+    try {
+        await fetch('http://localhost:5000/api/skills', {method: 'HEAD'});
+    } catch (error) {
+        console.warn('Skill editor API not available. Interactive editing disabled.');
+        const editBtn = document.querySelector('.edit-btn');
+        if (editBtn && !isBuiltIn) {
+            editBtn.disabled = true;
+            editBtn.textContent = '🔌 API Offline';
+            editBtn.title = 'Start the skill editor server to enable editing';
+        }
+    }
+}
+
+// Check API availability on page load
+checkAPIAvailability();
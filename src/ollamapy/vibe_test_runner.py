@@ -156,7 +156,7 @@ class VribeTestRunner:
         start_time = time.perf_counter()
         
         # Create a vibe test runner for this model
-        runner = BaseVibeTestRunner(model=model_name, analysis_model=model_name)
+        runner = BaseVibeTestRunner(model=model_name, analysis_model=model_name, client=self.client)
         
         # Run the tests
         success = runner.run_all_tests(iterations=iterations)
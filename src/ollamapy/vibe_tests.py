@@ -3,12 +3,11 @@
 import re
 import time
 import statistics
-from typing import List, Dict, Tuple, Any
+from typing import List, Dict, Tuple, Any, Optional
 from .ollama_client import OllamaClient
 from .model_manager import ModelManager
 from .analysis_engine import AnalysisEngine
 from .skills import get_actions_with_vibe_tests, clear_action_logs
-from .vibe_report import VibeTestReportGenerator
 
 
 class TimingStats:
@@ -113,16 +112,23 @@ class VibeTestRunner:
     including timing analysis.
     """
 
-    def __init__(self, model: str = "gemma3:4b", analysis_model: str = "gemma3:4b"):
+    def __init__(
+        self,
+        model: str = "gemma3:4b",
+        analysis_model: str = "gemma3:4b",
+        client: Optional[OllamaClient] = None,
+    ):
         """Initialize the vibe test runner.
 
         Args:
             model: The model to use for testing
             analysis_model: Optional separate model for action analysis (defaults to main model)
+            client: Optional client to share, so runners created one per model
+                reuse its pooled connections
         """
         self.model = model
         self.analysis_model = analysis_model or model
-        self.client = OllamaClient()
+        self.client = client or OllamaClient()
         self.model_manager = ModelManager(self.client)
         self.analysis_engine = AnalysisEngine(self.analysis_model, self.client)
         self.actions_with_tests = get_actions_with_vibe_tests()
@@ -471,7 +477,10 @@ class VibeTestRunner:
         # Store results for report generation
         self.all_test_results = test_results
 
-        # Generate and save the HTML report using the report generator
+        # Generate and save the HTML report using the report generator; imported
+        # here because plotly is slow to import and only the report needs it
+        from .vibe_report import VibeTestReportGenerator
+
         report_generator = VibeTestReportGenerator(self.model, self.analysis_model)
         filename = report_generator.save_report(test_results)
         print(f"\n📊 Report saved to: {filename}")
@@ -70,10 +70,25 @@ class TestArgumentParsing:
             with patch.object(sys, "exit") as mock_exit:
                 main()
                 mock_run_skill.assert_called_once_with(
-                    model="gemma3:4b", analysis_model="gemma3:4b", count=3, ideas=None
+                    model="gemma3:4b",
+                    analysis_model="gemma3:4b",
+                    count=3,
+                    ideas=None,
+                    verbose=True,
                 )
                 mock_exit.assert_called_once_with(0)
 
+    @patch("src.ollamapy.main.run_skill_gen")
+    def test_skillgen_quiet_argument(self, mock_run_skill):
+        """Test --quiet turns off skill generation progress output."""
+        mock_run_skill.return_value = True
+        test_args = ["ollamapy", "--skillgen", "--quiet"]
+
+        with patch.object(sys, "argv", test_args):
+            with patch.object(sys, "exit"):
+                main()
+                assert mock_run_skill.call_args.kwargs["verbose"] is False
+
     @patch("src.ollamapy.main.run_skill_editor")
     def test_skill_editor_argument(self, mock_run_editor):
         """Test --skill-editor argument processing."""
@@ -200,7 +215,7 @@ class TestSkillGenFunction:
 
         assert result is True
         mock_skill_gen.assert_called_once_with(
-            model="gemma3:4b", analysis_model=None, count=1, ideas=None
+            model="gemma3:4b", analysis_model=None, count=1, ideas=None, verbose=True
         )
 
     @patch("src.ollamapy.skill_generator.run_skill_generation")
@@ -215,7 +230,11 @@ class TestSkillGenFunction:
 
         assert result is False
         mock_skill_gen.assert_called_once_with(
-            model="custom-model", analysis_model="analysis-model", count=3, ideas=ideas
+            model="custom-model",
+            analysis_model="analysis-model",
+            count=3,
+            ideas=ideas,
+            verbose=True,
         )
 
 
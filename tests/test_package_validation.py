@@ -102,6 +102,24 @@ class TestImports:
             except ImportError as e:
                 pytest.fail(f"Failed to import {module_name}: {e}")
 
+    def test_package_import_defers_plotly(self):
+        """Test importing the package loads plotly only once a report needs it."""
+        import subprocess
+
+        code = (
+            "import sys, src.ollamapy as pkg\n"
+            "assert 'plotly' not in sys.modules\n"
+            "assert pkg.VibeTestReportGenerator.__name__ == 'VibeTestReportGenerator'\n"
+            "assert 'plotly' in sys.modules\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=Path(__file__).parent.parent,
+            capture_output=True,
+            text=True,
+        )
+        assert result.returncode == 0, result.stderr
+
     def test_optional_modules_graceful_failure(self):
         """Test optional modules fail gracefully when dependencies missing."""
         try:
@@ -356,6 +374,12 @@ class TestSecurityBasics:
                                     and node.func.id == "exec"
                                 ):
                                     continue
+                                # Allow exec() in the sandbox worker that test-runs generated skills
+                                if (
+                                    py_file.name == "sandbox_worker.py"
+                                    and node.func.id == "exec"
+                                ):
+                                    continue
                                 # Allow eval() in actions.py for calculator functionality
                                 if (
                                     py_file.name == "actions.py"
@@ -0,0 +1,64 @@
+"""Unit tests for the persistent LLM response cache."""
+
+import threading
+
+import pytest
+
+from src.ollamapy.llm_cache import LLMCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Create a cache in a temporary database."""
+    cache = LLMCache(str(tmp_path / "cache.sqlite"))
+    yield cache
+    cache.close()
+
+
+class TestLLMCache:
+    """Test storing and looking up responses."""
+
+    def test_keys_depend_on_model_and_prompt(self):
+        """Test that the same prompt for another model gets another key."""
+        key = LLMCache.make_key("model-a", "prompt")
+
+        assert key == LLMCache.make_key("model-a", "prompt")
+        assert key != LLMCache.make_key("model-b", "prompt")
+        assert key != LLMCache.make_key("model-a", "other prompt")
+
+    def test_put_get_delete(self, cache):
+        """Test the basic cache round trip."""
+        key = LLMCache.make_key("model", "prompt")
+        assert cache.get(key) is None
+
+        cache.put(key, "model", "response")
+        assert cache.get(key) == "response"
+
+        cache.delete(key)
+        assert cache.get(key) is None
+
+    def test_entries_persist_across_instances(self, tmp_path):
+        """Test that responses survive reopening the database."""
+        path = str(tmp_path / "cache.sqlite")
+        key = LLMCache.make_key("model", "prompt")
+
+        first = LLMCache(path)
+        first.put(key, "model", "response")
+        first.close()
+
+        second = LLMCache(path)
+        assert second.get(key) == "response"
+        second.close()
+
+    def test_usable_from_other_threads(self, cache):
+        """Test that worker threads can share one cache."""
+        keys = [LLMCache.make_key("model", str(i)) for i in range(8)]
+        threads = [
+            threading.Thread(target=cache.put, args=(key, "model", key)) for key in keys
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert all(cache.get(key) == key for key in keys)
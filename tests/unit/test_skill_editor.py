@@ -93,6 +93,15 @@ class TestSkillValidator:
         assert result.is_valid is False
         assert any("syntax" in error.lower() for error in result.errors)
 
+    def test_syntax_error_reported_without_execute(self):
+        """Test that broken code without execute still shows its syntax error."""
+        validator = SkillValidator()
+
+        result = validator._validate_function_code("def helper(:\n    pass")
+
+        assert result.is_valid is False
+        assert any("syntax" in error.lower() for error in result.errors)
+
     def test_missing_execute_function(self):
         """Test validation when execute function is missing."""
         validator = SkillValidator()
@@ -127,6 +136,156 @@ class TestSkillValidator:
         assert result.is_valid is False
         assert any("invalid type" in error.lower() for error in result.errors)
 
+    def test_dangerous_calls_detected_structurally(self):
+        """Test dangerous-call warnings come from the AST, not substrings."""
+        validator = SkillValidator()
+
+        skill_data = {
+            "name": "risky_skill",
+            "description": "Use this skill to test dangerous call detection",
+            "function_code": (
+                "import os\n"
+                "def execute():\n"
+                "    os.system('ls')\n"
+                "    log('[Risky] my_eval(1) is only text')"
+            ),
+        }
+
+        result = validator.validate_skill_data(skill_data)
+        assert "Using os.system() can be dangerous" in result.warnings
+        assert "Using eval() can be dangerous" not in result.warnings
+        assert not any("log()" in warning for warning in result.warnings)
+
+    @pytest.mark.parametrize(
+        "body, warning",
+        [
+            ("    builtins.eval('1')", "Using eval() can be dangerous"),
+            ("    e = exec\n    e('x = 1')", "Using exec() can be dangerous"),
+            (
+                "    run = os.system\n    run('ls')",
+                "Using os.system() can be dangerous",
+            ),
+        ],
+    )
+    def test_dangerous_references_are_detected(self, body, warning):
+        """Test that dangerous calls are flagged through modules and aliases."""
+        validator = SkillValidator()
+
+        code = f"import builtins, os\ndef execute():\n{body}\n    log('x')"
+        result = validator._validate_function_code(code)
+
+        assert warning in result.warnings
+        assert result.is_valid is True
+
+    def test_async_execute_is_rejected(self):
+        """Test that an async execute, which would never be awaited, is an error."""
+        validator = SkillValidator()
+
+        result = validator._validate_function_code(
+            "async def execute():\n    log('never runs')"
+        )
+
+        assert result.is_valid is False
+        assert any("must not be async" in error for error in result.errors)
+
+    def test_description_usage_hint(self):
+        """Test the warning for descriptions that don't say when to use a skill."""
+        validator = SkillValidator()
+        hint = "Description should clearly indicate when this skill should be used"
+
+        assert hint in validator._validate_description("Reverses text easily").warnings
+        assert hint not in validator._validate_description("USE for text").warnings
+
+    def test_validation_results_are_cached(self):
+        """Test that identical skill data reuses the cached result."""
+        validator = SkillValidator()
+
+        skill_data = {
+            "name": "cached_skill",
+            "description": "Use this skill to test validation caching",
+            "function_code": "def execute():\n    log('[Cached] OK')",
+        }
+
+        with patch.object(
+            validator, "_validate_skill_data", wraps=validator._validate_skill_data
+        ) as spy:
+            first = validator.validate_skill_data(skill_data)
+            second = validator.validate_skill_data(dict(skill_data))
+            assert spy.call_count == 1
+
+            first.errors.append("mutated")
+            assert second.errors == []
+
+            skill_data["name"] = "invalid-name"
+            assert validator.validate_skill_data(skill_data).is_valid is False
+            assert spy.call_count == 2
+
+    def test_non_json_values_are_not_confused_in_cache(self):
+        """Test that a tuple is not served the cached result of an equal list."""
+        validator = SkillValidator()
+        skill_data = {
+            "name": "phrases_skill",
+            "description": "Use this skill to test validation caching",
+            "function_code": "def execute():\n    log('[Cached] OK')",
+            "vibe_test_phrases": ["only phrase"],
+        }
+
+        hint = "Consider adding more vibe test phrases for better AI recognition"
+
+        assert hint in validator.validate_skill_data(skill_data).warnings
+        result = validator.validate_skill_data(
+            dict(skill_data, vibe_test_phrases=tuple(skill_data["vibe_test_phrases"]))
+        )
+
+        assert hint not in result.warnings
+
+    def test_validate_many_matches_single_validation(self):
+        """Test batch validation returns results in input order."""
+        validator = SkillValidator()
+
+        skills = [
+            {
+                "name": f"batch_skill_{i}" if i % 3 else f"bad-name-{i}",
+                "description": "Use this skill to test batch validation",
+                "function_code": "def execute():\n    log('[Batch] OK')",
+            }
+            for i in range(validator.PARALLEL_THRESHOLD + 2)
+        ]
+
+        results = validator.validate_many(skills, max_workers=2)
+
+        assert len(results) == len(skills)
+        for skill_data, result in zip(skills, results):
+            expected = SkillValidator().validate_skill_data(skill_data)
+            assert result.is_valid == expected.is_valid
+            assert result.errors == expected.errors
+
+    def test_validate_many_only_falls_back_when_workers_are_unavailable(self):
+        """Test that batch validation runs serially without worker processes."""
+        validator = SkillValidator()
+        skills = [
+            {
+                "name": f"fallback_skill_{i}",
+                "description": "Use this skill to test the serial fallback",
+                "function_code": "def execute():\n    log('[Fallback] OK')",
+            }
+            for i in range(validator.PARALLEL_THRESHOLD + 2)
+        ]
+
+        with patch(
+            "src.ollamapy.skill_editor.validator.ProcessPoolExecutor",
+            side_effect=NotImplementedError,
+        ):
+            results = validator.validate_many(skills, max_workers=2)
+        assert all(result.is_valid for result in results)
+
+        with patch(
+            "src.ollamapy.skill_editor.validator.ProcessPoolExecutor",
+            side_effect=RuntimeError("unexpected"),
+        ):
+            with pytest.raises(RuntimeError):
+                SkillValidator().validate_many(skills, max_workers=2)
+
 
 @pytest.mark.skipif(not FLASK_AVAILABLE, reason="Flask not available")
 class TestSkillEditorAPI:
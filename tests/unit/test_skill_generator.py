@@ -0,0 +1,923 @@
+"""Unit tests for the incremental skill generator."""
+
+import json
+import os
+import threading
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+from src.ollamapy.skill_generator import IncrementalSkillGenerator, SkillPlan
+from src.ollamapy.skills import SkillRegistry
+
+
+@pytest.fixture
+def generator(tmp_path):
+    """Create a generator backed by a mocked Ollama client."""
+    client = MagicMock()
+    client.get_model_context_size.return_value = 4096
+    # Streamed requests are answered in one chunk from the generate responses
+    client.generate_stream.side_effect = lambda *args, **kwargs: iter(
+        [client.generate(*args, **kwargs)]
+    )
+
+    with patch("src.ollamapy.skill_generator.OllamaClient", return_value=client), patch(
+        "src.ollamapy.skill_generator.SkillRegistry",
+        side_effect=lambda: SkillRegistry(str(tmp_path)),
+    ):
+        yield IncrementalSkillGenerator("test-model")
+
+
+PLAN_METADATA = {
+    "name": "reverse_text",
+    "description": "Use when the user wants to reverse a piece of text",
+    "role": "text_processing",
+    "vibe_test_phrases": ["Reverse this", "Flip hello", "Backwards please"],
+    "parameters": {
+        "text": {"type": "string", "description": "Text to reverse", "required": True}
+    },
+}
+
+FUNCTION_CODE = "def execute(text: str):\n    log(text[::-1])"
+
+
+class TestModelResidency:
+    """Test that models stay loaded for the duration of a run."""
+
+    def test_client_keeps_models_alive(self, tmp_path):
+        """Test that the generator's client asks Ollama to keep models loaded."""
+        with patch("src.ollamapy.skill_generator.OllamaClient") as client_cls, patch(
+            "src.ollamapy.skill_generator.SkillRegistry",
+            side_effect=lambda: SkillRegistry(str(tmp_path)),
+        ):
+            IncrementalSkillGenerator("test-model")
+
+        client_cls.assert_called_once_with(
+            keep_alive=IncrementalSkillGenerator.KEEP_ALIVE
+        )
+
+    def test_warm_up_and_release_each_model_once(self, generator):
+        """Test that a shared generation/analysis model is loaded only once."""
+        generator.warm_up_models()
+        generator.release_models()
+
+        generator.client.load_model.assert_called_once_with("test-model")
+        generator.client.unload_model.assert_called_once_with("test-model")
+
+
+class TestBuildSkillPlan:
+    """Test plan construction from model responses."""
+
+    def test_plan_metadata_from_single_request(self, generator):
+        """Test that one structured response fills the whole plan."""
+        generator.client.generate.side_effect = [
+            json.dumps(PLAN_METADATA),
+            FUNCTION_CODE,
+        ]
+
+        plan = generator.build_skill_plan("Reverse a string")
+
+        assert generator.client.generate.call_count == 2
+        assert generator.client.generate.call_args_list[0].kwargs["format"]
+        assert plan.name == "reverse_text"
+        assert plan.role == "text_processing"
+        assert plan.vibe_test_phrases == PLAN_METADATA["vibe_test_phrases"]
+        assert plan.parameters == PLAN_METADATA["parameters"]
+        assert plan.function_code == FUNCTION_CODE
+
+    def test_metadata_schema_mirrors_plan_validation(self, generator):
+        """Test that the schema constrains fields the plan validation checks."""
+        generator.client.generate.return_value = json.dumps(PLAN_METADATA)
+
+        generator.generate_plan_metadata("Reverse a string")
+
+        properties = generator.client.generate.call_args.kwargs["format"]["properties"]
+        assert properties["name"]["pattern"] == "^[a-z_][a-z0-9_]*$"
+        assert properties["description"]["minLength"] == 10
+        assert properties["vibe_test_phrases"]["minItems"] == 3
+
+    def test_steps_share_one_system_prompt(self, generator):
+        """Test that every planning request sends the same idea-level system prompt."""
+        metadata = dict(PLAN_METADATA, role="not_a_role")
+        generator.client.generate.side_effect = [
+            json.dumps(metadata),
+            "A",
+            FUNCTION_CODE,
+        ]
+
+        generator.build_skill_plan("Reverse a string")
+
+        systems = {
+            call.kwargs["system"] for call in generator.client.generate.call_args_list
+        }
+        assert len(systems) == 1
+        assert '"Reverse a string"' in systems.pop()
+
+    def test_system_prompt_starts_with_static_prefix(self, generator):
+        """Test that the idea goes last and braces in it are kept verbatim."""
+        system = generator.skill_system_prompt("Format {name} as JSON")
+
+        assert system.startswith(IncrementalSkillGenerator.SYSTEM_PROMPT_PREFIX)
+        assert system.endswith('Skill idea: "Format {name} as JSON"')
+
+    def test_code_stream_stops_when_response_is_not_code(self, generator):
+        """Test that a rambling code response is cut off and the stream closed."""
+        sent = []
+
+        def ramble(*args, **kwargs):
+            try:
+                while True:
+                    sent.append("words ")
+                    yield "words "
+            finally:
+                sent.append("closed")
+
+        generator.client.generate_stream.side_effect = ramble
+        plan = SkillPlan(idea="Reverse a string", description="Reverse text")
+
+        code = generator.generate_function_code(plan)
+
+        assert sent[-1] == "closed"
+        assert len(code) < 2 * IncrementalSkillGenerator.CODE_START_CHARS
+        assert generator.client.generate_stream.call_args.kwargs["options"] == (
+            IncrementalSkillGenerator.CODE_OPTIONS
+        )
+
+    def test_quiet_generator_prints_nothing(self, generator, capsys):
+        """Test that step progress is suppressed when verbose is off."""
+        generator.verbose = False
+        generator.client.generate.side_effect = [
+            json.dumps(PLAN_METADATA),
+            FUNCTION_CODE,
+        ]
+
+        generator.build_skill_plan("Reverse a string")
+
+        assert capsys.readouterr().out == ""
+
+    def test_missing_metadata_falls_back_to_step_prompts(self, generator):
+        """Test that malformed fields are generated individually."""
+        metadata = dict(PLAN_METADATA, role="not_a_role")
+        generator.client.generate.side_effect = [
+            json.dumps(metadata),
+            "B",
+            FUNCTION_CODE,
+        ]
+
+        plan = generator.build_skill_plan("Reverse a string")
+
+        assert generator.client.generate.call_count == 3
+        assert plan.role == "mathematics"
+        assert plan.name == "reverse_text"
+
+    def test_parameters_use_schema_constrained_output(self, generator):
+        """Test that the parameter step requests schema-constrained JSON."""
+        from src.ollamapy.skill_generator import PARAMETERS_SCHEMA
+
+        generator.client.generate.return_value = json.dumps(PLAN_METADATA["parameters"])
+
+        parameters = generator.generate_parameters("Reverse a string", "reverse_text")
+
+        assert parameters == PLAN_METADATA["parameters"]
+        assert generator.client.generate.call_args.kwargs["format"] == (
+            PARAMETERS_SCHEMA
+        )
+
+    def test_classification_steps_use_analysis_model(self, tmp_path):
+        """Test that name and role are asked of the analysis model."""
+        client = MagicMock()
+        client.generate.side_effect = ["reverse_text", "A"]
+
+        with patch(
+            "src.ollamapy.skill_generator.OllamaClient", return_value=client
+        ), patch(
+            "src.ollamapy.skill_generator.SkillRegistry",
+            side_effect=lambda: SkillRegistry(str(tmp_path)),
+        ):
+            generator = IncrementalSkillGenerator("big-model", "small-model")
+
+        assert generator.generate_skill_name("Reverse a string") == "reverse_text"
+        assert generator.generate_skill_role("Reverse a string") == "text_processing"
+
+        for call in client.generate.call_args_list:
+            assert call.args[0] == "small-model"
+            assert call.kwargs["options"]["temperature"] == 0.0
+
+    def test_short_answer_steps_cap_generation(self, generator):
+        """Test that short-answer steps send num_predict and stop sequences."""
+        generator.client.generate.side_effect = [
+            "reverse_text",
+            "A",
+            '"Use when the user wants to reverse text"',
+        ]
+
+        generator.generate_skill_name("Reverse a string")
+        generator.generate_skill_role("Reverse a string")
+        description = generator.generate_skill_description("Reverse a string")
+
+        assert description == "Use when the user wants to reverse text"
+        for call in generator.client.generate.call_args_list:
+            assert call.kwargs["options"]["num_predict"] <= 80
+            assert call.kwargs["options"]["stop"]
+
+    def test_vibe_test_phrases_parsed_from_list(self, generator):
+        """Test that numbered and bulleted list items become phrases."""
+        generator.client.generate.return_value = (
+            "Here you go:\n1. Reverse this  \n2) Flip hello\n- Backwards please\n"
+            "4. Mirror it\n5. Turn it around\n6. One too many"
+        )
+
+        phrases = generator.generate_vibe_test_phrases("Reverse a string", "rev")
+
+        assert phrases == [
+            "Reverse this",
+            "Flip hello",
+            "Backwards please",
+            "Mirror it",
+            "Turn it around",
+        ]
+
+
+class TestDuplicateIdeas:
+    """Test near-duplicate idea detection with embeddings."""
+
+    def test_near_duplicate_ideas_are_detected(self, generator):
+        """Test that ideas with similar embeddings are flagged."""
+        embeddings = {
+            "Convert text case": [1.0, 0.0, 0.1],
+            "Change text casing": [0.9, 0.0, 0.1],
+            "Add two numbers": [0.0, 1.0, 0.0],
+        }
+        generator.client.embed.side_effect = lambda model, text: embeddings[text]
+
+        assert generator.find_similar_idea("Convert text case") is None
+        assert generator.find_similar_idea("Change text casing") == (
+            "Convert text case"
+        )
+        assert generator.find_similar_idea("Add two numbers") is None
+        assert [idea for idea, _ in generator.seen_ideas] == [
+            "Convert text case",
+            "Add two numbers",
+        ]
+
+    def test_missing_embedding_model_disables_check(self, generator):
+        """Test that a failed embedding request turns detection off."""
+        generator.client.embed.return_value = None
+
+        assert generator.find_similar_idea("Convert text case") is None
+        assert generator.find_similar_idea("Convert text case") is None
+        generator.client.embed.assert_called_once()
+
+    def test_similar_successful_skill_is_used_as_template(self, generator):
+        """Test that a close idea reuses the role, parameters and code sketch."""
+        embeddings = {
+            "Reverse a string": [1.0, 0.1, 0.0],
+            "Reverse the words in a sentence": [0.9, 0.3, 0.0],
+        }
+        generator.client.embed.side_effect = lambda model, text: embeddings[text]
+        generator.remember_skill_template(
+            SkillPlan(
+                idea="Reverse a string",
+                name="reverse_text",
+                role="text_processing",
+                parameters=PLAN_METADATA["parameters"],
+                function_code=FUNCTION_CODE,
+            )
+        )
+        metadata = {
+            "name": "reverse_words",
+            "description": "Use when the user wants to reverse the word order",
+            "vibe_test_phrases": ["Reverse these words", "Flip word order", "Words"],
+        }
+        generator.client.generate.side_effect = [json.dumps(metadata), FUNCTION_CODE]
+
+        plan = generator.build_skill_plan("Reverse the words in a sentence")
+
+        metadata_call, code_call = generator.client.generate.call_args_list
+        assert set(metadata_call.kwargs["format"]["properties"]) == {
+            "name",
+            "description",
+            "vibe_test_phrases",
+        }
+        assert FUNCTION_CODE in code_call.args[1]
+        assert plan.name == "reverse_words"
+        assert plan.role == "text_processing"
+        assert plan.parameters == PLAN_METADATA["parameters"]
+        assert plan.parameters is not PLAN_METADATA["parameters"]
+        plan.parameters["text"]["required"] = False
+        assert PLAN_METADATA["parameters"]["text"]["required"] is True
+
+    def test_batch_ideas_parsed_and_deduplicated(self, generator):
+        """Test that one response yields several ideas without near-duplicates."""
+        generator.client.generate.return_value = (
+            "1. Count words in text\n"
+            "2. Count the words in a text\n"
+            "3. Reverse a string\n"
+            "4. Check if a number is even"
+        )
+        vectors = {
+            "Count words in text": [1.0, 0.0],
+            "Count the words in a text": [0.99, 0.1],
+            "Reverse a string": [0.0, 1.0],
+            "Check if a number is even": [0.7, -0.7],
+        }
+        generator.client.embed.side_effect = lambda model, idea: vectors[idea]
+
+        ideas = generator.generate_skill_ideas(2)
+
+        assert generator.client.generate.call_count == 1
+        assert ideas == ["Count words in text", "Reverse a string"]
+
+
+class TestGenerateSkill:
+    """Test the generate/validate retry loop."""
+
+    @pytest.mark.parametrize("name", ["3d_rotate", "résumé_parser", "count-words"])
+    def test_non_identifier_names_are_rejected(self, generator, name):
+        """Test that names exec would choke on fail before any code is run."""
+        plan = SkillPlan(
+            name=name,
+            description=PLAN_METADATA["description"],
+            vibe_test_phrases=PLAN_METADATA["vibe_test_phrases"],
+            function_code=FUNCTION_CODE,
+        )
+
+        valid, errors = generator.validate_and_test_plan(plan)
+
+        assert not valid
+        assert errors == ["Invalid skill name"]
+
+    @pytest.mark.parametrize(
+        "code",
+        [
+            "def run():\n    log('call execute')",
+            "# def execute():\ndef run():\n    pass",
+            "class Skill:\n    def execute(self):\n        pass",
+            "Here is the function: def execute()",
+        ],
+    )
+    def test_code_without_top_level_execute_is_rejected(self, generator, code):
+        """Test that only a real top-level execute definition counts."""
+        plan = SkillPlan(
+            name="reverse_text",
+            description=PLAN_METADATA["description"],
+            vibe_test_phrases=PLAN_METADATA["vibe_test_phrases"],
+            function_code=code,
+        )
+
+        valid, errors = generator.validate_and_test_plan(plan)
+
+        assert not valid
+        assert generator.classify_validation_errors(errors) == {"CODE_MISSING_DEF"}
+
+    def test_code_without_execute_is_rejected_before_parsing(self, generator):
+        """Test that a runaway prose response never reaches the parser."""
+        plan = SkillPlan(
+            name="reverse_text",
+            description=PLAN_METADATA["description"],
+            vibe_test_phrases=PLAN_METADATA["vibe_test_phrases"],
+            function_code="I would reverse the text like this. " * 10000,
+        )
+
+        with patch("src.ollamapy.skill_generator.ast.parse") as parse:
+            valid, errors = generator.validate_and_test_plan(plan)
+
+        parse.assert_not_called()
+        assert not valid
+        assert errors == ["Function code missing or invalid"]
+
+    def test_validated_code_object_is_registered(self, generator):
+        """Test that the registry reuses the code compiled during validation."""
+        generator.client.generate.side_effect = [
+            json.dumps(dict(PLAN_METADATA, parameters={})),
+            "def execute():\n    log('olleh')",
+        ]
+        generator.skill_registry.register_skill = MagicMock(return_value=True)
+
+        result = generator.generate_skill("Reverse a string", run_vibe_test=False)
+
+        assert result.success
+        precompiled = generator.skill_registry.register_skill.call_args.kwargs[
+            "precompiled"
+        ]
+        assert precompiled is result.plan.compiled_code
+        assert precompiled.co_filename == "<skill>"
+
+    def test_code_failure_retries_only_the_code(self, generator):
+        """Test that a failing function is regenerated without replanning."""
+        generator.client.generate.side_effect = [
+            json.dumps(PLAN_METADATA),
+            "def execute(text: str):\n    raise ValueError('boom')",
+            FUNCTION_CODE,
+        ]
+        generator.code_executor.test_code_safely = MagicMock(
+            side_effect=[(False, "ERROR: boom"), (True, "SUCCESS")]
+        )
+
+        result = generator.generate_skill("Reverse a string", run_vibe_test=False)
+
+        assert result.success
+        assert result.attempts == 2
+        assert generator.client.generate.call_count == 3
+        assert result.skill.function_code == FUNCTION_CODE
+
+    def test_validated_code_is_reused_from_cache(self, generator):
+        """Test that code which passed validation is reused for the same prompt."""
+        generator.get_existing_skills_summary = MagicMock(return_value="")
+        generator.client.generate.side_effect = [
+            json.dumps(PLAN_METADATA),
+            FUNCTION_CODE,
+        ]
+        generator.code_executor.test_code_safely = MagicMock(
+            return_value=(True, "SUCCESS")
+        )
+
+        result = generator.generate_skill("Reverse a string", run_vibe_test=False)
+        assert result.success
+
+        generator.client.generate.reset_mock()
+        assert generator.generate_function_code(result.plan) == FUNCTION_CODE
+        generator.client.generate.assert_not_called()
+
+    def test_invalid_name_retries_only_the_name(self, generator):
+        """Test that a bad name is regenerated without touching the rest."""
+        generator.build_skill_plan = MagicMock(
+            return_value=SkillPlan(
+                idea="Reverse a string",
+                name="reverse-text!",
+                description=PLAN_METADATA["description"],
+                vibe_test_phrases=PLAN_METADATA["vibe_test_phrases"],
+                parameters=PLAN_METADATA["parameters"],
+                function_code=FUNCTION_CODE,
+                role="text_processing",
+            )
+        )
+        generator.client.generate.return_value = "reverse_text"
+        generator.code_executor.test_code_safely = MagicMock(
+            return_value=(True, "SUCCESS")
+        )
+
+        result = generator.generate_skill("Reverse a string", run_vibe_test=False)
+
+        assert result.success
+        assert result.skill.name == "reverse_text"
+        generator.build_skill_plan.assert_called_once()
+        assert generator.client.generate.call_count == 1
+
+    def test_code_waits_until_metadata_passes(self, generator):
+        """Test that no code is generated for a plan whose metadata failed."""
+        generator.client.generate.side_effect = [
+            json.dumps(dict(PLAN_METADATA, description="Short")),
+            '"Use when the user wants to reverse a piece of text"',
+            FUNCTION_CODE,
+        ]
+        generator.code_executor.test_code_safely = MagicMock(
+            return_value=(True, "SUCCESS")
+        )
+
+        result = generator.generate_skill("Reverse a string", run_vibe_test=False)
+
+        assert result.success
+        assert result.attempts == 2
+        assert generator.client.generate.call_count == 3
+        assert generator.client.generate_stream.call_count == 1
+        assert result.skill.function_code == FUNCTION_CODE
+
+    def test_repeated_deterministic_failure_stops_early(self, generator):
+        """Test that the same deterministic failure twice ends the attempts."""
+        generator.client.generate.side_effect = [
+            json.dumps(PLAN_METADATA),
+            "print('no function here')",
+            "print('still no function')",
+        ]
+
+        result = generator.generate_skill(
+            "Reverse a string", max_attempts=3, run_vibe_test=False
+        )
+
+        assert not result.success
+        assert result.attempts == 2
+        assert generator.client.generate.call_count == 3
+
+
+class TestIsolatedVibeTest:
+    """Test the vibe test run after a skill is generated."""
+
+    @pytest.fixture(autouse=True)
+    def serial_vibe_pool(self, generator):
+        """Send vibe test requests one at a time, in order, so early stops are exact."""
+        generator._vibe_pool.shutdown()
+        generator._vibe_pool = ThreadPoolExecutor(max_workers=1)
+
+    @staticmethod
+    def _answering(*answers):
+        """Mock the analysis query so successive requests return answers."""
+        query = MagicMock()
+        query.structured.side_effect = [MagicMock(data=data) for data in answers]
+        return query
+
+    @pytest.fixture
+    def skill(self):
+        """A skill with the three phrases the vibe test asks about."""
+        skill = MagicMock()
+        skill.name = "reverse_text"
+        skill.description = PLAN_METADATA["description"]
+        skill.vibe_test_phrases = PLAN_METADATA["vibe_test_phrases"]
+        return skill
+
+    def test_all_phrases_asked_in_one_request(self, generator, skill):
+        """Test each iteration asks about every phrase with a boolean array schema."""
+        generator.analysis_query = self._answering(
+            [True, False, True], [True, False, False]
+        )
+
+        passed, results = generator.run_isolated_vibe_test(skill)
+
+        assert generator.analysis_query.structured.call_count == 2
+        call = generator.analysis_query.structured.call_args
+        for phrase in PLAN_METADATA["vibe_test_phrases"]:
+            assert phrase in call.args[0]
+        assert call.kwargs["schema"]["items"] == {"type": "boolean"}
+        assert call.kwargs["schema"]["minItems"] == 3
+        assert passed is True
+        assert results["total_tests"] == 6
+        assert results["total_correct"] == 3
+        assert results["phrase_results"]["Flip hello"]["correct"] == 0
+        assert results["phrase_results"]["Reverse this"]["correct"] == 2
+        assert results["phrase_results"]["Backwards please"]["correct"] == 1
+
+    def test_stops_once_pass_is_certain(self, generator, skill):
+        """Test that later requests do not count once the pass is settled."""
+        generator.analysis_query = self._answering(
+            [True, True, True], [False, False, False]
+        )
+
+        passed, results = generator.run_isolated_vibe_test(skill)
+
+        assert passed is True
+        assert results["total_tests"] == 3
+        assert results["total_correct"] == 3
+        assert results["phrase_results"]["Flip hello"]["total"] == 1
+
+    def test_malformed_answers_count_as_no(self, generator, skill):
+        """Test that missing or non-boolean answers are treated as "no"."""
+        generator.analysis_query = self._answering([True], None)
+
+        passed, results = generator.run_isolated_vibe_test(skill)
+
+        assert passed is False
+        assert results["total_tests"] == 6
+        assert results["total_correct"] == 1
+        assert results["phrase_results"]["Reverse this"]["correct"] == 1
+
+    def test_deterministic_mode_asks_once(self, generator, skill):
+        """Test that greedy vibe tests send one request and scale the counts."""
+        generator.deterministic = True
+        generator.analysis_query = self._answering([True, False, True])
+
+        passed, results = generator.run_isolated_vibe_test(skill)
+
+        assert generator.analysis_query.structured.call_count == 1
+        call = generator.analysis_query.structured.call_args
+        assert call.kwargs["model_options"] == {"temperature": 0.0}
+        assert passed is True
+        assert results["total_tests"] == 6
+        assert results["total_correct"] == 4
+        assert results["phrase_results"]["Flip hello"]["correct"] == 0
+        assert results["phrase_results"]["Reverse this"]["correct"] == 2
+
+
+class TestRunSkillGeneration:
+    """Test the batch generation entry point."""
+
+    def test_vibe_tests_run_after_generation_is_pipelined(self):
+        """Test that vibe results are attached to each generated skill."""
+        from src.ollamapy.skill_generator import (
+            SkillGenerationResult,
+            run_skill_generation,
+        )
+
+        generator = MagicMock()
+        generator.generate_skill.side_effect = lambda idea, **kwargs: (
+            SkillGenerationResult(
+                success=True,
+                skill=MagicMock(name=idea),
+                plan=None,
+                step_results={"vibe_test_passed": False},
+                errors=[],
+                generation_time=1.0,
+                attempts=1,
+            )
+        )
+        generator.run_isolated_vibe_test.return_value = (True, {"success_rate": 100})
+        generator.max_parallel_requests = 1
+
+        with patch(
+            "src.ollamapy.skill_generator.IncrementalSkillGenerator",
+            return_value=generator,
+        ):
+            assert run_skill_generation(
+                count=2, ideas=["a", "b"], generate_report=False
+            )
+
+        assert generator.generate_skill.call_count == 2
+        for call in generator.generate_skill.call_args_list:
+            assert call.kwargs["run_vibe_test"] is False
+        assert generator.run_isolated_vibe_test.call_count == 2
+        generator.warm_up_models.assert_called_once()
+        generator.release_models.assert_called_once()
+        generator.close.assert_called_once()
+
+    def test_skills_are_generated_concurrently(self):
+        """Test that skills are generated in parallel up to the server limit."""
+        from src.ollamapy.skill_generator import (
+            SkillGenerationResult,
+            run_skill_generation,
+        )
+
+        both_started = threading.Barrier(2, timeout=5)
+
+        def generate_skill(idea, **kwargs):
+            both_started.wait()  # Raises if the two generations don't overlap
+            return SkillGenerationResult(
+                success=False,
+                skill=None,
+                plan=None,
+                step_results={},
+                errors=["failed"],
+                generation_time=1.0,
+                attempts=1,
+            )
+
+        generator = MagicMock()
+        generator.generate_skill.side_effect = generate_skill
+        generator.max_parallel_requests = 2
+
+        with patch(
+            "src.ollamapy.skill_generator.IncrementalSkillGenerator",
+            return_value=generator,
+        ):
+            assert not run_skill_generation(
+                count=2, ideas=["a", "b"], generate_report=False
+            )
+
+        assert generator.generate_skill.call_count == 2
+
+    def test_generator_is_closed_when_generation_fails(self):
+        """Test that the generator is closed and models released if generation raises."""
+        from src.ollamapy.skill_generator import run_skill_generation
+
+        generator = MagicMock()
+        generator.generate_skill.side_effect = RuntimeError("server went away")
+        generator.max_parallel_requests = 1
+
+        with patch(
+            "src.ollamapy.skill_generator.IncrementalSkillGenerator",
+            return_value=generator,
+        ):
+            with pytest.raises(RuntimeError):
+                run_skill_generation(count=1, ideas=["a"], generate_report=False)
+
+        generator.close.assert_called_once()
+        generator.release_models.assert_called_once()
+
+    def test_batch_ideas_are_requested_once(self):
+        """Test that ideas missing from the batch come from a single request."""
+        from src.ollamapy.skill_generator import (
+            SkillGenerationResult,
+            run_skill_generation,
+        )
+
+        generator = MagicMock()
+        generator.generate_skill_ideas.return_value = ["b", "c"]
+        generator.generate_skill.return_value = SkillGenerationResult(
+            success=False,
+            skill=None,
+            plan=None,
+            step_results={},
+            errors=["failed"],
+            generation_time=1.0,
+            attempts=1,
+        )
+        generator.max_parallel_requests = 1
+
+        with patch(
+            "src.ollamapy.skill_generator.IncrementalSkillGenerator",
+            return_value=generator,
+        ):
+            run_skill_generation(count=4, ideas=["a"], generate_report=False)
+
+        generator.generate_skill_ideas.assert_called_once_with(3)
+        ideas = [call.args[0] for call in generator.generate_skill.call_args_list]
+        assert ideas == ["a", "b", "c", None]
+
+
+class TestSafeCodeExecutor:
+    """Test sandboxed execution of generated code."""
+
+    @pytest.fixture(params=[False, True], ids=["in_process", "isolated"])
+    def executor(self, request):
+        """Create an executor for each mode and stop its worker afterwards."""
+        from src.ollamapy.skill_generator import SafeCodeExecutor
+
+        executor = SafeCodeExecutor(isolated=request.param)
+        yield executor
+        executor.close()
+
+    @pytest.fixture
+    def isolated_executor(self):
+        """Create an executor that runs tests in the sandbox worker."""
+        from src.ollamapy.skill_generator import SafeCodeExecutor
+
+        executor = SafeCodeExecutor(isolated=True)
+        yield executor
+        executor.close()
+
+    def test_successful_code_reports_logs(self, executor):
+        """Test that logged messages are returned on success."""
+        success, output = executor.test_code_safely(FUNCTION_CODE, {"text": "abc"})
+
+        assert success is True
+        assert output.splitlines() == ["SUCCESS", "LOG: cba"]
+
+    def test_failing_code_reports_error(self, executor):
+        """Test that exceptions raised by execute are reported."""
+        success, output = executor.test_code_safely(
+            "def execute():\n    raise ValueError('boom')"
+        )
+
+        assert success is False
+        assert "boom" in output
+
+    def test_whitelisted_imports_are_usable(self, executor):
+        """Test that allowed modules can be imported by skill code."""
+        success, output = executor.test_code_safely(
+            "import math\ndef execute():\n    log(math.sqrt(16))"
+        )
+
+        assert success is True
+        assert "LOG: 4.0" in output
+
+    @pytest.mark.parametrize(
+        "code",
+        [
+            "import subprocess\ndef execute():\n    pass",
+            "def execute():\n    eval('1 + 1')",
+            "def execute():\n    open('/tmp/x', 'w')",
+            "def execute():\n    log(().__class__.__bases__)",
+            "import os\ndef execute():\n    os.remove('/tmp/x')",
+            "while True:\n    pass\ndef execute():\n    pass",
+            "log('loaded')\ndef execute():\n    pass",
+            "X = log('loaded at import')\ndef execute():\n    pass",
+            "X = [log(i) for i in range(3)]\ndef execute():\n    pass",
+            "class C:\n    for i in range(3):\n        pass\ndef execute():\n    pass",
+            "def execute(x=log('default')):\n    pass",
+        ],
+    )
+    def test_unsafe_code_is_rejected(self, executor, code):
+        """Test that the AST whitelist rejects code before it runs."""
+        success, output = executor.test_code_safely(code)
+
+        assert success is False
+        assert "not allowed" in output
+
+    @pytest.mark.parametrize(
+        "code",
+        [
+            "import os\ndef execute():\n    getattr(os, 'sys' + 'tem')('true')",
+            "import os\ndef execute():\n    os.chdir('/')",
+            "import os\ndef execute():\n    os.environ['X'] = '1'",
+            "from os import _exit\ndef execute():\n    _exit(1)",
+            "import os as o\ndef execute():\n    o.abort()",
+        ],
+    )
+    def test_in_process_code_cannot_touch_this_process(self, code):
+        """Test that in-process tests only get a read-only part of os."""
+        from src.ollamapy.skill_generator import SafeCodeExecutor
+
+        cwd = os.getcwd()
+        success, output = SafeCodeExecutor(isolated=False).test_code_safely(code)
+
+        assert success is False
+        assert "not allowed" in output
+        assert os.getcwd() == cwd and "X" not in os.environ
+
+    def test_top_level_definitions_are_allowed(self, executor):
+        """Test that docstrings, imports and constants may precede execute."""
+        success, output = executor.test_code_safely(
+            '"""Greets."""\nimport math\nGREETING = "hi"\n'
+            "def execute():\n    log(GREETING)"
+        )
+
+        assert success is True
+        assert "LOG: hi" in output
+
+    def test_method_names_matching_forbidden_calls_are_allowed(self, executor):
+        """Test that only real dotted calls on modules are rejected."""
+        success, output = executor.test_code_safely(
+            "# Remove the first item\n"
+            "def execute():\n"
+            "    items = [1, 2]\n"
+            "    items.remove(1)\n"
+            "    log(items)"
+        )
+
+        assert success is True
+        assert "LOG: [2]" in output
+
+    def test_checked_code_is_cached_on_disk(self, tmp_path):
+        """Test that compiled code is reused across executors, unsafe code never."""
+        from src.ollamapy.skill_generator import SafeCodeExecutor
+
+        first = SafeCodeExecutor(cache_dir=str(tmp_path))
+        code, error = first.compile_checked(FUNCTION_CODE)
+        assert error is None
+        _, error = first.compile_checked("def execute():\n    eval('1')")
+        assert "eval" in error
+        assert len(list(tmp_path.iterdir())) == 1
+
+        second = SafeCodeExecutor(cache_dir=str(tmp_path))
+        with patch("src.ollamapy.skill_generator.compile", create=True) as mock_compile:
+            cached, error = second.compile_checked(FUNCTION_CODE)
+
+        mock_compile.assert_not_called()
+        assert error is None
+        assert cached == code
+        success, output = second.test_code_safely(FUNCTION_CODE, {"text": "abc"})
+        assert success is True
+        assert "LOG: cba" in output
+
+    def test_cached_code_is_checked_against_current_rules(self, tmp_path):
+        """Test that code cached under looser rules is rejected once they tighten."""
+        from src.ollamapy.skill_generator import SafeCodeExecutor
+
+        code = "import math\ndef execute():\n    log(math.pi)"
+        first = SafeCodeExecutor(cache_dir=str(tmp_path))
+        assert first.compile_checked(code)[1] is None
+
+        second = SafeCodeExecutor(cache_dir=str(tmp_path))
+        second.ALLOWED_IMPORTS = frozenset({"json"})
+        cached, error = second.compile_checked(code)
+
+        assert cached is None
+        assert "math" in error
+
+    def test_worker_is_reused_between_tests(self, isolated_executor):
+        """Test that consecutive tests share one worker process."""
+        isolated_executor.test_code_safely(FUNCTION_CODE, {"text": "a"})
+        worker = isolated_executor._worker
+        isolated_executor.test_code_safely(FUNCTION_CODE, {"text": "b"})
+
+        assert worker is not None
+        assert isolated_executor._worker is worker
+
+    def test_direct_writes_to_stdout_do_not_corrupt_responses(self, isolated_executor):
+        """Test that skill code writing to fd 1 leaves the worker usable."""
+        success, output = isolated_executor.test_code_safely(
+            "import os\ndef execute():\n    os.write(1, b'not json\\n')\n    log('ok')"
+        )
+
+        assert success is True
+        assert "LOG: ok" in output
+        success, output = isolated_executor.test_code_safely(
+            FUNCTION_CODE, {"text": "abc"}
+        )
+        assert success is True
+        assert "LOG: cba" in output
+
+    def test_invalid_worker_response_restarts_worker(self, isolated_executor):
+        """Test that an unreadable response is reported and the worker replaced."""
+        isolated_executor.test_code_safely(FUNCTION_CODE, {"text": "a"})
+        worker = isolated_executor._worker
+        isolated_executor._worker_responses.put("not json\n")
+
+        success, output = isolated_executor.test_code_safely(
+            FUNCTION_CODE, {"text": "b"}
+        )
+
+        assert success is False
+        assert "invalid response" in output
+        assert isolated_executor._worker is None
+        assert worker.poll() is not None
+
+    def test_timeout_restarts_worker(self, isolated_executor):
+        """Test that a hung test is abandoned and the worker replaced."""
+        isolated_executor.timeout_seconds = 1
+        success, output = isolated_executor.test_code_safely(
+            "def execute():\n    while True:\n        pass"
+        )
+
+        assert success is False
+        assert "timed out" in output
+        success, _ = isolated_executor.test_code_safely(FUNCTION_CODE, {"text": "ok"})
+        assert success is True
+
+    def test_falls_back_to_one_shot_interpreter(self, isolated_executor):
+        """Test that tests still run when the worker cannot be started."""
+        with patch.object(isolated_executor, "_ensure_worker", side_effect=OSError):
+            success, output = isolated_executor.test_code_safely(
+                FUNCTION_CODE, {"text": "abc"}
+            )
+
+        assert success is True
+        assert "LOG: cba" in output
@@ -0,0 +1,265 @@
+"""Unit tests for the skill documentation generator."""
+
+import json
+
+import pytest
+
+from src.ollamapy.skillgen_report import (
+    PageTemplate,
+    SkillDocumentationGenerator,
+    _write_parts,
+)
+
+SKILL_DATA = {
+    "name": "reverse_text",
+    "description": "Use when the user wants to reverse a piece of text",
+    "role": "text_processing",
+    "vibe_test_phrases": ["Reverse this", "Flip hello"],
+    "parameters": {
+        "text": {"type": "string", "description": "Text to reverse", "required": True}
+    },
+    "function_code": "def execute(text):\n    log(text[::-1])",
+    "verified": False,
+    "created_at": "2024-01-01T00:00:00",
+    "execution_count": 3,
+    "success_rate": 100.0,
+}
+
+
+@pytest.fixture
+def doc_generator(tmp_path):
+    """Create a generator writing into a temporary directory."""
+    return SkillDocumentationGenerator(output_dir=str(tmp_path))
+
+
+class TestPageTemplate:
+    """Test the placeholder templates pages are rendered from."""
+
+    def test_fields_are_substituted(self):
+        """Test that placeholders are filled and other braces kept verbatim."""
+        template = PageTemplate("a {{ x }} b {{y}} { c }")
+
+        assert template.render(x=1, y="two") == "a 1 b two { c }"
+
+    def test_missing_field_raises(self):
+        """Test that a typo in a field name is not silently rendered empty."""
+        with pytest.raises(KeyError):
+            PageTemplate("{{ x }}").render()
+
+
+class TestWriteParts:
+    """Test writing pages with raw file descriptors."""
+
+    def test_pieces_are_written_as_utf8(self, tmp_path):
+        """Test that pieces flushed in several writes come out whole."""
+        path = tmp_path / "page.html"
+        path.write_text("previous, longer content")
+        parts = ["✏️ edit", "\n", "x" * 10, "🔒"]
+
+        _write_parts(path, parts, buffer_size=8)
+
+        assert path.read_bytes() == "".join(parts).encode("utf-8")
+
+
+class TestLoadAllSkills:
+    """Test reading skill files for documentation."""
+
+    def test_loads_json_files_and_skips_the_rest(self, doc_generator, tmp_path):
+        """Test that only readable .json skill files are loaded."""
+        skills_dir = tmp_path / "skills"
+        skills_dir.mkdir()
+        (skills_dir / "reverse_text.json").write_text(json.dumps(SKILL_DATA))
+        (skills_dir / "broken.json").write_text("{ invalid json")
+        (skills_dir / "notes.txt").write_text("{}")
+        (skills_dir / "nested.json").mkdir()
+        doc_generator.skills_data_dir = skills_dir
+
+        skills = doc_generator.load_all_skills()
+
+        assert skills == {"reverse_text": SKILL_DATA}
+
+
+class TestSkillPage:
+    """Test individual skill pages."""
+
+    def test_page_contains_skill_details(self, doc_generator):
+        """Test that the page shows the skill and keeps CSS/JS braces single."""
+        page = doc_generator.generate_skill_page(SKILL_DATA, is_new=True)
+
+        assert "<title>reverse_text - Skill Documentation</title>" in page
+        assert "badge-new" in page
+        assert '<option value="text_processing" selected>' in page
+        assert "{{" not in page and "}}" not in page
+        assert '<script src="skill_page.js" defer></script>' in page
+        assert "function editSkill" not in page
+
+    def test_verified_page_has_no_editor(self, doc_generator):
+        """Test that pages of skills that cannot be edited skip the edit form."""
+        page = doc_generator.generate_skill_page(dict(SKILL_DATA, verified=True))
+
+        assert "badge-verified" in page
+        assert 'id="edit-panel"' not in page
+        assert "skill_page.js" not in page and "window.__skill" not in page
+
+    def test_text_fields_are_escaped(self, doc_generator):
+        """Test that markup in hand-edited skill files is shown, not rendered."""
+        skill_data = dict(
+            SKILL_DATA,
+            description="Reverse <b>text</b> & more",
+            vibe_test_phrases=["<img src=x>"],
+            function_code="def execute():\n    log('<b>')",
+        )
+
+        page = doc_generator.generate_skill_page(skill_data)
+
+        assert "<p>Reverse &lt;b&gt;text&lt;/b&gt; &amp; more</p>" in page
+        assert page.count("Reverse &lt;b&gt;text&lt;/b&gt; &amp; more") == 3
+        assert "<li>&lt;img src=x&gt;</li>" in page
+        assert 'rows="5">&lt;img src=x&gt;</textarea>' in page
+        assert page.count("log('&lt;b&gt;')") == 2
+
+
+class TestIndexPage:
+    """Test the index page and error report."""
+
+    def test_index_links_every_skill(self, doc_generator):
+        """Test that the index template is filled with cards and run details."""
+        doc_generator.model = "model<1>"
+
+        page = doc_generator.generate_index_page({"reverse_text": SKILL_DATA}, [])
+
+        assert '<a href="reverse_text.html"' in page
+        assert "<p>Models: model&lt;1&gt; (generation)" in page
+        assert "{{" not in page and "}}" not in page
+        assert "cdn.plot.ly" not in page
+
+    def test_plotly_is_loaded_only_with_charts(self, doc_generator):
+        """Test that the index pulls in a pinned Plotly build for its charts."""
+        results = [{"success": True}, {"success": True}, {"success": False}]
+
+        page = doc_generator.generate_index_page({}, [], results)
+
+        assert '<script src="https://cdn.plot.ly/plotly-' in page
+        assert "plotly-latest" not in page
+        assert 'Plotly.newPlot("success-pie"' in page
+        assert '"values": [2, 1]' in page
+
+    def test_cards_are_escaped_and_marked_new(self, doc_generator):
+        """Test that card text and search text are escaped and new skills marked."""
+        skill_data = dict(SKILL_DATA, description="Use <b>" + "x" * 100)
+
+        page = doc_generator.generate_index_page(
+            {"reverse_text": skill_data}, ["reverse_text"]
+        )
+
+        assert '<a href="reverse_text.html" class="skill-card new-skill"' in page
+        assert 'data-search="reverse_text use &lt;b&gt;' in page
+        assert 'x text processing">' in page
+        assert "<p>Use &lt;b&gt;" + "x" * 93 + "...</p>" in page
+
+    def test_error_report_lists_failures(self, doc_generator):
+        """Test that the error report template is filled per failed attempt."""
+        failed = [{"success": False, "errors": ["Bad <plan>"], "step_results": {}}]
+
+        page = doc_generator.generate_error_report(failed)
+
+        assert "<strong>Total Failed Attempts:</strong> 1</p>" in page
+        assert "Plan Creation" in page and "<li>Bad &lt;plan&gt;</li>" in page
+
+
+class TestMarkdownDocumentation:
+    """Test the markdown export."""
+
+    def test_skills_grouped_by_sorted_role_and_name(self, doc_generator):
+        """Test that roles and the skills within each role come out sorted."""
+        doc_generator.load_all_skills = lambda: {
+            "zip": dict(SKILL_DATA, name="zip", role="mathematics"),
+            "add": dict(SKILL_DATA, name="add", role="mathematics"),
+            "flip": dict(SKILL_DATA, name="flip"),
+        }
+
+        markdown = doc_generator.generate_markdown_documentation()
+
+        headings = [
+            line for line in markdown.splitlines() if line.startswith(("## ", "### "))
+        ]
+        assert headings == [
+            "## Mathematics",
+            "### add",
+            "### zip",
+            "## Text Processing",
+            "### flip",
+        ]
+
+
+class TestGenerateDocumentation:
+    """Test writing the whole documentation directory."""
+
+    def test_pages_link_one_shared_stylesheet(self, doc_generator, tmp_path):
+        """Test that styles are written once and linked, not inlined per page."""
+        doc_generator.load_all_skills = lambda: {"reverse_text": SKILL_DATA}
+
+        doc_generator.generate_documentation()
+
+        styles = (tmp_path / "styles.css").read_text(encoding="utf-8")
+        assert ".skill-header" in styles and ".skill-card" in styles
+        script = (tmp_path / "skill_page.js").read_text(encoding="utf-8")
+        assert "window.__skills[window.__skillName]" in script
+        for page in ("index.html", "reverse_text.html"):
+            html = (tmp_path / page).read_text(encoding="utf-8")
+            assert '<link rel="stylesheet" href="styles.css">' in html
+            assert ".skill-header {" not in html
+
+    def test_editable_skill_data_is_shared_and_script_safe(
+        self, doc_generator, tmp_path
+    ):
+        """Test that skills.js holds editable skills and cannot close a script."""
+        code = "log('</script><b>x</b>')"
+        doc_generator.load_all_skills = lambda: {
+            "reverse_text": dict(SKILL_DATA, function_code=code),
+            "fear": dict(SKILL_DATA, name="fear", verified=True),
+        }
+
+        doc_generator.generate_documentation()
+
+        script = (tmp_path / "skills.js").read_text(encoding="utf-8")
+        json_text = script[len("window.__skills = ") : script.rindex(";")]
+        assert "</script>" not in json_text
+        skills = json.loads(json_text)
+        assert list(skills) == ["reverse_text"]
+        assert skills["reverse_text"]["function_code"] == code
+        page = (tmp_path / "reverse_text.html").read_text(encoding="utf-8")
+        assert 'window.__skillName = "reverse_text";' in page
+        assert '<script src="skills.js" defer></script>' in page
+
+    def test_rendered_pages_match_single_pages(self, doc_generator):
+        """Test that lazily rendered pages match pages rendered one by one."""
+        skills = {f"skill_{i}": dict(SKILL_DATA, name=f"skill_{i}") for i in range(3)}
+
+        pages = {
+            name: "".join(parts)
+            for name, parts in doc_generator.render_skill_pages(skills, ["skill_1"])
+        }
+
+        assert pages == {
+            name: doc_generator.generate_skill_page(data, is_new=name == "skill_1")
+            for name, data in skills.items()
+        }
+        assert "badge-new" in pages["skill_1"]
+        assert "badge-new" not in pages["skill_0"]
+
+    def test_unchanged_pages_are_not_rewritten(self, doc_generator, tmp_path):
+        """Test that a rerun only rewrites pages whose skill data changed."""
+        skills = {"reverse_text": SKILL_DATA, "other": dict(SKILL_DATA, name="other")}
+        doc_generator.load_all_skills = lambda: skills
+        doc_generator.generate_documentation()
+        for name in skills:
+            (tmp_path / f"{name}.html").write_text("stale", encoding="utf-8")
+
+        skills["other"] = dict(SKILL_DATA, name="other", description="Changed")
+        doc_generator.generate_documentation()
+
+        assert (tmp_path / "reverse_text.html").read_text(encoding="utf-8") == "stale"
+        assert "Changed" in (tmp_path / "other.html").read_text(encoding="utf-8")
+        manifest = json.loads((tmp_path / ".manifest.json").read_text())
+        assert set(manifest) == {"reverse_text", "other"}
@@ -2,6 +2,7 @@
 
 import pytest
 import json
+import os
 import tempfile
 from pathlib import Path
 from unittest.mock import Mock, patch
@@ -105,6 +106,100 @@ def execute():
             assert "custom_test" in registry.skills
             assert "custom_test" in registry.compiled_functions
 
+    def test_register_precompiled_skill(self):
+        """Test that a code object compiled during validation is used as-is."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            registry = SkillRegistry(skills_directory=tmpdir)
+
+            function_code = 'def execute():\n    log("[Precompiled] Hello")'
+            skill = Skill(
+                name="precompiled_test",
+                description="A precompiled test skill",
+                vibe_test_phrases=["test precompiled"],
+                parameters={},
+                function_code=function_code,
+            )
+            code = compile(function_code, "<skill>", "exec")
+
+            assert registry.register_skill(skill, precompiled=code) is True
+            func = registry.compiled_functions["precompiled_test"]
+            assert func.__code__.co_filename == "<skill>"
+
+            registry.clear_logs()
+            registry.execute_skill("precompiled_test")
+            assert registry.get_logs() == ["[Precompiled] Hello"]
+
+    def test_compiled_code_is_cached(self):
+        """Test that the same skill code is compiled once and named after the skill."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            registry = SkillRegistry(skills_directory=tmpdir)
+
+            skill = Skill(
+                name="cached_test",
+                description="A cached test skill",
+                vibe_test_phrases=["test cached"],
+                parameters={},
+                function_code='def execute():\n    log("[Cached] Hello")',
+            )
+
+            assert registry.register_skill(skill) is True
+            func = registry.compiled_functions["cached_test"]
+            assert func.__code__.co_filename == "<skill:cached_test>"
+
+            with patch("builtins.compile") as mock_compile:
+                assert registry.register_skill(skill) is True
+                mock_compile.assert_not_called()
+
+    def test_compiled_code_is_reused_after_restart(self):
+        """Test that a new process loads compiled skill code from disk."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            # An empty memory cache stands in for a fresh process
+            with patch.dict(SkillRegistry._code_cache, clear=True):
+                SkillRegistry(skills_directory=tmpdir)
+            cache_dir = Path(tmpdir) / SkillRegistry.CODE_CACHE_DIRNAME
+            assert list(cache_dir.glob("*.mcode"))
+
+            with patch.dict(SkillRegistry._code_cache, clear=True):
+                with patch("builtins.compile") as mock_compile:
+                    registry = SkillRegistry(skills_directory=tmpdir)
+                    mock_compile.assert_not_called()
+
+            registry.clear_logs()
+            registry.execute_skill("fear")
+            assert any("fear" in log.lower() for log in registry.get_logs())
+
+    def test_loaded_skills_are_built_on_first_use(self):
+        """Test that skills loaded from disk only run their code when used."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            SkillRegistry(skills_directory=tmpdir)
+            registry = SkillRegistry(skills_directory=tmpdir)
+
+            assert "fear" in registry.skills
+            assert "fear" not in registry.compiled_functions
+
+            registry.clear_logs()
+            registry.execute_skill("fear")
+            assert "fear" in registry.compiled_functions
+            assert any("fear" in log.lower() for log in registry.get_logs())
+            assert registry.compiled_functions.get("missing") is None
+
+    def test_action_listings_do_not_build_functions(self):
+        """Test that listing skills as actions leaves building to the first call."""
+        from src.ollamapy.skills import get_available_actions
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            SkillRegistry(skills_directory=tmpdir)
+            registry = SkillRegistry(skills_directory=tmpdir)
+
+            with patch("src.ollamapy.skills.SKILL_REGISTRY", registry):
+                actions = get_available_actions()
+                assert len(registry.compiled_functions) == 0
+
+                registry.clear_logs()
+                actions["fear"]["function"]()
+                assert list(registry.compiled_functions) == ["fear"]
+                assert any("fear" in log.lower() for log in registry.get_logs())
+
     def test_execute_skill(self):
         """Test skill execution."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -188,6 +283,45 @@ def execute():
                 == "A persistent test skill"
             )
 
+    def test_skills_are_loaded_from_index(self):
+        """Test that a restart reads the skill index instead of each skill file."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            SkillRegistry(skills_directory=tmpdir)
+            # A file named differently from its skill is indexed by file name
+            skill_data = json.loads((Path(tmpdir) / "fear.json").read_text())
+            skill_data["name"] = "fear_alias"
+            (Path(tmpdir) / "alias.json").write_text(json.dumps(skill_data))
+            registry1 = SkillRegistry(skills_directory=tmpdir)
+            index_path = Path(tmpdir) / SkillRegistry.INDEX_FILENAME
+            assert len(index_path.read_text().splitlines()) == len(registry1.skills)
+
+            with patch("src.ollamapy.skills.json.load") as mock_load, patch.object(
+                SkillRegistry, "_write_index"
+            ) as mock_write:
+                registry2 = SkillRegistry(skills_directory=tmpdir)
+                mock_load.assert_not_called()
+                mock_write.assert_not_called()
+            assert set(registry2.skills) == set(registry1.skills)
+
+    def test_stale_index_entries_are_ignored(self):
+        """Test that skill files changed or deleted after indexing are honoured."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            SkillRegistry(skills_directory=tmpdir)
+            SkillRegistry(skills_directory=tmpdir)
+            skill_file = Path(tmpdir) / "fear.json"
+            mtime_ns = skill_file.stat().st_mtime_ns
+            skill_data = json.loads(skill_file.read_text())
+            skill_data["description"] = "Edited by hand"
+            skill_file.write_text(json.dumps(skill_data))
+            # As if the filesystem's timestamps were too coarse to show the edit
+            os.utime(skill_file, ns=(mtime_ns, mtime_ns))
+            (Path(tmpdir) / "getTime.json").unlink()
+
+            registry = SkillRegistry(skills_directory=tmpdir)
+
+            assert registry.skills["fear"].description == "Edited by hand"
+            assert "getTime" not in registry.skills
+
     @patch("builtins.print")
     def test_skill_loading_error_handling(self, mock_print):
         """Test handling of corrupted skill files."""